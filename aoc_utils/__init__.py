@@ -1 +1,7 @@
-from .utils import timing
\ No newline at end of file
+from .utils import timing
+from .timers import TimerRegistry, registry
+from .cache import cached_parser
+from .progress import progress_bar, track
+from .lazy import lazy_import
+from .memo import memoize
+from .counters import count, gauge
@@ -0,0 +1,97 @@
+"""
+On-disk store of the answers computed by the runner.
+
+An answer is keyed by the sha256 of the day module source, of the aoc_utils
+sources the solvers delegate to, of the input and the part, so editing a solver,
+an engine such as shortest_path or the input computes it again. Each
+entry records when the answer was computed and how long it took. Only plain
+answers (ints, floats, strings) are stored.
+
+Set AOC_ANSWER_CACHE=0 to compute every answer again, they are still stored.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from .cache import cache_directory, input_digest
+
+ENABLED_VARIABLE = "AOC_ANSWER_CACHE"
+# Bump whenever answers may be stale for a reason the key does not cover
+STORE_VERSION = 2
+PACKAGE_DIRECTORY = Path(__file__).resolve().parent
+
+
+@dataclass(frozen=True)
+class StoredAnswer:
+    day: str
+    part: int
+    answer: Any
+    elapsed: float
+    computed_at: str
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENABLED_VARIABLE, "1") != "0"
+
+
+def set_enabled(enabled: bool) -> None:
+    # Through the environment, so that worker processes inherit it
+    os.environ[ENABLED_VARIABLE] = "1" if enabled else "0"
+
+
+def answers_directory() -> Path:
+    return cache_directory() / "answers"
+
+
+def package_digest() -> str:
+    """
+    sha256 of the aoc_utils sources, each file only hashed again once it changes.
+    """
+    digest = hashlib.sha256()
+    for source_path in sorted(PACKAGE_DIRECTORY.glob("*.py")):
+        digest.update(f"{source_path.name}:{input_digest(source_path)}\n".encode())
+    return digest.hexdigest()
+
+
+def answer_key(module_path: Path, input_path: Path, part: int) -> str:
+    identity = (
+        f"{STORE_VERSION}:{input_digest(module_path)}:{package_digest()}:"
+        f"{input_digest(input_path)}:{part}"
+    )
+    return hashlib.sha256(identity.encode()).hexdigest()
+
+
+def load(key: str) -> Optional[StoredAnswer]:
+    try:
+        with open(answers_directory() / f"{key}.json", "r") as fin:
+            return StoredAnswer(**json.load(fin))
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, TypeError):
+        # Truncated or outdated entry, compute the answer again
+        return None
+
+
+def store(key: str, day: str, part: int, answer: Any, elapsed: float) -> None:
+    if isinstance(answer, bool) or not isinstance(answer, (int, float, str)):
+        return
+    entry = StoredAnswer(
+        day, part, answer, elapsed, datetime.now().isoformat(timespec="seconds")
+    )
+    answers_directory().mkdir(parents=True, exist_ok=True)
+    entry_path = answers_directory() / f"{key}.json"
+    temporary_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temporary_path, "w") as fout:
+        json.dump(asdict(entry), fout, indent=2)
+    os.replace(temporary_path, entry_path)
+
+
+def clear() -> None:
+    for entry_path in answers_directory().glob("*.json"):
+        entry_path.unlink()
@@ -0,0 +1,193 @@
+"""
+Run the parts of one day over many inputs and tabulate answers and timings.
+
+Inputs are files, directories, whose files are all taken, or glob patterns:
+
+    python -m aoc_utils.batch 17 inputs/day17/ --workers 4
+    python -m aoc_utils.batch 5 "inputs/*/day5.txt" --part 2
+
+Answers are always computed, stored answers would say nothing about throughput.
+An input the solver fails on is reported in the table and does not stop the batch.
+"""
+
+from __future__ import annotations
+import argparse
+import contextlib
+import glob
+import os
+import statistics
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from . import cache, progress
+from .runner import (
+    PARTS,
+    REPO_ROOT,
+    Day,
+    discover_days,
+    futures,
+    get_solver,
+    resolve_day,
+    run_part,
+)
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    input_path: Path
+    part: int
+    answer: Any = None
+    elapsed: float = 0.0
+    parse_elapsed: float = 0.0
+    # The exception raised by the solver, formatted
+    error: Optional[str] = None
+
+
+def expand_inputs(specs: Iterable[str]) -> list[Path]:
+    """
+    Files of each directory and matches of each glob pattern, sorted, without repeats.
+    """
+    paths = []
+    for spec in specs:
+        path = Path(spec)
+        if path.is_dir():
+            matches = [
+                child
+                for child in path.iterdir()
+                if child.is_file() and not child.name.startswith(".")
+            ]
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = [Path(match) for match in glob.glob(spec, recursive=True)]
+            matches = [match for match in matches if match.is_file()]
+            if not matches:
+                raise ValueError(f"No input matches {spec}")
+        paths.extend(sorted(matches))
+    return list(dict.fromkeys(paths))
+
+
+def _solve(day: Day, part: int, input_path: Path) -> BatchResult:
+    try:
+        # Solvers print their own progress, it would be interleaved with the table
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            result = run_part(day, part, input_path)
+    except Exception as error:
+        return BatchResult(input_path, part, error=f"{type(error).__name__}: {error}")
+    return BatchResult(
+        input_path, part, result.answer, result.elapsed, result.parse_elapsed
+    )
+
+
+def run_batch(
+    day: Day,
+    input_paths: Sequence[Path],
+    parts: Sequence[int] = tuple(PARTS),
+    workers: int = 1,
+) -> Iterator[BatchResult]:
+    """
+    Results in the order of input_paths, then parts. With more than one worker,
+    every input and part is solved in a pool of processes.
+    """
+    parts = [part for part in parts if get_solver(day, part) is not None]
+    jobs = [(day, part, input_path) for input_path in input_paths for part in parts]
+    if workers <= 1 or not jobs:
+        for job in jobs:
+            yield _solve(*job)
+        return
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(_solve, *zip(*jobs)):
+            yield result
+
+
+def format_table(results: Sequence[BatchResult], wall_time: float) -> str:
+    names = [str(result.input_path) for result in results]
+    width = max([len("input"), *map(len, names)]) + 2
+    answers = [
+        result.error if result.error is not None else repr(result.answer)
+        for result in results
+    ]
+    answer_width = max([len("answer"), *map(len, answers)]) + 2
+    header = (
+        f"{'input':<{width}}{'part':>5}  {'answer':<{answer_width}}"
+        f"{'parse':>9}{'total':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, answer, result in zip(names, answers, results):
+        lines.append(
+            f"{name:<{width}}{result.part:>5}  {answer:<{answer_width}}"
+            f"{result.parse_elapsed:>9.4f}{result.elapsed:>9.4f}"
+        )
+    lines.append("-" * len(header))
+    for part in sorted({result.part for result in results}):
+        times = [
+            result.elapsed
+            for result in results
+            if result.part == part and result.error is None
+        ]
+        failed = sum(
+            1 for result in results if result.part == part and result.error is not None
+        )
+        line = f"part {part}: {len(times)} solved"
+        if failed:
+            line += f", {failed} failed"
+        if times:
+            line += (
+                f", median {statistics.median(times):.4f} seconds, "
+                f"max {max(times):.4f} seconds"
+            )
+        lines.append(line)
+    lines.append(f"{len(results)} runs in {wall_time:.4f} seconds of wall time")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("day", help="Day to run, e.g. 5 or 19_2021")
+    parser.add_argument(
+        "inputs", nargs="+", help="Input files, directories or glob patterns"
+    )
+    parser.add_argument(
+        "--part",
+        type=int,
+        choices=sorted(PARTS),
+        action="append",
+        dest="parts",
+        help="Part to run, can be repeated. Default: all parts.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes solving inputs concurrently. Default: 1",
+    )
+    parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Parse inputs again instead of loading them from the parse cache",
+    )
+    parser.add_argument("--root", type=Path, default=REPO_ROOT, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.no_parse_cache:
+        cache.set_enabled(False)
+    # Bars of concurrent runs would overwrite each other
+    progress.set_enabled(False)
+    day = resolve_day(args.day, discover_days(args.root))
+    input_paths = expand_inputs(args.inputs)
+    start = perf_counter()
+    results = list(
+        run_batch(day, input_paths, args.parts or tuple(PARTS), args.workers)
+    )
+    print(format_table(results, perf_counter() - start))
+    return 1 if any(result.error is not None for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
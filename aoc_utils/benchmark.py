@@ -0,0 +1,230 @@
+"""
+Benchmark the parts of one or more days with warmup runs and repeats.
+
+Each input is identified by its sha256, results saved with --save can then be
+compared across commits. With --pin, the digests are stored in a manifest on the
+first run and later runs refuse to benchmark an input that changed.
+
+    python -m aoc_utils.benchmark 17 23 22_2021 --repeats 10 --save bench.json
+"""
+
+from __future__ import annotations
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional, Sequence
+
+from . import progress
+from .runner import (
+    PARTS,
+    REPO_ROOT,
+    Day,
+    add_selection_arguments,
+    configure,
+    get_solver,
+    run_part,
+    select_days,
+)
+from .utils import file_digest
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """
+    Linear interpolation between the closest ranks, q in [0, 100].
+    """
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass
+class BenchmarkResult:
+    day: str
+    part: int
+    input_sha256: str
+    answer: Any = None
+    samples: list[float] = field(default_factory=list)
+    parse_samples: list[float] = field(default_factory=list)
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+    @property
+    def parse_median(self) -> float:
+        return statistics.median(self.parse_samples)
+
+    @property
+    def solve_median(self) -> float:
+        return statistics.median(
+            total - parse for total, parse in zip(self.samples, self.parse_samples)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "day": self.day,
+            "part": self.part,
+            "input_sha256": self.input_sha256,
+            "answer": repr(self.answer),
+            "repeats": len(self.samples),
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "parse_median": self.parse_median,
+            "solve_median": self.solve_median,
+            "samples": self.samples,
+            "parse_samples": self.parse_samples,
+        }
+
+
+def benchmark_part(
+    day: Day,
+    part: int,
+    warmup: int = 1,
+    repeats: int = 5,
+    input_path: Optional[Path] = None,
+) -> BenchmarkResult:
+    input_path = input_path or day.input_path
+    result = BenchmarkResult(day.name, part, file_digest(input_path))
+    # Solvers print their own progress, which is not what we want to measure
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(warmup + repeats):
+            gc.collect()
+            part_result = run_part(day, part, input_path)
+            if i < warmup:
+                continue
+            result.answer = part_result.answer
+            result.samples.append(part_result.elapsed)
+            result.parse_samples.append(part_result.parse_elapsed)
+    return result
+
+
+def benchmark(
+    days: Sequence[Day],
+    parts: Sequence[int] = tuple(PARTS),
+    warmup: int = 1,
+    repeats: int = 5,
+    input_path: Optional[Path] = None,
+) -> Iterator[BenchmarkResult]:
+    for day in days:
+        for part in parts:
+            if get_solver(day, part) is not None:
+                yield benchmark_part(day, part, warmup, repeats, input_path)
+
+
+def check_pinned_inputs(
+    manifest_path: Path, days: Sequence[Day], input_path: Optional[Path] = None
+) -> None:
+    """
+    Store the digest of each input the first time a day is seen, fail if it changed since.
+    """
+    manifest = {}
+    if manifest_path.exists():
+        with open(manifest_path, "r") as fin:
+            manifest = json.load(fin)
+    for day in days:
+        digest = file_digest(input_path or day.input_path)
+        if manifest.setdefault(day.name, digest) != digest:
+            raise ValueError(
+                f"Input of {day.name} does not match the digest pinned in {manifest_path}"
+            )
+    with open(manifest_path, "w") as fout:
+        json.dump(manifest, fout, indent=2, sort_keys=True)
+
+
+def environment() -> dict[str, Optional[str]]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+
+
+def format_table(results: Sequence[BenchmarkResult]) -> str:
+    columns = ["min", "median", "p95", "parse", "solve"]
+    header = f"{'day':<12}{'part':>5}" + "".join(f"{column:>11}" for column in columns)
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.day:<12}{result.part:>5}"
+            f"{result.min:>11.4f}{result.median:>11.4f}{result.p95:>11.4f}"
+            f"{result.parse_median:>11.4f}{result.solve_median:>11.4f}"
+        )
+    return "\n".join(lines)
+
+
+def save_results(path: Path, results: Sequence[BenchmarkResult]) -> None:
+    with open(path, "w") as fout:
+        json.dump(
+            {
+                "environment": environment(),
+                "results": [result.to_dict() for result in results],
+            },
+            fout,
+            indent=2,
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_selection_arguments(parser)
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per part")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per part")
+    parser.add_argument(
+        "--save", type=Path, default=None, help="Write the results as JSON"
+    )
+    parser.add_argument(
+        "--pin", type=Path, default=None, help="Manifest of pinned input digests"
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.repeats < 1:
+        raise ValueError("At least one repeat is needed")
+    configure(args)
+    progress.set_enabled(False)
+    days = select_days(args.days, args.root)
+    if args.pin:
+        check_pinned_inputs(args.pin, days, args.input)
+    results = []
+    for result in benchmark(
+        days, args.parts or tuple(PARTS), args.warmup, args.repeats, args.input
+    ):
+        print(f"{result.day} part {result.part}: median {result.median:2.4f} seconds")
+        results.append(result)
+    print(format_table(results))
+    if args.save:
+        save_results(args.save, results)
+
+
+if __name__ == "__main__":
+    main()
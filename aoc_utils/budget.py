@@ -0,0 +1,200 @@
+"""
+Wall-clock and memory budgets for functions run in a child process.
+
+The child is watched from the parent: past its time budget, or once its resident
+memory goes over its memory budget, it is sent SIGTERM. The signal unwinds the
+child with the span it was in and the status of its open progress bars, which it
+then reports and exits; if it does not within GRACE_PERIOD, it is killed. Memory budgets read the resident set
+size from /proc, so they are only available on Linux.
+"""
+
+from __future__ import annotations
+import os
+import signal
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+from . import progress
+from .lazy import lazy_import
+from .timers import registry
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+multiprocessing = lazy_import("multiprocessing")
+
+POLL_INTERVAL = 0.05
+GRACE_PERIOD = 1.0
+
+
+@dataclass(frozen=True)
+class Budget:
+    seconds: Optional[float] = None
+    memory: Optional[int] = None
+
+    def __post_init__(self):
+        if self.seconds is not None and self.seconds <= 0:
+            raise ValueError("A time budget must be positive")
+        if self.memory is not None and self.memory <= 0:
+            raise ValueError("A memory budget must be positive")
+        if self.memory is not None and not Path("/proc/self/statm").exists():
+            raise ValueError("Memory budgets need /proc to read the resident memory")
+
+
+@dataclass
+class Outcome:
+    elapsed: float
+    value: Any = None
+    # "time" or "memory" when the budget was exceeded
+    exceeded: Optional[str] = None
+    # Where the child was when it was stopped
+    span: Optional[str] = None
+    progress: dict[str, str] = field(default_factory=dict)
+
+
+def resident_memory(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/statm", "r") as fin:
+            return int(fin.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (FileNotFoundError, ProcessLookupError):
+        return 0
+
+
+class _Stopped(BaseException):
+    """
+    Raised in the child by SIGTERM. A BaseException, so that solvers catching
+    Exception do not swallow it.
+    """
+
+    def __init__(self, span: str, progress: dict[str, str]):
+        super().__init__(span)
+        self.span = span
+        self.progress = progress
+
+
+def _run_child(function: Callable, args: tuple, connection: Connection) -> None:
+    def stop(signum, frame):
+        # Only reads state: the pipe is written from _run_child once the
+        # exception unwinds, never from inside the handler
+        raise _Stopped(".".join(registry.current_path()), progress.snapshot())
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        try:
+            value = function(*args)
+        finally:
+            # The answer must not be cut in half by a late SIGTERM
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    except _Stopped as stopped:
+        connection.send(("stopped", (stopped.span, stopped.progress)))
+    except BaseException:
+        connection.send(("error", traceback.format_exc()))
+    else:
+        connection.send(("done", value))
+
+
+class BudgetedRun:
+    """
+    function(*args) in a child process, stopped once it exceeds the budget.
+    function, args and the returned value must be picklable.
+
+    start and check are meant to be called from the same thread, the one
+    watching every run: the child is forked, and forking while other threads
+    run can copy locks they hold into the child.
+    """
+
+    def __init__(self, function: Callable, args: tuple, budget: Budget):
+        self.budget = budget
+        self.receiver, self._sender = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(
+            target=_run_child, args=(function, args, self._sender), daemon=True
+        )
+        self.start_time: Optional[float] = None
+
+    def start(self) -> None:
+        self.start_time = perf_counter()
+        self.process.start()
+        self._sender.close()
+
+    def check(self) -> Optional[Outcome]:
+        """
+        The outcome once the child answered or exceeded its budget, else None.
+        Only blocks to give a stopped child GRACE_PERIOD to report.
+        An exception raised by function is raised again as a RuntimeError.
+        """
+        if self.receiver.poll():
+            try:
+                status, value = self.receiver.recv()
+            except EOFError:
+                self.process.join()
+                raise RuntimeError(
+                    f"Budgeted run exited with code {self.process.exitcode} "
+                    "before answering"
+                )
+            if status == "error":
+                raise RuntimeError(f"Budgeted run failed:\n{value}")
+            return Outcome(perf_counter() - self.start_time, value)
+        elapsed = perf_counter() - self.start_time
+        budget = self.budget
+        if budget.seconds is not None and elapsed > budget.seconds:
+            return self._stop(elapsed, "time")
+        if (
+            budget.memory is not None
+            and resident_memory(self.process.pid) > budget.memory
+        ):
+            return self._stop(elapsed, "memory")
+        return None
+
+    def _stop(self, elapsed: float, exceeded: str) -> Outcome:
+        self.process.terminate()
+        outcome = Outcome(elapsed, exceeded=exceeded)
+        try:
+            if self.receiver.poll(GRACE_PERIOD):
+                status, value = self.receiver.recv()
+                if status == "done":
+                    # Finished right before being stopped
+                    return Outcome(elapsed, value)
+                if status == "stopped":
+                    outcome.span, outcome.progress = value
+        except EOFError:
+            # Killed or exited without reporting where it was
+            pass
+        return outcome
+
+    def close(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        if self.start_time is not None:
+            self.process.join()
+        self.receiver.close()
+        self._sender.close()
+
+
+def wait(runs: Sequence[BudgetedRun], timeout: float = POLL_INTERVAL) -> None:
+    """
+    Block until one of the runs has something to report or timeout seconds
+    passed, budgets are checked at least that often.
+    """
+    # Already imported by the pipes of the runs
+    from multiprocessing.connection import wait as wait_for_connections
+
+    wait_for_connections([run.receiver for run in runs], timeout)
+
+
+def run_with_budget(function: Callable, args: tuple, budget: Budget) -> Outcome:
+    """
+    Run function(*args) in a child process, stopping it once it exceeds the budget.
+    function, args and the returned value must be picklable.
+    An exception raised by function is raised again as a RuntimeError.
+    """
+    run = BudgetedRun(function, args, budget)
+    try:
+        run.start()
+        while (outcome := run.check()) is None:
+            wait([run])
+        return outcome
+    finally:
+        run.close()
@@ -0,0 +1,109 @@
+"""
+On-disk cache of parsed inputs.
+
+A parser decorated with cached_parser pickles what it returns under a key made of
+the sha256 of the input, the qualified name of the parser, its version and its
+extra arguments. Bump the version whenever the parsed structure changes.
+Every hit unpickles a fresh object, so parts are free to mutate what they get.
+
+Set AOC_PARSE_CACHE=0 to disable the cache, AOC_CACHE_DIR to move it.
+"""
+
+from __future__ import annotations
+import functools
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from .utils import file_digest
+
+ENABLED_VARIABLE = "AOC_PARSE_CACHE"
+DIRECTORY_VARIABLE = "AOC_CACHE_DIR"
+DEFAULT_DIRECTORY = Path(__file__).resolve().parent.parent / ".aoc_cache"
+
+Parser = TypeVar("Parser", bound=Callable[..., Any])
+
+_digests: dict[tuple[str, int, int], str] = {}
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENABLED_VARIABLE, "1") != "0"
+
+
+def set_enabled(enabled: bool) -> None:
+    # Through the environment, so that worker processes inherit it
+    os.environ[ENABLED_VARIABLE] = "1" if enabled else "0"
+
+
+def cache_directory() -> Path:
+    return Path(os.environ.get(DIRECTORY_VARIABLE, DEFAULT_DIRECTORY))
+
+
+def input_digest(path: Path) -> str:
+    """
+    sha256 of the file, only recomputed when its size or modification time change.
+    """
+    stat = os.stat(path)
+    key = (str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns)
+    if key not in _digests:
+        _digests[key] = file_digest(path)
+    return _digests[key]
+
+
+def cache_key(
+    parser: Callable, version: int, path: Path, args: tuple, kwargs: dict
+) -> str:
+    identity = (
+        f"{parser.__module__}.{parser.__qualname__}:{version}:"
+        f"{args!r}:{sorted(kwargs.items())!r}"
+    )
+    return f"{input_digest(path)}-{hashlib.sha256(identity.encode()).hexdigest()[:16]}"
+
+
+def _load(cache_path: Path) -> tuple[bool, Any]:
+    try:
+        with open(cache_path, "rb") as fin:
+            return True, pickle.load(fin)
+    except FileNotFoundError:
+        return False, None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # Stale or truncated entry, parse again and overwrite it
+        return False, None
+
+
+def _store(cache_path: Path, parsed: Any) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(temporary_path, "wb") as fout:
+            pickle.dump(parsed, fout, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Not everything a parser returns can be pickled, it is then just not cached
+        temporary_path.unlink(missing_ok=True)
+
+
+def cached_parser(version: int = 1) -> Callable[[Parser], Parser]:
+    def decorator(parser: Parser) -> Parser:
+        @functools.wraps(parser)
+        def wrapper(path: Path, *args, **kwargs):
+            if not is_enabled():
+                return parser(path, *args, **kwargs)
+            key = cache_key(parser, version, path, args, kwargs)
+            cache_path = cache_directory() / "parsed" / f"{key}.pickle"
+            found, parsed = _load(cache_path)
+            if not found:
+                parsed = parser(path, *args, **kwargs)
+                _store(cache_path, parsed)
+            return parsed
+
+        return wrapper
+
+    return decorator
+
+
+def clear() -> None:
+    for cache_path in (cache_directory() / "parsed").glob("*.pickle"):
+        cache_path.unlink()
@@ -0,0 +1,267 @@
+"""
+Measure how the time and memory of a part grow with the size of its input.
+
+The part runs on a geometric series of sizes, on inputs from the generators or
+on the first lines of a real input with --truncate, and a power law is fitted
+to the measurements: time ~ size**k by least squares on log-log scale. k close
+to 2 answers "is it quadratic?" for the sizes measured; r2 tells how well a
+single power law describes them, constant overheads bend small sizes down.
+
+    python -m aoc_utils.complexity 22 --part 1 --start 250 --steps 5
+    python -m aoc_utils.complexity 7_2021 --truncate input.txt --part 2
+
+Every day can be analyzed with --truncate; without it, the days listed in
+generators.UNSUPPORTED cannot be, as there is no input to generate.
+
+Time is the best of --repeats runs. Peak memory is traced with tracemalloc in a
+separate run, tracing slows allocations down too much to time the same run.
+"""
+
+from __future__ import annotations
+import argparse
+import contextlib
+import gc
+import math
+import os
+import statistics
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence
+
+from . import cache, progress
+from .generators import GENERATORS, UNSUPPORTED, generate
+from .runner import (
+    PARTS,
+    REPO_ROOT,
+    Day,
+    discover_days,
+    get_solver,
+    resolve_day,
+    run_part,
+)
+
+DEFAULT_START = 100
+DEFAULT_FACTOR = 2.0
+DEFAULT_STEPS = 5
+
+
+@dataclass
+class Measurement:
+    size: int
+    elapsed: float
+    peak_memory: Optional[int] = None
+
+
+@dataclass
+class PowerLaw:
+    exponent: float
+    coefficient: float
+    r2: float
+
+    def __str__(self) -> str:
+        return f"size**{self.exponent:.2f} (r2 {self.r2:.3f})"
+
+
+@dataclass
+class Scaling:
+    day: str
+    part: int
+    measurements: list[Measurement] = field(default_factory=list)
+
+    @property
+    def time(self) -> Optional[PowerLaw]:
+        return fit_power_law(
+            [(m.size, m.elapsed) for m in self.measurements if m.elapsed > 0]
+        )
+
+    @property
+    def memory(self) -> Optional[PowerLaw]:
+        return fit_power_law(
+            [(m.size, m.peak_memory) for m in self.measurements if m.peak_memory]
+        )
+
+    def format(self) -> str:
+        lines = [
+            f"{self.day} part {self.part}",
+            f"{'size':>10}{'seconds':>12}{'MiB':>10}",
+        ]
+        for m in self.measurements:
+            memory = "" if m.peak_memory is None else f"{m.peak_memory / 2**20:.2f}"
+            lines.append(f"{m.size:>10}{m.elapsed:>12.4f}{memory:>10}")
+        for name, law in (("time", self.time), ("memory", self.memory)):
+            lines.append(f"{name} ~ {law if law is not None else 'not enough points'}")
+        return "\n".join(lines)
+
+
+def fit_power_law(points: Sequence[tuple[float, float]]) -> Optional[PowerLaw]:
+    """
+    Least squares fit of log(y) = k * log(x) + log(c), needs two distinct sizes.
+    """
+    if len({x for x, _ in points}) < 2:
+        return None
+    xs = [math.log(x) for x, _ in points]
+    ys = [math.log(y) for _, y in points]
+    slope, intercept = statistics.linear_regression(xs, ys)
+    mean = statistics.fmean(ys)
+    total = sum((y - mean) ** 2 for y in ys)
+    residual = sum((y - (slope * x + intercept)) ** 2 for x, y in zip(xs, ys))
+    r2 = 1 - residual / total if total > 0 else 1.0
+    return PowerLaw(slope, math.exp(intercept), r2)
+
+
+def geometric_sizes(start: int, factor: float, steps: int) -> list[int]:
+    if start < 1 or factor <= 1 or steps < 1:
+        raise ValueError("Sizes need start >= 1, factor > 1 and steps >= 1")
+    return sorted({round(start * factor**i) for i in range(steps)})
+
+
+def truncated_input(path: Path, size: int) -> str:
+    """
+    The first size lines of an input.
+    """
+    with open(path, "r") as fin:
+        lines = fin.read().splitlines()
+    if size > len(lines):
+        raise ValueError(f"{path} has {len(lines)} lines, fewer than {size}")
+    return "\n".join(lines[:size]) + "\n"
+
+
+def check_generated(day: Day) -> None:
+    """
+    Fail early, naming the days that cannot be analyzed on generated inputs.
+    """
+    if day.name in GENERATORS:
+        return
+    reason = UNSUPPORTED.get(day.name, "no generator is registered for it")
+    unsupported = ", ".join(sorted(UNSUPPORTED.keys() | {day.name}))
+    raise ValueError(
+        f"{day.name} cannot be analyzed on generated inputs: {reason}. "
+        f"Days that cannot be analyzed this way: {unsupported}"
+    )
+
+
+def measure(
+    day: Day, part: int, input_path: Path, repeats: int = 1, memory: bool = True
+) -> tuple[float, Optional[int]]:
+    # Solvers print their own progress, which is not what we want to measure
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        times = []
+        for _ in range(repeats):
+            gc.collect()
+            times.append(run_part(day, part, input_path).elapsed)
+        peak = None
+        if memory:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                run_part(day, part, input_path)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return min(times), peak
+
+
+def analyze(
+    day: Day,
+    part: int,
+    sizes: Sequence[int],
+    truncate: Optional[Path] = None,
+    seed: int = 0,
+    repeats: int = 1,
+    memory: bool = True,
+    max_seconds: Optional[float] = None,
+) -> Scaling:
+    """
+    Measure every size in increasing order, stopping after the first one that
+    takes longer than max_seconds.
+    """
+    if truncate is None:
+        check_generated(day)
+    scaling = Scaling(day.name, part)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sorted(sizes):
+            if truncate is not None:
+                text = truncated_input(truncate, size)
+            else:
+                text = generate(day.name, size, seed)
+            input_path = Path(directory) / f"{day.name}_{size}.txt"
+            input_path.write_text(text)
+            elapsed, peak = measure(day, part, input_path, repeats, memory)
+            scaling.measurements.append(Measurement(size, elapsed, peak))
+            print(f"{day.name} part {part}, size {size}: {elapsed:.4f} seconds")
+            if max_seconds is not None and elapsed > max_seconds:
+                break
+    return scaling
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("day", help="Day to measure, e.g. 22 or 7_2021")
+    parser.add_argument(
+        "--part",
+        type=int,
+        choices=sorted(PARTS),
+        action="append",
+        dest="parts",
+        help="Part to measure, can be repeated. Default: all parts.",
+    )
+    parser.add_argument("--start", type=int, default=DEFAULT_START)
+    parser.add_argument("--factor", type=float, default=DEFAULT_FACTOR)
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=None, help="Sizes in place of a series"
+    )
+    parser.add_argument(
+        "--truncate",
+        type=Path,
+        default=None,
+        help="Take the first lines of this input instead of generating inputs",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=1, help="Timed runs per size")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Do not trace peak memory"
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="Stop growing once a size takes longer than this",
+    )
+    parser.add_argument("--root", type=Path, default=REPO_ROOT, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.repeats < 1:
+        raise ValueError("At least one repeat is needed")
+    # Parsing is part of the scaling, and every input is seen once anyway
+    cache.set_enabled(False)
+    progress.set_enabled(False)
+    day = resolve_day(args.day, discover_days(args.root))
+    sizes = args.sizes or geometric_sizes(args.start, args.factor, args.steps)
+    results = []
+    for part in args.parts or tuple(PARTS):
+        if get_solver(day, part) is None:
+            continue
+        results.append(
+            analyze(
+                day,
+                part,
+                sizes,
+                args.truncate,
+                args.seed,
+                args.repeats,
+                not args.no_memory,
+                args.max_seconds,
+            )
+        )
+    for scaling in results:
+        print(scaling.format())
+
+
+if __name__ == "__main__":
+    main()
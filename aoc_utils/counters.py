@@ -0,0 +1,31 @@
+"""
+Counters and gauges of the work done by solvers, reported next to the timings.
+
+    count("states_expanded")
+    count("heap_pushes", len(moves))
+    gauge("max_frontier", len(queue))
+
+add to the span the code runs in, e.g. day17 > part_two under the runner. Counts
+are summed, gauges keep the largest value recorded, also when spans of several
+runs or worker processes are merged. --report prints them under their span and
+the JSON and CSV exports include them, so two versions of a solver can be
+compared by the work they do and not only by their time.
+
+Both are a dictionary update on the current span. In the hottest loops, keep the
+counts in local variables and record them once the loop is done.
+"""
+
+from __future__ import annotations
+
+from .timers import registry
+
+
+def count(name: str, amount: int = 1) -> None:
+    counters = registry.current().counters
+    counters[name] = counters.get(name, 0) + amount
+
+
+def gauge(name: str, value: int) -> None:
+    gauges = registry.current().gauges
+    if value > gauges.get(name, value - 1):
+        gauges[name] = value
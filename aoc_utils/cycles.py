@@ -0,0 +1,101 @@
+"""
+Cycle detection for "simulate N steps" problems.
+
+A simulation is a start state and a step function. Once a state repeats, the
+sequence is periodic: after tail steps it repeats every period steps, so the
+state after any number of steps is the state after a few of them.
+
+find_cycle remembers every state by its fingerprint, which must be hashable and
+identify the state, e.g. a tuple of positions. It takes tail + period steps and
+keeps the states to answer state_at without stepping again. brent only keeps two
+states, so it needs no memory but steps again to answer state_at. Its fingerprint
+only needs equality, and the step function must not mutate the state.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+State = TypeVar("State")
+
+
+@dataclass(frozen=True)
+class Cycle(Generic[State]):
+    tail: int
+    period: int
+    # State after a number of steps smaller than tail + period
+    _state_within: Callable[[int], State]
+
+    def reduce(self, steps: int) -> int:
+        """
+        The smallest number of steps reaching the same state as steps.
+        """
+        if steps < self.tail:
+            return steps
+        return self.tail + (steps - self.tail) % self.period
+
+    def state_at(self, steps: int) -> State:
+        return self._state_within(self.reduce(steps))
+
+
+def _identity(state):
+    return state
+
+
+def iterate(start: State, step: Callable[[State], State], steps: int) -> State:
+    state = start
+    for _ in range(steps):
+        state = step(state)
+    return state
+
+
+def find_cycle(
+    start: State,
+    step: Callable[[State], State],
+    fingerprint: Callable[[State], Hashable] = _identity,
+    max_steps: Optional[int] = None,
+) -> Cycle[State]:
+    states = [start]
+    seen = {fingerprint(start): 0}
+    state = start
+    while max_steps is None or len(states) <= max_steps:
+        state = step(state)
+        key = fingerprint(state)
+        if key in seen:
+            tail = seen[key]
+            return Cycle(tail, len(states) - tail, states.__getitem__)
+        seen[key] = len(states)
+        states.append(state)
+    raise ValueError(f"No state repeated within {max_steps} steps")
+
+
+def brent(
+    start: State,
+    step: Callable[[State], State],
+    fingerprint: Callable[[State], object] = _identity,
+    max_steps: Optional[int] = None,
+) -> Cycle[State]:
+    # Find the period: the hare runs ahead, the tortoise teleports to it at powers of two
+    power = period = 1
+    tortoise_key = fingerprint(start)
+    hare = step(start)
+    steps = 1
+    while tortoise_key != fingerprint(hare):
+        if max_steps is not None and steps > max_steps:
+            raise ValueError(f"No state repeated within {max_steps} steps")
+        if power == period:
+            tortoise_key = fingerprint(hare)
+            power *= 2
+            period = 0
+        hare = step(hare)
+        period += 1
+        steps += 1
+    # Find the tail: two walkers period steps apart meet where the cycle starts
+    tortoise = start
+    hare = iterate(start, step, period)
+    tail = 0
+    while fingerprint(tortoise) != fingerprint(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        tail += 1
+    return Cycle(tail, period, lambda steps: iterate(start, step, steps))
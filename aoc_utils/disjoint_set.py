@@ -0,0 +1,115 @@
+"""
+Disjoint sets of integer ids, for labelling connected components.
+
+A DisjointSet over range(n) starts with every id alone in its set. union merges
+the sets of two ids, find returns the representative of the set of an id. Union
+by rank keeps the trees shallow and find compresses the paths it walks, so a
+sequence of m operations costs O(m * alpha(n)), linear for any practical n.
+Parents, ranks and sizes are flat lists, nothing is hashed.
+
+    components = DisjointSet(grid.cells.size)
+    components.union_edges(*grid.edges(passable=grid.cells < 9))
+    sizes = components.sizes()
+
+Nodes that are not ints, e.g. names, are numbered first with a dict.
+"""
+
+from __future__ import annotations
+from typing import Iterable, Optional, Sequence
+
+
+class DisjointSet:
+    def __init__(self, n: int):
+        self._parent = list(range(n))
+        self._rank = [0] * n
+        self._size = [1] * n
+        self.n_components = n
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def find(self, i: int) -> int:
+        parent = self._parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression: everything walked now points to the root
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets of a and b, False if they were already the same set.
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        rank = self._rank
+        if rank[a] < rank[b]:
+            a, b = b, a
+        elif rank[a] == rank[b]:
+            rank[a] += 1
+        self._parent[b] = a
+        self._size[a] += self._size[b]
+        self.n_components -= 1
+        return True
+
+    def union_edges(self, sources: Sequence[int], targets: Sequence[int]) -> int:
+        """
+        Union every (source, target) pair, e.g. the arrays of Grid.edges, and
+        return the number of merges.
+        """
+        # numpy arrays: ints from a list are much faster to index with
+        if hasattr(sources, "tolist"):
+            sources = sources.tolist()
+        if hasattr(targets, "tolist"):
+            targets = targets.tolist()
+        if len(sources) != len(targets):
+            raise ValueError("Edges need as many sources as targets")
+        find = self.find
+        parent, rank, size = self._parent, self._rank, self._size
+        merges = 0
+        for a, b in zip(sources, targets):
+            a, b = find(a), find(b)
+            if a == b:
+                continue
+            if rank[a] < rank[b]:
+                a, b = b, a
+            elif rank[a] == rank[b]:
+                rank[a] += 1
+            parent[b] = a
+            size[a] += size[b]
+            merges += 1
+        self.n_components -= merges
+        return merges
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def component_size(self, i: int) -> int:
+        return self._size[self.find(i)]
+
+    def roots(self) -> list[int]:
+        """
+        The representative of every id, ids in the same set share it.
+        """
+        find = self.find
+        return [find(i) for i in range(len(self))]
+
+    def sizes(self, ids: Optional[Iterable[int]] = None) -> dict[int, int]:
+        """
+        Size of every set by representative, only of the sets of ids if given.
+        """
+        if ids is None:
+            ids = range(len(self))
+        return {root: self._size[root] for root in map(self.find, ids)}
+
+    def components(self) -> list[list[int]]:
+        """
+        The ids of every set, largest set first.
+        """
+        members: dict[int, list[int]] = {}
+        for i, root in enumerate(self.roots()):
+            members.setdefault(root, []).append(i)
+        return sorted(members.values(), key=len, reverse=True)
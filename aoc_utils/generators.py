@@ -0,0 +1,1142 @@
+"""
+Deterministic synthetic inputs in the format of each day.
+
+Every generator takes a seeded random.Random and a size and returns the text of a
+valid input file. What the size counts depends on the format: the side of a grid,
+the number of lines, bricks, workflows, scanners or cuboid steps. Every day has
+a generator, except those listed in UNSUPPORTED with the reason.
+
+    python -m aoc_utils.generators 22 --size 5000 --seed 1 --output bricks.txt
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import random
+import string
+from itertools import product
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+Generator = Callable[[random.Random, int], str]
+
+GENERATORS: dict[str, Generator] = {}
+
+# Days whose inputs cannot be generated, and why
+UNSUPPORTED = {
+    "day21_2021": "the solver ignores its input, the starting positions are fixed",
+}
+
+
+def register(*day_names: str) -> Callable[[Generator], Generator]:
+    def decorator(generator: Generator) -> Generator:
+        for day_name in day_names:
+            GENERATORS[day_name] = generator
+        return generator
+
+    return decorator
+
+
+def generate(day_name: str, size: int, seed: int = 0) -> str:
+    if day_name in UNSUPPORTED:
+        raise ValueError(
+            f"Inputs of {day_name} cannot be generated: {UNSUPPORTED[day_name]}"
+        )
+    if day_name not in GENERATORS:
+        raise ValueError(
+            f"No generator for {day_name}, available: {', '.join(GENERATORS)}"
+        )
+    if size < 1:
+        raise ValueError("The size must be positive")
+    return GENERATORS[day_name](random.Random(seed), size)
+
+
+def write_input(day_name: str, path: Path, size: int, seed: int = 0) -> Path:
+    with open(path, "w") as fout:
+        fout.write(generate(day_name, size, seed))
+    return path
+
+
+def random_name(rng: random.Random, length: int, taken: set[str]) -> str:
+    while (name := "".join(rng.choices(string.ascii_lowercase, k=length))) in taken:
+        continue
+    taken.add(name)
+    return name
+
+
+def lines(rows: Sequence[str]) -> str:
+    return "".join(row + "\n" for row in rows)
+
+
+# Grids
+
+
+def digit_grid(rng: random.Random, size: int, digits: str) -> str:
+    return lines("".join(rng.choices(digits, k=size)) for _ in range(size))
+
+
+@register("day17", "day15_2021")
+def heat_loss_grid(rng: random.Random, size: int) -> str:
+    return digit_grid(rng, size, "123456789")
+
+
+@register("day9_2021", "day11_2021")
+def height_grid(rng: random.Random, size: int) -> str:
+    return digit_grid(rng, size, "0123456789")
+
+
+def char_grid(rng: random.Random, size: int, weights: dict[str, float]) -> list[str]:
+    chars, probabilities = list(weights), list(weights.values())
+    return ["".join(rng.choices(chars, probabilities, k=size)) for _ in range(size)]
+
+
+@register("day11")
+def galaxies(rng: random.Random, size: int) -> str:
+    grid = char_grid(rng, size, {".": 0.98, "#": 0.02})
+    return lines(grid)
+
+
+@register("day14")
+def rocks(rng: random.Random, size: int) -> str:
+    return lines(char_grid(rng, size, {".": 0.6, "O": 0.25, "#": 0.15}))
+
+
+@register("day16")
+def contraption(rng: random.Random, size: int) -> str:
+    weights = {".": 0.9, "/": 0.025, "\\": 0.025, "|": 0.025, "-": 0.025}
+    return lines(char_grid(rng, size, weights))
+
+
+@register("day21")
+def garden(rng: random.Random, size: int) -> str:
+    """
+    Odd sized square with S in the center and rock free middle row, column and
+    border, the structure the solution of part two relies on.
+    """
+    size = max(size | 1, 5)
+    center = size // 2
+    grid = [list(row) for row in char_grid(rng, size, {".": 0.85, "#": 0.15})]
+    for i, j in product(range(size), range(size)):
+        if i in (0, center, size - 1) or j in (0, center, size - 1):
+            grid[i][j] = "."
+    grid[center][center] = "S"
+    return lines("".join(row) for row in grid)
+
+
+@register("day3")
+def engine_schematic(rng: random.Random, size: int) -> str:
+    """
+    Part numbers of one to three digits and symbols scattered over dots, numbers
+    on a row always separated by at least one other character.
+    """
+    rows = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            draw = rng.random()
+            if draw < 0.15 and size - len(row) >= 4:
+                row += str(rng.randint(1, 999)) + rng.choice("..*#+$")
+            elif draw < 0.2:
+                row += rng.choice("*#+$/@=%&-")
+            else:
+                row += "."
+        rows.append(row[:size])
+    return lines(rows)
+
+
+PIPES = {
+    frozenset({(-1, 0), (1, 0)}): "|",
+    frozenset({(0, -1), (0, 1)}): "-",
+    frozenset({(-1, 0), (0, 1)}): "L",
+    frozenset({(-1, 0), (0, -1)}): "J",
+    frozenset({(1, 0), (0, -1)}): "7",
+    frozenset({(1, 0), (0, 1)}): "F",
+}
+
+
+@register("day10")
+def pipe_maze(rng: random.Random, size: int) -> str:
+    """
+    A single loop drawn around a random tree of cells of a coarse grid, each cell
+    being 3x3 tiles, among junk pipes and with a border of ground. The loop
+    encloses the middle tile of every cell of the tree. S is a tile of the loop.
+    """
+    cells = max((size - 2) // 3, 2)
+    start = (rng.randrange(cells), rng.randrange(cells))
+    tree = {start}
+    growing = [start]
+    links: dict[tuple[int, int], set[tuple[int, int]]] = {}
+    while growing and len(tree) < 2 * cells * cells // 3:
+        row, col = cell = rng.choice(growing)
+        options = [
+            (row + d_row, col + d_col)
+            for d_row, d_col in ((0, 1), (1, 0), (0, -1), (-1, 0))
+            if 0 <= row + d_row < cells
+            and 0 <= col + d_col < cells
+            and (row + d_row, col + d_col) not in tree
+        ]
+        if not options:
+            growing.remove(cell)
+            continue
+        new_cell = rng.choice(options)
+        tree.add(new_cell)
+        growing.append(new_cell)
+        links[cell] = links.get(cell, set()) | {new_cell}
+        links[new_cell] = links.get(new_cell, set()) | {cell}
+    # Each cell is a ring of its eight outer tiles, a tree edge swaps one pipe of
+    # each facing side for two bridges: the loop follows the tree around
+    connections: dict[tuple[int, int], set[tuple[int, int]]] = {}
+
+    def connect(first: tuple[int, int], second: tuple[int, int]) -> None:
+        connections.setdefault(first, set()).add(second)
+        connections.setdefault(second, set()).add(first)
+
+    for row, col in tree:
+        top, left = 3 * row + 1, 3 * col + 1
+        ring = [
+            (top, left),
+            (top, left + 1),
+            (top, left + 2),
+            (top + 1, left + 2),
+            (top + 2, left + 2),
+            (top + 2, left + 1),
+            (top + 2, left),
+            (top + 1, left),
+        ]
+        neighbours = links.get((row, col), set())
+        # The pipe of the ring each side gives up when linked to that neighbour
+        swapped = {
+            1: (row - 1, col),
+            3: (row, col + 1),
+            4: (row + 1, col),
+            6: (row, col - 1),
+        }
+        for i, tile in enumerate(ring):
+            if swapped.get(i) not in neighbours:
+                connect(tile, ring[(i + 1) % 8])
+        if (row, col + 1) in neighbours:
+            connect((top + 1, left + 2), (top + 1, left + 3))
+            connect((top + 2, left + 2), (top + 2, left + 3))
+        if (row + 1, col) in neighbours:
+            connect((top + 2, left + 1), (top + 3, left + 1))
+            connect((top + 2, left + 2), (top + 3, left + 2))
+    side = 3 * cells + 2
+    grid = [
+        list(row)
+        for row in char_grid(
+            rng, side, {".": 0.5} | {pipe: 0.5 / 6 for pipe in "|-LJ7F"}
+        )
+    ]
+    for i in range(side):
+        grid[0][i] = grid[-1][i] = grid[i][0] = grid[i][-1] = "."
+    for (row, col), neighbours in connections.items():
+        grid[row][col] = PIPES[
+            frozenset((n_row - row, n_col - col) for n_row, n_col in neighbours)
+        ]
+    row, col = rng.choice(sorted(connections))
+    grid[row][col] = "S"
+    return lines("".join(row) for row in grid)
+
+
+@register("day23")
+def hiking_trails(rng: random.Random, size: int) -> str:
+    """
+    Size is the side of the map. Junctions sit on a lattice of at most 6x6, like
+    the real inputs, so that the exhaustive search of part two stays tractable:
+    larger sizes make the corridors longer. Slopes around the junctions point
+    right and down.
+    """
+    n = min(6, max(2, size // 20))
+    gap = max(3, size // (n + 1))
+
+    def gaps(count: int) -> list[int]:
+        return [rng.randint(max(3, gap - 2), gap + 2) for _ in range(count)]
+
+    # The first and last row gaps are the corridors from the start and to the end
+    row_gaps, col_gaps = gaps(n + 1), gaps(n - 1)
+    rows = [sum(row_gaps[: i + 1]) for i in range(n)]
+    cols = [1 + sum(col_gaps[:j]) for j in range(n)]
+    height, width = rows[-1] + row_gaps[-1] + 1, cols[-1] + 2
+    grid = [["#"] * width for _ in range(height)]
+
+    def corridor(cells: list[tuple[int, int]], slope: str) -> None:
+        for row, col in cells:
+            grid[row][col] = "."
+        for row, col in (cells[0], cells[-1]):
+            grid[row][col] = slope
+
+    corridor([(row, 1) for row in range(1, rows[0])], "v")
+    grid[0][1] = "."
+    corridor([(row, cols[-1]) for row in range(rows[-1] + 1, height - 1)], "v")
+    grid[height - 1][cols[-1]] = "."
+    for i, row in enumerate(rows):
+        for j, col in enumerate(cols):
+            grid[row][col] = "."
+            if j + 1 < n:
+                corridor([(row, x) for x in range(col + 1, cols[j + 1])], ">")
+            if i + 1 < n:
+                corridor([(y, col) for y in range(row + 1, rows[i + 1])], "v")
+    return lines("".join(row) for row in grid)
+
+
+# Line based formats
+
+
+@register("day1_2021")
+def depths(rng: random.Random, size: int) -> str:
+    depth = rng.randint(100, 200)
+    values = []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        values.append(str(depth))
+    return lines(values)
+
+
+@register("day6_2021")
+def lanternfish(rng: random.Random, size: int) -> str:
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size)) + "\n"
+
+
+@register("day7_2021")
+def crabs(rng: random.Random, size: int) -> str:
+    return ",".join(str(rng.randint(0, 2 * size)) for _ in range(size)) + "\n"
+
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+@register("day1")
+def calibration(rng: random.Random, size: int) -> str:
+    """
+    Letters, digits and spelled out digits, at least one digit per line.
+    """
+    document = []
+    for _ in range(size):
+        pieces = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            draw = rng.random()
+            if draw < 0.3:
+                pieces.append(str(rng.randint(1, 9)))
+            elif draw < 0.6:
+                pieces.append(rng.choice(DIGIT_WORDS))
+            else:
+                pieces.append("".join(rng.choices(string.ascii_lowercase, k=3)))
+        rng.shuffle(pieces)
+        document.append("".join(pieces))
+    return lines(document)
+
+
+@register("day2")
+def cube_games(rng: random.Random, size: int) -> str:
+    games = []
+    for game_id in range(1, size + 1):
+        extractions = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            extractions.append(
+                ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+            )
+        games.append(f"Game {game_id}: " + "; ".join(extractions))
+    return lines(games)
+
+
+@register("day4")
+def scratchcards(rng: random.Random, size: int) -> str:
+    cards = []
+    for card_id in range(1, size + 1):
+        winning = rng.sample(range(1, 100), 10)
+        owned = rng.sample(range(1, 100), 25)
+        cards.append(
+            f"Card {card_id:>4}: "
+            + " ".join(f"{value:>2}" for value in winning)
+            + " | "
+            + " ".join(f"{value:>2}" for value in owned)
+        )
+    return lines(cards)
+
+
+@register("day5")
+def almanac(rng: random.Random, size: int) -> str:
+    """
+    Size is the number of entries of each of the seven maps.
+    """
+    names = ["seed", "soil", "fertilizer", "water", "light", "temperature"]
+    names += ["humidity", "location"]
+    limit = 2**32
+    seeds = []
+    for _ in range(10):
+        seeds += [rng.randrange(limit // 2), rng.randrange(1, limit // 20)]
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+    for source_name, destination_name in zip(names[:-1], names[1:]):
+        boundaries = sorted(rng.sample(range(limit), 2 * size))
+        entries = []
+        for start, end in zip(boundaries[::2], boundaries[1::2]):
+            entries.append(
+                f"{rng.randrange(limit - (end - start))} {start} {end - start}"
+            )
+        rng.shuffle(entries)
+        blocks.append(
+            f"{source_name}-to-{destination_name} map:\n" + "\n".join(entries)
+        )
+    return "\n\n".join(blocks) + "\n"
+
+
+@register("day6")
+def boat_races(rng: random.Random, size: int) -> str:
+    """
+    Four races like the real inputs, size is the longest race time. Every record
+    can be beaten.
+    """
+    times = [rng.randint(max(2, size // 2), max(2, size)) for _ in range(4)]
+    records = [rng.randrange((time // 2) * (time - time // 2)) for time in times]
+    return lines(
+        [
+            "Time:    " + "".join(f"{time:>6}" for time in times),
+            "Distance:" + "".join(f"{record:>6}" for record in records),
+        ]
+    )
+
+
+@register("day7")
+def camel_cards(rng: random.Random, size: int) -> str:
+    hands = [
+        "".join(rng.choices("23456789TJQKA", k=5)) + f" {rng.randint(1, 1000)}"
+        for _ in range(size)
+    ]
+    return lines(hands)
+
+
+@register("day8")
+def desert_network(rng: random.Random, size: int) -> str:
+    """
+    Size is about the number of nodes. Like the real inputs, each ghost starts on
+    a node ending in A and walks a loop back to its node ending in Z, as long as
+    a distinct prime number of passes over the instructions. AAA leads to ZZZ.
+    """
+    periods = rng.sample([3, 5, 7, 11, 13, 17, 19, 23], 6)
+    n_moves = max(1, size // sum(periods))
+    if n_moves * sum(periods) > 36 * 36 * 34:
+        raise ValueError("Not enough three character names for that many nodes")
+    moves = "".join(rng.choices("LR", k=n_moves))
+    name_chars = string.digits + string.ascii_uppercase
+    inner_chars = name_chars.replace("A", "").replace("Z", "")
+    taken = {"AAA", "ZZZ"}
+
+    def new_name(last_chars: str) -> str:
+        while (
+            name := "".join(rng.choices(name_chars, k=2)) + rng.choice(last_chars)
+        ) in taken:
+            continue
+        taken.add(name)
+        return name
+
+    nodes: dict[str, tuple[str, str]] = {}
+    for ghost, period in enumerate(periods):
+        start, end = ("AAA", "ZZZ") if ghost == 0 else (new_name("A"), new_name("Z"))
+        loop = [end] + [new_name(inner_chars) for _ in range(period * n_moves - 1)]
+        for position, node in enumerate(loop):
+            # The instruction followed here is always the same one
+            following, other = loop[(position + 1) % len(loop)], rng.choice(loop)
+            if moves[position % n_moves] == "L":
+                nodes[node] = (following, other)
+            else:
+                nodes[node] = (other, following)
+        nodes[start] = nodes[end]
+    network = [f"{node} = ({left}, {right})" for node, (left, right) in nodes.items()]
+    rng.shuffle(network)
+    return lines([moves, ""] + network)
+
+
+@register("day9")
+def oasis_sequences(rng: random.Random, size: int) -> str:
+    sequences = []
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        values = [
+            sum(
+                coefficient * x**power for power, coefficient in enumerate(coefficients)
+            )
+            for x in range(21)
+        ]
+        sequences.append(" ".join(map(str, values)))
+    return lines(sequences)
+
+
+@register("day12")
+def spring_records(rng: random.Random, size: int) -> str:
+    """
+    Draw the springs, derive the damaged groups, then hide part of the springs.
+    """
+    records = []
+    for _ in range(size):
+        springs = "".join(rng.choices(".#", k=rng.randint(5, 20)))
+        if "#" not in springs:
+            springs = springs[:-1] + "#"
+        groups = [len(group) for group in springs.split(".") if group]
+        hidden = "".join("?" if rng.random() < 0.5 else spring for spring in springs)
+        records.append(f"{hidden} {','.join(map(str, groups))}")
+    return lines(records)
+
+
+def mirror_lines(rows: list[str]) -> tuple[list[int], list[int]]:
+    """
+    Lines of reflection between rows, as the number of rows above them: the
+    exact ones and those off by a single smudge.
+    """
+    exact, smudged = [], []
+    for above in range(1, len(rows)):
+        pairs = zip(rows[above - 1 :: -1], rows[above:])
+        differences = sum(
+            a != b for first, second in pairs for a, b in zip(first, second)
+        )
+        if differences == 0:
+            exact.append(above)
+        elif differences == 1:
+            smudged.append(above)
+    return exact, smudged
+
+
+def transposed(rows: list[str]) -> list[str]:
+    return ["".join(column) for column in zip(*rows)]
+
+
+@register("day13")
+def mirror_patterns(rng: random.Random, size: int) -> str:
+    """
+    Size is the number of patterns. Each has a single line of reflection, and a
+    single other line that a smudge hides, as part two expects.
+    """
+    patterns = []
+    while len(patterns) < size:
+        height, width = rng.randint(5, 17), rng.randint(5, 17)
+        rows = ["".join(rng.choices("#.", k=width)) for _ in range(height)]
+        # Mirror the rows around one line, the columns around another
+        row_line, column_line = rng.randrange(1, height), rng.randrange(1, width)
+        for above in range(row_line - 1, max(2 * row_line - height, 0) - 1, -1):
+            rows[2 * row_line - 1 - above] = rows[above]
+        columns = transposed(rows)
+        for left in range(column_line - 1, max(2 * column_line - width, 0) - 1, -1):
+            columns[2 * column_line - 1 - left] = columns[left]
+        rows = [list(row) for row in transposed(columns)]
+        # A cell flipped where only the columns are mirrored is the smudge
+        row, column = rng.randrange(height), rng.randrange(width)
+        rows[row][column] = "#" if rows[row][column] == "." else "."
+        rows = ["".join(row) for row in rows]
+        row_lines, column_lines = mirror_lines(rows), mirror_lines(transposed(rows))
+        exact = [100 * line for line in row_lines[0]] + column_lines[0]
+        smudged = [100 * line for line in row_lines[1]] + column_lines[1]
+        if len(exact) == 1 and len(smudged) == 1:
+            patterns.append("\n".join(rows))
+    # The parser splits on blank lines and does not expect a trailing newline
+    return "\n\n".join(patterns)
+
+
+@register("day15")
+def lens_steps(rng: random.Random, size: int) -> str:
+    taken = set()
+    labels = [random_name(rng, rng.randint(2, 6), taken) for _ in range(1 + size // 4)]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(
+            f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        )
+    return ",".join(steps) + "\n"
+
+
+def skyline(rng: random.Random, n_columns: int, longest: int) -> list[tuple[str, int]]:
+    """
+    The outline of adjacent columns of random widths and heights, clockwise from
+    the bottom left corner: never touching itself.
+    """
+    heights = [rng.randint(1, longest)]
+    while len(heights) < n_columns:
+        if (height := rng.randint(1, longest)) != heights[-1]:
+            heights.append(height)
+    widths = [rng.randint(2, longest) for _ in range(n_columns)]
+    moves = [("U", heights[0])]
+    for i, width in enumerate(widths):
+        moves.append(("R", width))
+        if i + 1 < n_columns:
+            step = heights[i + 1] - heights[i]
+            moves.append(("U" if step > 0 else "D", abs(step)))
+    moves += [("D", heights[-1]), ("L", sum(widths))]
+    return moves
+
+
+@register("day18")
+def dig_plan(rng: random.Random, size: int) -> str:
+    """
+    Size is the number of columns of two skylines, a small one in the directions
+    and a large one in the colors. The last move goes back along all the columns,
+    and has to fit in five hexadecimal digits.
+    """
+    hex_directions = {"R": 0, "D": 1, "L": 2, "U": 3}
+    plan = []
+    for (direction, steps), (color_direction, color_steps) in zip(
+        skyline(rng, size, 10), skyline(rng, size, max(2, 0xFFFFF // size))
+    ):
+        color = f"{color_steps:05x}{hex_directions[color_direction]}"
+        plan.append(f"{direction} {steps} (#{color})")
+    return lines(plan)
+
+
+@register("day19")
+def workflows(rng: random.Random, size: int) -> str:
+    """
+    Size is the number of workflows, arranged as a tree rooted in "in" so that
+    every part is either accepted or rejected. Twice as many parts are rated.
+    """
+    taken = {"in"}
+    names = ["in"] + [random_name(rng, 3, taken) for _ in range(size - 1)]
+    unassigned = names[1:]
+    rules = []
+    for name in names:
+        targets = []
+        for i in range(rng.randint(2, 4)):
+            # Each workflow adopts at least one orphan, so all of them are reachable
+            if unassigned and (i == 0 or rng.random() < 0.5):
+                targets.append(unassigned.pop(0))
+            else:
+                targets.append(rng.choice("AR"))
+        rng.shuffle(targets)
+        conditions = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(2, 3999)}:{target}"
+            for target in targets[:-1]
+        ]
+        rules.append(f"{name}{{{','.join(conditions + targets[-1:])}}}")
+    parts = [
+        "{"
+        + ",".join(f"{category}={rng.randint(1, 4000)}" for category in "xmas")
+        + "}"
+        for _ in range(2 * size)
+    ]
+    return "\n".join(rules) + "\n\n" + lines(parts)
+
+
+PRIMES_12_BITS = [
+    n for n in range(2049, 4096, 2) if all(n % d for d in range(3, int(n**0.5) + 1, 2))
+]
+
+
+@register("day20")
+def pulse_modules(rng: random.Random, size: int) -> str:
+    """
+    Size is the number of counters, four in the real inputs. Each counter is a
+    chain of twelve flip-flops counting button pushes, and a conjunction seeing
+    the bits set in a prime period: it resets the chain and, through an
+    inverter, sends a high pulse to the conjunction before rx.
+    """
+    if 14 * size + 1 > 26 * 26:
+        raise ValueError("Not enough two letter names for that many counters")
+    taken = {"rx"}
+    final = random_name(rng, 2, taken)
+    modules = {"broadcaster": []}
+    for period in rng.sample(PRIMES_12_BITS, size):
+        flip_flops = [random_name(rng, 2, taken) for _ in range(12)]
+        hub, inverter = random_name(rng, 2, taken), random_name(rng, 2, taken)
+        modules["broadcaster"].append(flip_flops[0])
+        for bit, flip_flop in enumerate(flip_flops):
+            targets = flip_flops[bit + 1 : bit + 2]
+            if period >> bit & 1:
+                targets.append(hub)
+            modules[f"%{flip_flop}"] = targets
+        modules[f"&{hub}"] = [inverter, flip_flops[0]] + [
+            flip_flop
+            for bit, flip_flop in enumerate(flip_flops)
+            if not period >> bit & 1
+        ]
+        modules[f"&{inverter}"] = [final]
+    modules[f"&{final}"] = ["rx"]
+    configuration = [
+        f"{name} -> {', '.join(targets)}" for name, targets in modules.items()
+    ]
+    rng.shuffle(configuration)
+    return lines(configuration)
+
+
+@register("day22")
+def bricks(rng: random.Random, size: int) -> str:
+    """
+    Size is the number of bricks, dropped at random heights of a 10x10 area.
+    """
+    occupied = set()
+    snapshot = []
+    max_z = max(10, size // 3)
+    while len(snapshot) < size:
+        start = [rng.randint(0, 9), rng.randint(0, 9), rng.randint(1, max_z)]
+        axis = rng.randrange(3)
+        end = list(start)
+        end[axis] = start[axis] + rng.randint(0, 3)
+        if axis < 2 and end[axis] > 9:
+            continue
+        cubes = set(product(*[range(low, high + 1) for low, high in zip(start, end)]))
+        if cubes & occupied:
+            continue
+        occupied |= cubes
+        snapshot.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+    return lines(snapshot)
+
+
+@register("day24")
+def hailstones(rng: random.Random, size: int) -> str:
+    """
+    Hailstones built backwards from a rock trajectory crossing all of them.
+    """
+    scale = 100_000_000_000_000
+    rock_position = [rng.randint(2 * scale, 4 * scale) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+    stones = []
+    for _ in range(size):
+        time = rng.randint(scale // 1000, scale // 100)
+        while (velocity := [rng.randint(-300, 300) for _ in range(3)])[0] == 0:
+            continue
+        position = [
+            p + (v - hv) * time
+            for p, v, hv in zip(rock_position, rock_velocity, velocity)
+        ]
+        stones.append(
+            ", ".join(map(str, position)) + " @ " + ", ".join(map(str, velocity))
+        )
+    return lines(stones)
+
+
+@register("day25")
+def wiring(rng: random.Random, size: int) -> str:
+    """
+    Two groups of size components, each 8-regular, wired together by three edges.
+    """
+    size = max(size, 9)
+    taken = set()
+    groups = [[random_name(rng, 3, taken) for _ in range(size)] for _ in range(2)]
+    edges = []
+    for group in groups:
+        for i, name in enumerate(group):
+            edges.extend((name, group[(i + k) % size]) for k in range(1, 5))
+    edges.extend(zip(rng.sample(groups[0], 3), rng.sample(groups[1], 3)))
+    connections: dict[str, list[str]] = {}
+    for source, target in edges:
+        connections.setdefault(source, []).append(target)
+    return lines(
+        f"{source}: {' '.join(targets)}" for source, targets in connections.items()
+    )
+
+
+# 2021 formats
+
+
+@register("day2_2021")
+def submarine_commands(rng: random.Random, size: int) -> str:
+    commands = []
+    aim = 0
+    for _ in range(size):
+        command = rng.choices(["forward", "down", "up"], [0.5, 0.3, 0.2])[0]
+        steps = rng.randint(1, 9)
+        # Never aim up past the surface
+        if command == "up" and steps > aim:
+            command = "down"
+        aim += steps if command == "down" else -steps if command == "up" else 0
+        commands.append(f"{command} {steps}")
+    return lines(commands)
+
+
+@register("day3_2021")
+def diagnostic_report(rng: random.Random, size: int) -> str:
+    """
+    Distinct numbers of at least twelve bits. Sets where the oxygen or CO2 rating
+    filters would run out of numbers are drawn again.
+    """
+    n_bits = max(12, size.bit_length() + 2)
+    while True:
+        numbers = rng.sample(range(2**n_bits), size)
+        report = [f"{number:0{n_bits}b}" for number in numbers]
+        if rating_exists(report, most_common=True) and rating_exists(
+            report, most_common=False
+        ):
+            return lines(report)
+
+
+def rating_exists(report: list[str], most_common: bool) -> bool:
+    for i in range(len(report[0])):
+        if len(report) == 1:
+            break
+        ones = sum(number[i] == "1" for number in report)
+        keep = "1" if (ones >= len(report) / 2) == most_common else "0"
+        report = [number for number in report if number[i] == keep]
+    return len(report) >= 1
+
+
+@register("day4_2021")
+def bingo(rng: random.Random, size: int) -> str:
+    """
+    Size is the number of boards, all numbers from 0 to 99 are drawn.
+    """
+    numbers = list(range(100))
+    rng.shuffle(numbers)
+    blocks = [",".join(map(str, numbers))]
+    for _ in range(size):
+        board = rng.sample(range(100), 25)
+        blocks.append(
+            "\n".join(
+                " ".join(f"{value:>2}" for value in board[row : row + 5])
+                for row in range(0, 25, 5)
+            )
+        )
+    return "\n\n".join(blocks) + "\n"
+
+
+@register("day5_2021")
+def vents(rng: random.Random, size: int) -> str:
+    """
+    Horizontal, vertical and diagonal lines in a 1000x1000 area.
+    """
+    segments = []
+    for _ in range(size):
+        # Away from the border, so that every direction has room
+        x1, y1 = rng.randrange(1, 999), rng.randrange(1, 999)
+        dx, dy = rng.choice(
+            [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+        )
+        limits = [rng.randint(1, 300)]
+        if dx:
+            limits.append(x1 if dx < 0 else 999 - x1)
+        if dy:
+            limits.append(y1 if dy < 0 else 999 - y1)
+        length = min(limits)
+        x2, y2 = x1 + dx * length, y1 + dy * length
+        segments.append(f"{x1},{y1} -> {x2},{y2}")
+    return lines(segments)
+
+
+SEGMENTS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+@register("day8_2021")
+def seven_segment_notes(rng: random.Random, size: int) -> str:
+    notes = []
+    for _ in range(size):
+        wires = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        patterns = [
+            scrambled_digit(rng, wires, digit) for digit in rng.sample(range(10), 10)
+        ]
+        output = [scrambled_digit(rng, wires, rng.randrange(10)) for _ in range(4)]
+        notes.append(f"{' '.join(patterns)} | {' '.join(output)}")
+    return lines(notes)
+
+
+def scrambled_digit(rng: random.Random, wires: dict[str, str], digit: int) -> str:
+    segments = [wires[segment] for segment in SEGMENTS[digit]]
+    return "".join(rng.sample(segments, len(segments)))
+
+
+BRACKETS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+@register("day10_2021")
+def navigation_chunks(rng: random.Random, size: int) -> str:
+    """
+    About half the lines are corrupted by a wrong closing character, the others
+    are incomplete.
+    """
+    navigation = []
+    for _ in range(size):
+        line, opened = [], []
+        length = rng.randint(20, 110)
+        while len(line) < length or not opened:
+            if opened and rng.random() < 0.45:
+                line.append(BRACKETS[opened.pop()])
+            else:
+                opened.append(rng.choice(list(BRACKETS)))
+                line.append(opened[-1])
+        if rng.random() < 0.5:
+            wrong = [
+                closing
+                for closing in BRACKETS.values()
+                if closing != BRACKETS[opened[-1]]
+            ]
+            line.append(rng.choice(wrong))
+        navigation.append("".join(line))
+    return lines(navigation)
+
+
+@register("day12_2021")
+def caves(rng: random.Random, size: int) -> str:
+    """
+    Size is the number of caves besides start and end, about a third of them big.
+    Big caves are never connected to each other. The number of paths grows
+    exponentially with the size, the real inputs have about a dozen caves.
+    """
+    taken = {"start", "end"}
+    names = []
+    for _ in range(size):
+        name = random_name(rng, 2, taken)
+        names.append(name.upper() if rng.random() < 0.35 else name)
+    connected = ["start"]
+    edges = set()
+
+    def connect(first: str, second: str) -> None:
+        if not (first.isupper() and second.isupper()) and first != second:
+            edges.add((first, second))
+
+    for name in names:
+        # start is small, there is always a candidate
+        candidates = [
+            other for other in connected if not (name.isupper() and other.isupper())
+        ]
+        connect(rng.choice(candidates), name)
+        connected.append(name)
+    for _ in range(size // 2 if size > 1 else 0):
+        connect(*rng.sample(names, 2))
+    for name in rng.sample(names, min(len(names), 2)):
+        connect(name, "end")
+    return lines(f"{first}-{second}" for first, second in sorted(edges))
+
+
+@register("day13_2021")
+def transparent_paper(rng: random.Random, size: int) -> str:
+    """
+    Size is the number of dots. They are drawn in the final 40x6 code and unfolded
+    at random, as in the real inputs: five folds along x and seven along y.
+    """
+    if size > 40 * 6 * 2**12:
+        raise ValueError("More dots than the paper can hold")
+    widths, heights = [40], [6]
+    for _ in range(5):
+        widths.append(2 * widths[-1] + 1)
+    for _ in range(7):
+        heights.append(2 * heights[-1] + 1)
+    # Fold lines, the largest first, alternating while both axes have some
+    folds = []
+    x_folds, y_folds = widths[-2::-1], heights[-2::-1]
+    while x_folds or y_folds:
+        if x_folds:
+            folds.append(("x", x_folds.pop(0)))
+        if y_folds:
+            folds.append(("y", y_folds.pop(0)))
+    dots = set()
+    while len(dots) < size:
+        x, y = rng.randrange(40), rng.randrange(6)
+        for axis, line in reversed(folds):
+            if rng.random() < 0.5:
+                if axis == "x":
+                    x = 2 * line - x
+                else:
+                    y = 2 * line - y
+        dots.add((x, y))
+    instructions = [f"fold along {axis}={line}" for axis, line in folds]
+    return lines(f"{x},{y}" for x, y in dots) + "\n" + lines(instructions)
+
+
+@register("day14_2021")
+def polymer(rng: random.Random, size: int) -> str:
+    """
+    Size is the length of the template. Like the real inputs, ten elements and a
+    rule for each of their pairs.
+    """
+    elements = rng.sample(string.ascii_uppercase, 10)
+    template = "".join(rng.choices(elements, k=max(size, 2)))
+    rules = [
+        f"{first}{second} -> {rng.choice(elements)}"
+        for first, second in product(elements, repeat=2)
+    ]
+    return template + "\n\n" + lines(rules)
+
+
+def bits_packet(rng: random.Random, budget: int, depth: int = 0) -> str:
+    """
+    A packet of about budget packets in binary, operators have two to five
+    subpackets and are at most eight levels deep.
+    """
+    version = f"{rng.randrange(8):03b}"
+    if budget <= 2 or depth == 8 or rng.random() < 0.2:
+        value = rng.randrange(2 ** rng.randint(1, 32))
+        width = max(4, -(-value.bit_length() // 4) * 4)
+        nibbles = f"{value:0{width}b}"
+        groups = [nibbles[i : i + 4] for i in range(0, len(nibbles), 4)]
+        return (
+            version
+            + "100"
+            + "".join(
+                ("0" if i == len(groups) - 1 else "1") + group
+                for i, group in enumerate(groups)
+            )
+        )
+    type_id = rng.choice([0, 1, 2, 3, 5, 6, 7])
+    n_subpackets = 2 if type_id >= 5 else rng.randint(2, 5)
+    budgets = [max(1, (budget - 1) // n_subpackets)] * n_subpackets
+    body = "".join(bits_packet(rng, share, depth + 1) for share in budgets)
+    if len(body) < 2**15 and rng.random() < 0.5:
+        header = "0" + f"{len(body):015b}"
+    else:
+        header = "1" + f"{n_subpackets:011b}"
+    return version + f"{type_id:03b}" + header + body
+
+
+@register("day16_2021")
+def bits_transmission(rng: random.Random, size: int) -> str:
+    """
+    Size is about the number of packets, capped by the depth of eight levels.
+    """
+    binary = bits_packet(rng, size)
+    binary += "0" * (-len(binary) % 8)
+    return f"{int(binary, 2):0{len(binary) // 4}X}\n"
+
+
+@register("day17_2021")
+def target_area(rng: random.Random, size: int) -> str:
+    """
+    Size is the distance to the target, which contains a triangular number of x,
+    so that a probe can stop falling straight down inside it.
+    """
+    min_x = rng.randint(size, 2 * size)
+    speed = 1
+    while speed * (speed + 1) // 2 < min_x:
+        speed += 1
+    max_x = max(speed * (speed + 1) // 2, min_x + rng.randint(size // 4, size // 2))
+    min_y = -rng.randint(size, 2 * size)
+    max_y = min_y + rng.randint(max(1, size // 5), max(1, size // 3))
+    return f"target area: x={min_x}..{max_x}, y={min_y}..{max_y}\n"
+
+
+def snailfish_element(rng: random.Random, depth: int):
+    if depth > 4 or (depth > 1 and rng.random() < 0.3):
+        return rng.randint(0, 9)
+    return [snailfish_element(rng, depth + 1), snailfish_element(rng, depth + 1)]
+
+
+@register("day18_2021")
+def snailfish_numbers(rng: random.Random, size: int) -> str:
+    """
+    Reduced numbers: pairs nested at most four deep, regular numbers up to 9.
+    """
+    return lines(
+        json.dumps(snailfish_element(rng, 1), separators=(",", ":"))
+        for _ in range(size)
+    )
+
+
+@register("day20_2021")
+def trench_map(rng: random.Random, size: int) -> str:
+    """
+    Like the real inputs, the algorithm lights dark areas and darkens lit ones, so
+    the infinite background blinks.
+    """
+    algorithm = ["#"] + rng.choices("#.", k=510) + ["."]
+    image = ["".join(rng.choices("#.", k=size)) for _ in range(size)]
+    return "".join(algorithm) + "\n\n" + lines(image)
+
+
+@register("day22_2021")
+def reactor_steps(rng: random.Random, size: int) -> str:
+    """
+    The first steps stay in the -50..50 initialization region, the rest span far.
+    """
+    steps = []
+    for i in range(size):
+        extent = 50 if i < max(1, size // 2) else 100_000
+        ranges = []
+        for axis in "xyz":
+            low = rng.randint(-extent, extent - 1)
+            high = rng.randint(low, min(extent, low + extent // 2))
+            ranges.append(f"{axis}={low}..{high}")
+        status = "on" if i == 0 or rng.random() < 0.6 else "off"
+        steps.append(f"{status} {','.join(ranges)}")
+    return lines(steps)
+
+
+ROTATIONS = [
+    (permutation, signs)
+    for permutation in [
+        (0, 1, 2),
+        (1, 2, 0),
+        (2, 0, 1),
+        (0, 2, 1),
+        (2, 1, 0),
+        (1, 0, 2),
+    ]
+    for signs in product((1, -1), repeat=3)
+    # Even permutations keep the handedness with an even number of flips
+    if (permutation in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]) == (signs.count(-1) % 2 == 0)
+]
+
+
+@register("day19_2021")
+def scanner_reports(rng: random.Random, size: int) -> str:
+    """
+    Scanners along a chain, 1000 apart, each sharing at least twelve beacons with
+    the previous one, reported in a random orientation of the 24 possible.
+    """
+    scanners = [(0, 0, 0)]
+    for _ in range(size - 1):
+        x, y, z = scanners[-1]
+        scanners.append((x + rng.randint(900, 1100), y + rng.randint(-100, 100), z))
+    beacons = set()
+    for previous, current in zip(scanners[:-1], scanners[1:]):
+        overlap = [
+            (max(a, b) - 950, min(a, b) + 950) for a, b in zip(previous, current)
+        ]
+        shared = sum(
+            in_range(beacon, previous) and in_range(beacon, current)
+            for beacon in beacons
+        )
+        for _ in range(max(0, 12 - shared)):
+            beacons.add(tuple(rng.randint(low, high) for low, high in overlap))
+    for scanner in scanners:
+        for _ in range(rng.randint(5, 15)):
+            beacons.add(tuple(c + rng.randint(-1000, 1000) for c in scanner))
+    reports = []
+    for scanner_id, scanner in enumerate(scanners):
+        permutation, signs = ROTATIONS[0] if scanner_id == 0 else rng.choice(ROTATIONS)
+        readings = []
+        for beacon in sorted(beacons):
+            if not in_range(beacon, scanner):
+                continue
+            relative = [b - s for b, s in zip(beacon, scanner)]
+            readings.append(
+                ",".join(
+                    str(sign * relative[axis]) for axis, sign in zip(permutation, signs)
+                )
+            )
+        rng.shuffle(readings)
+        reports.append(f"--- scanner {scanner_id} ---\n" + "\n".join(readings))
+    # The parser splits on blank lines and does not expect a trailing newline
+    return "\n\n".join(reports)
+
+
+def in_range(beacon: tuple[int, int, int], scanner: tuple[int, int, int]) -> bool:
+    return all(abs(b - s) <= 1000 for b, s in zip(beacon, scanner))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("day", help="Day to generate an input for, e.g. 22 or 19_2021")
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", type=Path, default=None, help="Output file, default: stdout"
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    day_name = args.day if args.day.startswith("day") else f"day{args.day}"
+    if args.output is None:
+        print(generate(day_name, args.size, args.seed), end="")
+    else:
+        write_input(day_name, args.output, args.size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
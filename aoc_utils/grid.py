@@ -0,0 +1,196 @@
+"""
+Character and digit grids backed by a contiguous 2D numpy array.
+
+Cells hold the byte value of each character, or the digit itself for grids loaded
+with digits=True. Neighbours, bounds and masks work on whole arrays at once, so
+solvers do not need a Python object per cell. Cells can also be addressed by flat
+index, row * n_cols + col, which is what the graph utilities work on.
+"""
+
+from __future__ import annotations
+from itertools import product
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from .mapped import MappedFile
+
+NEIGHBOURS_4 = ((0, 1), (1, 0), (0, -1), (-1, 0))
+NEIGHBOURS_8 = NEIGHBOURS_4 + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+# Half of the directions, enough to list every undirected edge once
+_FORWARD_4 = ((0, 1), (1, 0))
+_FORWARD_8 = _FORWARD_4 + ((1, 1), (1, -1))
+
+Value = Union[str, int]
+
+
+def _overlap(shift: int, length: int) -> tuple[slice, slice]:
+    """
+    Slices s, t of an axis such that t is s shifted by shift, both within length.
+    """
+    if shift >= 0:
+        return slice(0, max(length - shift, 0)), slice(shift, length)
+    return slice(-shift, length), slice(0, max(length + shift, 0))
+
+
+class Grid:
+    def __init__(self, cells: np.ndarray, digits: bool = False):
+        if cells.ndim != 2:
+            raise ValueError(f"A grid has two dimensions, got {cells.ndim}")
+        self.cells = np.ascontiguousarray(cells)
+        self.digits = digits
+
+    @classmethod
+    def from_bytes(cls, data: bytes, digits: bool = False) -> Grid:
+        """
+        Reshape the raw bytes in place of splitting lines: every line, newline
+        included, is one row of a (n_rows, n_cols + 1) view of the buffer.
+        """
+        data = data.replace(b"\r\n", b"\n").rstrip(b"\n") + b"\n"
+        return cls._from_buffer(data, data.index(b"\n"), digits)
+
+    @classmethod
+    def _from_buffer(cls, data, n_cols: int, digits: bool) -> Grid:
+        # data is a bytes-like object made of newline terminated rows
+        if len(data) % (n_cols + 1):
+            raise ValueError("All the lines of a grid must have the same length")
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, n_cols + 1)
+        if (rows[:, -1] != ord("\n")).any():
+            raise ValueError("All the lines of a grid must have the same length")
+        cells = rows[:, :-1]
+        cells = cells - ord("0") if digits else cells.copy()
+        return cls(cells, digits=digits)
+
+    @classmethod
+    def from_file(cls, path: Path, digits: bool = False) -> Grid:
+        """
+        Reshape the mapped file directly when it already ends with one newline
+        and has no carriage returns, saving a copy of the whole input.
+        """
+        with MappedFile(path) as mapped:
+            view = mapped.view
+            clean = (
+                len(view) > 1
+                and view[-1] == ord("\n")
+                and view[-2] != ord("\n")
+                and mapped.find(b"\r") == -1
+            )
+            if clean:
+                return cls._from_buffer(view, mapped.find(b"\n"), digits)
+            return cls.from_bytes(mapped.read(), digits=digits)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], digits: bool = False) -> Grid:
+        return cls.from_bytes("\n".join(lines).encode(), digits=digits)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    @property
+    def n_rows(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def n_cols(self) -> int:
+        return self.cells.shape[1]
+
+    def __getitem__(self, key):
+        return self.cells[key]
+
+    def __setitem__(self, key, value) -> None:
+        self.cells[key] = value
+
+    def __str__(self) -> str:
+        cells = self.cells + ord("0") if self.digits else self.cells
+        return "\n".join(
+            row.tobytes().decode() for row in cells.astype(np.uint8, copy=False)
+        )
+
+    def _encode(self, value: Value) -> int:
+        return (
+            int(value)
+            if self.digits
+            else ord(value) if isinstance(value, str) else value
+        )
+
+    def mask(self, *values: Value) -> np.ndarray:
+        return np.isin(self.cells, [self._encode(value) for value in values])
+
+    def positions(self, where: Union[Value, np.ndarray]) -> np.ndarray:
+        """
+        (k, 2) array of the (row, col) of the cells equal to a value or in a mask.
+        """
+        mask = where if isinstance(where, np.ndarray) else self.mask(where)
+        return np.argwhere(mask)
+
+    def find(self, value: Value) -> Optional[tuple[int, int]]:
+        flat = np.flatnonzero(self.cells == self._encode(value))
+        return self.position(int(flat[0])) if flat.size else None
+
+    def in_bounds(self, rows, cols):
+        return (0 <= rows) & (rows < self.n_rows) & (0 <= cols) & (cols < self.n_cols)
+
+    def shifted(self, d_row: int, d_col: int, fill: int = 0) -> np.ndarray:
+        """
+        Array whose cell (i, j) holds cell (i + d_row, j + d_col), fill outside the grid.
+        """
+        shifted = np.full(self.shape, fill, dtype=np.result_type(self.cells, fill))
+        rows, shifted_rows = _overlap(d_row, self.n_rows)
+        cols, shifted_cols = _overlap(d_col, self.n_cols)
+        shifted[rows, cols] = self.cells[shifted_rows, shifted_cols]
+        return shifted
+
+    def neighbour_values(self, fill: int = 0, diagonal: bool = False) -> np.ndarray:
+        """
+        (4 or 8, n_rows, n_cols) stack of the neighbours of every cell.
+        """
+        directions = NEIGHBOURS_8 if diagonal else NEIGHBOURS_4
+        return np.stack(
+            [self.shifted(d_row, d_col, fill) for d_row, d_col in directions]
+        )
+
+    def neighbours(
+        self, row: int, col: int, diagonal: bool = False
+    ) -> list[tuple[int, int]]:
+        directions = NEIGHBOURS_8 if diagonal else NEIGHBOURS_4
+        return [
+            (row + d_row, col + d_col)
+            for d_row, d_col in directions
+            if 0 <= row + d_row < self.n_rows and 0 <= col + d_col < self.n_cols
+        ]
+
+    def flat_index(self, row, col):
+        return row * self.n_cols + col
+
+    def position(self, index: int) -> tuple[int, int]:
+        return divmod(index, self.n_cols)
+
+    def edges(
+        self, passable: Optional[np.ndarray] = None, diagonal: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Flat indices (sources, targets) of every pair of adjacent cells, listed once.
+        With a passable mask, only pairs of passable cells are kept.
+        """
+        index = np.arange(self.cells.size).reshape(self.shape)
+        sources, targets = [], []
+        for d_row, d_col in _FORWARD_8 if diagonal else _FORWARD_4:
+            rows, shifted_rows = _overlap(d_row, self.n_rows)
+            cols, shifted_cols = _overlap(d_col, self.n_cols)
+            source, target = index[rows, cols], index[shifted_rows, shifted_cols]
+            if passable is not None:
+                keep = passable[rows, cols] & passable[shifted_rows, shifted_cols]
+                source, target = source[keep], target[keep]
+            sources.append(source.ravel())
+            targets.append(target.ravel())
+        return np.concatenate(sources), np.concatenate(targets)
+
+    def to_dict(self) -> dict[tuple[int, int], int]:
+        return dict(
+            zip(
+                product(range(self.n_rows), range(self.n_cols)),
+                self.cells.ravel().tolist(),
+            )
+        )
@@ -0,0 +1,108 @@
+"""
+Import time of day modules, attributed to the modules they import.
+
+Each day module is imported in a fresh interpreter running with -X importtime,
+so every import is charged to the day that triggers it rather than to whichever
+day happened to run first. aoc_utils itself is imported beforehand and left out.
+
+    python -m aoc_utils.imports 1 24 25 --top 5
+"""
+
+from __future__ import annotations
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .runner import REPO_ROOT, Day, select_days
+
+MARKER = "aoc_utils.imports"
+DEFAULT_TOP = 10
+
+_import_line = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+_CHILD = f"""
+import sys
+from time import perf_counter
+from pathlib import Path
+from aoc_utils.runner import Day, load_module
+day = Day(sys.argv[1], 0, 0, Path(sys.argv[2]))
+print("{MARKER}", file=sys.stderr, flush=True)
+start = perf_counter()
+load_module(day)
+print("{MARKER}", perf_counter() - start, file=sys.stderr, flush=True)
+"""
+
+
+@dataclass
+class ImportTimes:
+    day: str
+    elapsed: float
+    # Cumulative seconds of each module imported directly by the day module
+    modules: list[tuple[str, float]] = field(default_factory=list)
+
+    def format(self, top: int = DEFAULT_TOP) -> str:
+        lines = [f"{self.day}: {self.elapsed * 1e3:.1f} ms"]
+        for name, elapsed in self.modules[:top]:
+            lines.append(f"  {elapsed * 1e3:>10.1f} ms  {name}")
+        return "\n".join(lines)
+
+
+def parse_import_times(day: str, stderr: str) -> ImportTimes:
+    _, day_lines, tail = stderr.split(MARKER)
+    modules = []
+    for line in day_lines.splitlines():
+        match = _import_line.match(line)
+        # Indented modules are imported by another module, already counted in it
+        if match and not match.group(3):
+            modules.append((match.group(4), int(match.group(2)) / 1e6))
+    modules.sort(key=lambda module: module[1], reverse=True)
+    return ImportTimes(day, float(tail.split()[0]), modules)
+
+
+def import_times(day: Day) -> ImportTimes:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, day.name, day.module_path],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        error = "\n".join(
+            line
+            for line in completed.stderr.splitlines()
+            if not line.startswith(("import time:", MARKER))
+        )
+        raise RuntimeError(f"Importing {day.name} failed:\n{error}")
+    return parse_import_times(day.name, completed.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "days", nargs="*", help="Days to import, e.g. 5 or 19_2021. Default: all."
+    )
+    parser.add_argument(
+        "--top", type=int, default=DEFAULT_TOP, help="Modules listed per day"
+    )
+    parser.add_argument("--root", type=Path, default=REPO_ROOT, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    results = []
+    for day in select_days(args.days, args.root):
+        try:
+            results.append(import_times(day))
+        except RuntimeError as error:
+            print(error, file=sys.stderr)
+    for result in sorted(results, key=lambda result: result.elapsed, reverse=True):
+        print(result.format(args.top))
+
+
+if __name__ == "__main__":
+    main()
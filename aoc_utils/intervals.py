@@ -0,0 +1,157 @@
+"""
+Sets of integers stored as sorted, disjoint, half-open intervals.
+
+An IntervalSet keeps its intervals as one flat sorted list of bounds,
+[start_0, end_0, start_1, end_1, ...], coalesced so that no two intervals touch.
+A value is in the set when an odd number of bounds are <= value, so membership
+is a bisect, and set operations are a single merge of two bound lists. The cost
+of every operation depends on the number of intervals, never on their length.
+
+    seeds = IntervalSet([(79, 93), (55, 68)])
+    soils = seeds.shift_pieces([(50, 98, 2), (98, 100, -48)])
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import Callable, Iterable, Iterator, Sequence
+
+
+class IntervalSet:
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()):
+        """
+        Half-open (start, end) intervals, in any order, possibly overlapping.
+        Empty intervals are ignored.
+        """
+        bounds = []
+        for start, end in sorted(
+            interval for interval in intervals if interval[0] < interval[1]
+        ):
+            if bounds and start <= bounds[-1]:
+                bounds[-1] = max(bounds[-1], end)
+            else:
+                bounds += [start, end]
+        self._bounds = bounds
+
+    @classmethod
+    def _from_bounds(cls, bounds: list[int]) -> IntervalSet:
+        interval_set = cls()
+        interval_set._bounds = bounds
+        return interval_set
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        bounds = self._bounds
+        return zip(bounds[::2], bounds[1::2])
+
+    def __len__(self) -> int:
+        """
+        Number of intervals, see size for the number of values.
+        """
+        return len(self._bounds) // 2
+
+    def __bool__(self) -> bool:
+        return bool(self._bounds)
+
+    def __contains__(self, value: int) -> bool:
+        return bisect_right(self._bounds, value) % 2 == 1
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IntervalSet) and self._bounds == other._bounds
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    @property
+    def size(self) -> int:
+        bounds = self._bounds
+        return sum(bounds[1::2]) - sum(bounds[::2])
+
+    @property
+    def min(self) -> int:
+        if not self._bounds:
+            raise ValueError("An empty set has no minimum")
+        return self._bounds[0]
+
+    @property
+    def max(self) -> int:
+        if not self._bounds:
+            raise ValueError("An empty set has no maximum")
+        return self._bounds[-1] - 1
+
+    def _combine(
+        self, other: IntervalSet, keep: Callable[[bool, bool], bool]
+    ) -> IntervalSet:
+        # Sweep over the bounds of both sets, tracking whether we are in each of them
+        first, second = self._bounds, other._bounds
+        i = j = 0
+        in_first = in_second = inside = False
+        bounds = []
+        while i < len(first) or j < len(second):
+            if j == len(second) or (i < len(first) and first[i] <= second[j]):
+                position = first[i]
+            else:
+                position = second[j]
+            if i < len(first) and first[i] == position:
+                in_first = not in_first
+                i += 1
+            if j < len(second) and second[j] == position:
+                in_second = not in_second
+                j += 1
+            if keep(in_first, in_second) != inside:
+                inside = not inside
+                bounds.append(position)
+        return self._from_bounds(bounds)
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda a, b: a or b)
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda a, b: a and b)
+
+    def difference(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda a, b: a and not b)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def clip(self, start: int, end: int) -> IntervalSet:
+        """
+        Intersection with [start, end), found by bisecting instead of merging.
+        """
+        if start >= end:
+            return IntervalSet()
+        bounds = self._bounds
+        first, last = bisect_right(bounds, start), bisect_left(bounds, end)
+        clipped = bounds[first:last]
+        if first % 2 == 1:
+            clipped.insert(0, start)
+        if last % 2 == 1:
+            clipped.append(end)
+        return self._from_bounds(clipped)
+
+    def shift(self, offset: int) -> IntervalSet:
+        return self._from_bounds([bound + offset for bound in self._bounds])
+
+    def shift_pieces(self, pieces: Sequence[tuple[int, int, int]]) -> IntervalSet:
+        """
+        Values in each (start, end, offset) piece move by offset, others stay.
+        Pieces must not overlap, the shifted intervals may and are coalesced.
+        """
+        pieces = sorted(pieces)
+        piece_starts = [start for start, _, _ in pieces]
+        shifted = []
+        for start, end in self:
+            k = max(bisect_right(piece_starts, start) - 1, 0)
+            position = start
+            while position < end:
+                if k < len(pieces) and pieces[k][1] <= position:
+                    k += 1
+                elif k < len(pieces) and pieces[k][0] <= position:
+                    piece_end, offset = min(end, pieces[k][1]), pieces[k][2]
+                    shifted.append((position + offset, piece_end + offset))
+                    position = piece_end
+                else:
+                    gap_end = end if k == len(pieces) else min(end, pieces[k][0])
+                    shifted.append((position, gap_end))
+                    position = gap_end
+        return IntervalSet(shifted)
@@ -0,0 +1,44 @@
+"""
+Lazy imports of heavy third-party modules.
+
+    sympy = lazy_import("sympy")
+
+binds a placeholder module that imports sympy on the first attribute access,
+so a day only pays for sympy when the part that needs it runs. The module is
+looked up right away, a missing dependency still fails at import time.
+"""
+
+from __future__ import annotations
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self.__dict__["_module"] = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._load(), attribute)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded yet"
+        return f"<lazy module {self.__name__!r}, {state}>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    if (module := sys.modules.get(name)) is not None:
+        return module
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return LazyModule(name)
@@ -0,0 +1,120 @@
+"""
+Memory-mapped inputs, read without decoding or copying the whole file.
+
+    with MappedFile(path) as mapped:
+        sequences = [integers(line) for line in mapped.lines()]
+
+Lines are memoryviews of the mapping, bytes-like objects that re, int lists
+from integers and numpy.frombuffer read directly; bytes(line) copies one when a
+parser needs str methods. Views must not be used once the file is closed.
+
+For parallel parsing, chunks splits the file into ranges that end right after a
+newline. A worker maps the file again and parses its range, mappings are shared
+by the operating system rather than pickled:
+
+    def parse_chunk(path, start, end):
+        with MappedFile(path) as mapped:
+            return [integers(line) for line in mapped.lines(start, end)]
+"""
+
+from __future__ import annotations
+import mmap
+import re
+from pathlib import Path
+from typing import Iterator, Optional
+
+_integer = re.compile(rb"-?\d+")
+
+
+def integers(buffer) -> list[int]:
+    """
+    The integers written in a bytes-like object, signs included.
+    """
+    return [int(match) for match in _integer.findall(buffer)]
+
+
+class MappedFile:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._mmap: Optional[mmap.mmap] = None
+        with open(self.path, "rb") as fin:
+            # Empty files cannot be mapped
+            if self.path.stat().st_size > 0:
+                self._mmap = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap if self._mmap is not None else b"")
+
+    def __enter__(self) -> MappedFile:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self.close()
+        except BufferError:
+            # The traceback may hold views of the file, the error matters more
+            if exc_type is None:
+                raise
+
+    def close(self) -> None:
+        """
+        Fails with BufferError while views of the file are still referenced.
+        """
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    @property
+    def view(self) -> memoryview:
+        return self._view
+
+    def read(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        """
+        A copy of the range, for parsers that need bytes or str.
+        """
+        return self._view[start:end].tobytes()
+
+    def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        if self._mmap is None:
+            return -1
+        return self._mmap.find(sub, start, len(self) if end is None else end)
+
+    def lines(
+        self, start: int = 0, end: Optional[int] = None, keepends: bool = False
+    ) -> Iterator[memoryview]:
+        """
+        The lines within [start, end), without newlines unless keepends. A last
+        line without a newline is included, an empty last line is not.
+        """
+        end = len(self) if end is None else end
+        view = self._view
+        while start < end:
+            newline = self.find(b"\n", start, end)
+            line_end = end if newline == -1 else newline
+            next_start = line_end + 1
+            if keepends and newline != -1:
+                line_end = next_start
+            elif line_end > start and view[line_end - 1] == ord("\r"):
+                line_end -= 1
+            yield view[start:line_end]
+            start = next_start
+
+    def chunks(self, n_chunks: int) -> list[tuple[int, int]]:
+        """
+        At most n_chunks (start, end) ranges covering the file, each ending right
+        after a newline or at the end of the file, so no line is split.
+        """
+        if n_chunks < 1:
+            raise ValueError("At least one chunk is needed")
+        size = len(self)
+        ranges = []
+        start = 0
+        for i in range(1, n_chunks + 1):
+            if start >= size:
+                break
+            newline = self.find(b"\n", max(size * i // n_chunks - 1, start))
+            end = size if newline == -1 or i == n_chunks else newline + 1
+            ranges.append((start, end))
+            start = end
+        return ranges
@@ -0,0 +1,223 @@
+"""
+Memoization with statistics, bounds and explicit scopes.
+
+    @memoize(max_entries=2**14)
+    def count(symbols: str, numbers: tuple[int, ...]) -> int:
+        ...
+
+works like functools.lru_cache, evicting the least recently used entries once
+the cache holds more than max_entries values, or more than max_bytes. Sizing
+every entry would cost more than most memoized calls, so one entry in
+SIZE_SAMPLE_INTERVAL is measured with approximate_size and the cache is assumed
+to hold entries of the average measured size. Without bounds, nothing is evicted.
+
+Every memoized function counts its hits, misses and evictions, and tracks the
+largest number of entries and bytes it held. The runner solves each part inside
+run_scope: caches start empty, and when the part ends their statistics are added
+to the part span as counters and gauges, so --report shows them next to the
+timings. The peak sizes are the data to choose bounds from.
+
+Within a part, count.scope() empties the cache when the block ends, e.g. after
+each record when entries are never shared between records.
+"""
+
+from __future__ import annotations
+import sys
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import update_wrapper
+from typing import Callable, Iterator, Optional
+
+from .counters import count, gauge
+
+SIZE_SAMPLE_INTERVAL = 64
+
+_memos: weakref.WeakSet[Memo] = weakref.WeakSet()
+_MISSING = object()
+# Separates positional from keyword arguments in keys, like functools._make_key
+_KWARGS_MARK = object()
+
+
+def approximate_size(value: object) -> int:
+    """
+    Bytes held by value and the containers and strings it holds.
+    Shared objects are counted each time they appear.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list, set, frozenset)):
+        size += sum(approximate_size(item) for item in value)
+    elif isinstance(value, dict):
+        size += sum(
+            approximate_size(key) + approximate_size(item)
+            for key, item in value.items()
+        )
+    return size
+
+
+@dataclass
+class MemoStats:
+    name: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    peak_entries: int = 0
+    peak_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.hits} hits, {self.misses} misses "
+            f"({self.hit_rate:.1%}), {self.evictions} evictions, "
+            f"peak {self.peak_entries} entries, {self.peak_bytes / 2**20:.2f} MiB"
+        )
+
+
+class Memo:
+    def __init__(
+        self,
+        function: Callable,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        name: Optional[str] = None,
+    ):
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        update_wrapper(self, function)
+        self._function = function
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.name = name or function.__qualname__
+        self._entries: OrderedDict = OrderedDict()
+        # Sizes of the sampled entries
+        self._sampled_bytes = 0
+        self._samples = 0
+        self._stats = MemoStats(self.name)
+        _memos.add(self)
+
+    def __call__(self, *args, **kwargs):
+        key = args + (_KWARGS_MARK, *sorted(kwargs.items())) if kwargs else args
+        entries = self._entries
+        value = entries.get(key, _MISSING)
+        stats = self._stats
+        if value is not _MISSING:
+            entries.move_to_end(key)
+            stats.hits += 1
+            return value
+        value = self._function(*args, **kwargs)
+        if stats.misses % SIZE_SAMPLE_INTERVAL == 0:
+            self._sampled_bytes += approximate_size(key) + approximate_size(value)
+            self._samples += 1
+        stats.misses += 1
+        entries[key] = value
+        if self.max_entries is not None or self.max_bytes is not None:
+            self._evict()
+        if len(entries) > stats.peak_entries:
+            stats.peak_entries = len(entries)
+        return value
+
+    def __get__(self, instance, owner=None):
+        # Memoized methods get the instance as their first argument, like lru_cache
+        if instance is None:
+            return self
+        return lambda *args, **kwargs: self(instance, *args, **kwargs)
+
+    def _evict(self) -> None:
+        entries = self._entries
+        limit = len(entries)
+        if self.max_entries is not None:
+            limit = min(limit, self.max_entries)
+        if self.max_bytes is not None:
+            limit = min(limit, max(self.max_bytes // max(self.entry_size, 1), 1))
+        while len(entries) > limit:
+            entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def entry_size(self) -> int:
+        """
+        Average size of the sampled entries.
+        """
+        return self._sampled_bytes // self._samples if self._samples else 0
+
+    @property
+    def bytes(self) -> int:
+        return len(self._entries) * self.entry_size
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> MemoStats:
+        stats = self._stats
+        return MemoStats(
+            stats.name,
+            stats.hits,
+            stats.misses,
+            stats.evictions,
+            stats.peak_entries,
+            stats.peak_entries * self.entry_size,
+        )
+
+    def reset_stats(self) -> None:
+        self._stats = MemoStats(self.name)
+        self._sampled_bytes = self._samples = 0
+
+    @contextmanager
+    def scope(self) -> Iterator[Memo]:
+        """
+        Empty the cache when the block ends, statistics are kept.
+        """
+        try:
+            yield self
+        finally:
+            self.clear()
+
+
+def memoize(
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    name: Optional[str] = None,
+) -> Callable[[Callable], Memo]:
+    """
+    Arguments must be hashable, keyword arguments are part of the key.
+    """
+
+    def decorator(function: Callable) -> Memo:
+        return Memo(function, max_entries, max_bytes, name)
+
+    return decorator
+
+
+@contextmanager
+def run_scope() -> Iterator[None]:
+    """
+    Start every memoized function empty and with fresh statistics, and add the
+    statistics of those that were called to the current span when the block ends.
+    """
+    for memo in list(_memos):
+        memo.clear()
+        memo.reset_stats()
+    try:
+        yield
+    finally:
+        # Including those created within the block
+        for memo in list(_memos):
+            stats = memo.stats()
+            memo.clear()
+            if not stats.hits and not stats.misses:
+                continue
+            prefix = f"memo.{stats.name}"
+            for counter in ("hits", "misses", "evictions"):
+                count(f"{prefix}.{counter}", getattr(stats, counter))
+            for peak in ("peak_entries", "peak_bytes"):
+                gauge(f"{prefix}.{peak}", getattr(stats, peak))
@@ -0,0 +1,122 @@
+"""
+Opt-in tracemalloc tracking of timed blocks.
+
+A tracked block reports the peak of traced memory and its top allocation sites.
+The sites come from a snapshot close to the peak: a background thread polls the
+traced memory and snapshots it every time it grew by GROWTH since the previous
+snapshot. Tracing slows allocations down, keep it off when measuring time.
+A block tracked inside another tracked block is covered by the outer one only.
+
+Set AOC_TRACE_MEMORY=1 to track every part run by the runner and
+AOC_TRACE_MEMORY_TOP for the number of sites printed.
+"""
+
+from __future__ import annotations
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+ENABLED_VARIABLE = "AOC_TRACE_MEMORY"
+TOP_VARIABLE = "AOC_TRACE_MEMORY_TOP"
+DEFAULT_TOP = 10
+POLL_INTERVAL = 0.01
+GROWTH = 1.5
+
+_active = False
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENABLED_VARIABLE, "0") == "1"
+
+
+def set_enabled(enabled: bool, top: Optional[int] = None) -> None:
+    # Through the environment, so that worker processes inherit it
+    os.environ[ENABLED_VARIABLE] = "1" if enabled else "0"
+    if top is not None:
+        os.environ[TOP_VARIABLE] = str(top)
+
+
+def top_sites() -> int:
+    return int(os.environ.get(TOP_VARIABLE, DEFAULT_TOP))
+
+
+def format_size(size: int) -> str:
+    return f"{size / 2**20:.2f} MiB"
+
+
+@dataclass
+class MemoryUsage:
+    peak: int = 0
+    sites: list[tuple[str, int]] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        lines = [f"Peak traced memory: {format_size(self.peak)}"]
+        lines += [f"  {format_size(size):>12}  {site}" for site, size in self.sites]
+        return "\n".join(lines)
+
+
+class _PeakSnapshots(threading.Thread):
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._size = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(POLL_INTERVAL):
+            self.take_if_grown()
+
+    def take_if_grown(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._size * GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self._size = current
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def allocation_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[tuple[str, int]]:
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    return [
+        (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size)
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+
+@contextmanager
+def traced(label: str) -> Iterator[Optional[MemoryUsage]]:
+    """
+    Yields the MemoryUsage of the block, filled in when the block exits.
+    """
+    global _active
+    if _active or tracemalloc.is_tracing():
+        yield None
+        return
+    usage = MemoryUsage()
+    _active = True
+    tracemalloc.start()
+    watcher = _PeakSnapshots()
+    watcher.start()
+    try:
+        yield usage
+    finally:
+        watcher.stop()
+        watcher.take_if_grown()
+        usage.peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        _active = False
+        if watcher.snapshot is not None:
+            usage.sites = allocation_sites(watcher.snapshot, top_sites())
+        print(f"Memory of {label}")
+        print(usage)
@@ -0,0 +1,156 @@
+"""
+Points as named tuples with arithmetic.
+
+Frozen dataclasses are slow to create, every field goes through
+object.__setattr__, and their hash is a Python method building a tuple. Point2
+and Point3 are tuples: they hash and compare in C and arithmetic builds the
+result with tuple.__new__, skipping the Python __new__ of named tuples. They
+compare equal to plain tuples, which can stand in for them as offsets:
+
+    Point2(3, 4) + (0, 1) == Point2(3, 5)
+
++ and - are elementwise, not concatenation. Solver states with more fields are
+best declared the same way, as typing.NamedTuple classes.
+
+Reading a field by name is slower than reading a dataclass attribute. Loops that
+mostly read coordinates, like the brick overlaps of day22, gain nothing.
+
+    python -m aoc_utils.points
+
+compares them with frozen and slotted dataclasses.
+"""
+
+from __future__ import annotations
+import argparse
+import timeit
+from dataclasses import dataclass
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+_new = tuple.__new__
+
+OFFSETS_4 = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+
+class Point2(NamedTuple):
+    y: int
+    x: int
+
+    def __add__(self, other: Sequence[int]) -> Point2:
+        return _new(Point2, (self[0] + other[0], self[1] + other[1]))
+
+    def __sub__(self, other: Sequence[int]) -> Point2:
+        return _new(Point2, (self[0] - other[0], self[1] - other[1]))
+
+    def __neg__(self) -> Point2:
+        return _new(Point2, (-self[0], -self[1]))
+
+    def __mul__(self, factor: int) -> Point2:
+        return _new(Point2, (self[0] * factor, self[1] * factor))
+
+    def manhattan(self, other: Sequence[int] = (0, 0)) -> int:
+        return abs(self[0] - other[0]) + abs(self[1] - other[1])
+
+    def neighbours(self) -> Iterator[Point2]:
+        y, x = self
+        for dy, dx in OFFSETS_4:
+            yield _new(Point2, (y + dy, x + dx))
+
+
+class Point3(NamedTuple):
+    x: int
+    y: int
+    z: int
+
+    def __add__(self, other: Sequence[int]) -> Point3:
+        return _new(
+            Point3, (self[0] + other[0], self[1] + other[1], self[2] + other[2])
+        )
+
+    def __sub__(self, other: Sequence[int]) -> Point3:
+        return _new(
+            Point3, (self[0] - other[0], self[1] - other[1], self[2] - other[2])
+        )
+
+    def __neg__(self) -> Point3:
+        return _new(Point3, (-self[0], -self[1], -self[2]))
+
+    def __mul__(self, factor: int) -> Point3:
+        return _new(Point3, (self[0] * factor, self[1] * factor, self[2] * factor))
+
+    def manhattan(self, other: Sequence[int] = (0, 0, 0)) -> int:
+        return (
+            abs(self[0] - other[0]) + abs(self[1] - other[1]) + abs(self[2] - other[2])
+        )
+
+
+# What the solvers used before, for the benchmark
+@dataclass(frozen=True)
+class _FrozenPoint:
+    y: int
+    x: int
+
+    def __add__(self, other: _FrozenPoint) -> _FrozenPoint:
+        return _FrozenPoint(self.y + other.y, self.x + other.x)
+
+
+@dataclass(frozen=True, slots=True)
+class _SlottedPoint:
+    y: int
+    x: int
+
+    def __add__(self, other: _SlottedPoint) -> _SlottedPoint:
+        return _SlottedPoint(self.y + other.y, self.x + other.x)
+
+
+def benchmark(number: int = 200_000, repeat: int = 5) -> dict[str, dict[str, float]]:
+    """
+    Best time per operation, in nanoseconds, of each point type, without the
+    time of calling an empty function.
+    """
+    overhead = min(timeit.repeat(lambda: None, number=number, repeat=repeat)) / number
+    results = {}
+    for name, point_type in (
+        ("frozen dataclass", _FrozenPoint),
+        ("slotted dataclass", _SlottedPoint),
+        ("Point2", Point2),
+    ):
+        a, b = point_type(3, 4), point_type(1, 2)
+        points = [point_type(i, i + 1) for i in range(1000)]
+        statements = {
+            "create": lambda: point_type(3, 4),
+            "add": lambda: a + b,
+            "hash": lambda: hash(a),
+            "equal": lambda: a == b,
+            "read field": lambda: a.x,
+            "set of 1000": lambda: set(points),
+        }
+        results[name] = {}
+        for operation, statement in statements.items():
+            runs = number // 1000 if operation == "set of 1000" else number
+            best = min(timeit.repeat(statement, number=runs, repeat=repeat))
+            results[name][operation] = max(best / runs - overhead, 0) * 1e9
+    return results
+
+
+def format_benchmark(results: dict[str, dict[str, float]]) -> str:
+    names = list(results)
+    operations = list(results[names[0]])
+    header = f"{'ns per operation':<18}" + "".join(f"{name:>20}" for name in names)
+    lines = [header, "-" * len(header)]
+    for operation in operations:
+        lines.append(
+            f"{operation:<18}"
+            + "".join(f"{results[name][operation]:>20.1f}" for name in names)
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    print(format_benchmark(benchmark(args.number)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Opt-in cProfile capture of timed blocks.
+
+Each profiled block dumps a <label>.pstats file, loadable with pstats or snakeviz,
+and prints its top functions by cumulative time. cProfile cannot nest, a block
+profiled inside another profiled block is covered by the outer profile only.
+
+Set AOC_PROFILE=1 to profile every part run by the runner, AOC_PROFILE_DIR to
+choose where the stats are written and AOC_PROFILE_TOP for the number of lines.
+"""
+
+from __future__ import annotations
+import cProfile
+import os
+import pstats
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+ENABLED_VARIABLE = "AOC_PROFILE"
+DIRECTORY_VARIABLE = "AOC_PROFILE_DIR"
+TOP_VARIABLE = "AOC_PROFILE_TOP"
+DEFAULT_DIRECTORY = Path(__file__).resolve().parent.parent / ".aoc_profiles"
+DEFAULT_TOP = 20
+
+_active = False
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENABLED_VARIABLE, "0") == "1"
+
+
+def set_enabled(
+    enabled: bool, directory: Optional[Path] = None, top: Optional[int] = None
+) -> None:
+    # Through the environment, so that worker processes inherit it
+    os.environ[ENABLED_VARIABLE] = "1" if enabled else "0"
+    if directory is not None:
+        os.environ[DIRECTORY_VARIABLE] = str(directory)
+    if top is not None:
+        os.environ[TOP_VARIABLE] = str(top)
+
+
+def profile_directory() -> Path:
+    return Path(os.environ.get(DIRECTORY_VARIABLE, DEFAULT_DIRECTORY))
+
+
+def top_functions() -> int:
+    return int(os.environ.get(TOP_VARIABLE, DEFAULT_TOP))
+
+
+def save_and_print(profiler: cProfile.Profile, label: str) -> Path:
+    directory = profile_directory()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{label}.pstats"
+    profiler.dump_stats(path)
+    print(f"Profile of {label} saved to {path}")
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(top_functions())
+    return path
+
+
+@contextmanager
+def profiled(label: str) -> Iterator[Optional[cProfile.Profile]]:
+    global _active
+    if _active:
+        yield None
+        return
+    profiler = cProfile.Profile()
+    _active = True
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        _active = False
+        save_and_print(profiler, label)
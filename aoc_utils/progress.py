@@ -0,0 +1,166 @@
+"""
+Progress reporting cheap enough for hot loops.
+
+A progress bar only reads the clock every so many updates, adapting how many so
+that it happens a few times per interval, and only renders once per interval.
+Extra fields are given as callables, evaluated when a line is rendered rather
+than on every update. When progress is disabled, progress_bar returns a bar whose
+methods do nothing and track returns the iterable untouched. The open bars can be
+read at any time with snapshot, e.g. to tell how far a cancelled part got.
+
+Set AOC_PROGRESS=0 to disable progress everywhere, the benchmark always does.
+"""
+
+from __future__ import annotations
+import os
+import sys
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, Optional, TextIO, TypeVar
+
+ENABLED_VARIABLE = "AOC_PROGRESS"
+DEFAULT_INTERVAL = 0.2
+
+Item = TypeVar("Item")
+
+_open: list[Progress] = []
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENABLED_VARIABLE, "1") != "0"
+
+
+def set_enabled(enabled: bool) -> None:
+    # Through the environment, so that worker processes inherit it
+    os.environ[ENABLED_VARIABLE] = "1" if enabled else "0"
+
+
+class Progress:
+    def __init__(
+        self,
+        description: str = "",
+        total: Optional[int] = None,
+        interval: float = DEFAULT_INTERVAL,
+        stream: Optional[TextIO] = None,
+        **fields: Callable[[], object],
+    ):
+        self.description = description
+        self.total = total
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.fields = fields
+        self.count = 0
+        self._start = self._last_check = self._last_render = perf_counter()
+        self._check_every = 1
+        self._width = 0
+        self._countdown = 1
+        _open.append(self)
+
+    def update(self, n: int = 1) -> None:
+        self.count += n
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self._check_clock()
+
+    def _check_clock(self) -> None:
+        now = perf_counter()
+        if now - self._last_render >= self.interval:
+            self.render(now)
+        # Aim at about ten clock reads per interval
+        if now - self._last_check < self.interval / 10:
+            self._check_every *= 2
+        elif self._check_every > 1:
+            self._check_every //= 2
+        self._last_check = now
+        self._countdown = self._check_every
+
+    def status(self, now: Optional[float] = None) -> str:
+        elapsed = (perf_counter() if now is None else now) - self._start
+        count = f"{self.count}" if self.total is None else f"{self.count}/{self.total}"
+        rate = self.count / max(elapsed, 1e-9)
+        status = f"{count} [{elapsed:.1f}s, {rate:.0f}/s]"
+        if self.fields:
+            status += " " + ", ".join(
+                f"{name}={field()}" for name, field in self.fields.items()
+            )
+        return status
+
+    def render(self, now: Optional[float] = None) -> None:
+        now = perf_counter() if now is None else now
+        self._last_render = now
+        line = f"{self.description}: {self.status(now)}"
+        # Pad with spaces to hide what is left of a longer previous line
+        self.stream.write(f"\r{line:<{self._width}}")
+        self._width = len(line)
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self in _open:
+            _open.remove(self)
+        self.render()
+        self.stream.write("\n")
+        self.stream.flush()
+
+    def __enter__(self) -> Progress:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class NullProgress:
+    def update(self, n: int = 1) -> None:
+        pass
+
+    def render(self, now: Optional[float] = None) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> NullProgress:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+def snapshot() -> dict[str, str]:
+    """
+    Status of every open bar, by description.
+    """
+    return {bar.description or "progress": bar.status() for bar in _open}
+
+
+def progress_bar(
+    description: str = "",
+    total: Optional[int] = None,
+    interval: float = DEFAULT_INTERVAL,
+    **fields: Callable[[], object],
+) -> Progress | NullProgress:
+    if not is_enabled():
+        return NullProgress()
+    return Progress(description, total, interval, **fields)
+
+
+def track(
+    iterable: Iterable[Item],
+    description: str = "",
+    total: Optional[int] = None,
+    interval: float = DEFAULT_INTERVAL,
+    **fields: Callable[[], object],
+) -> Iterable[Item]:
+    """
+    Progress over the items of an iterable, the iterable itself when disabled.
+    """
+    if not is_enabled():
+        return iterable
+    if total is None and hasattr(iterable, "__len__"):
+        total = len(iterable)
+    return _tracked(iterable, Progress(description, total, interval, **fields))
+
+
+def _tracked(iterable: Iterable[Item], progress: Progress) -> Iterator[Item]:
+    with progress:
+        for item in iterable:
+            yield item
+            progress.update()
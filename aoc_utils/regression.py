@@ -0,0 +1,193 @@
+"""
+Fail when parts got slower than the medians stored in a baseline file.
+
+The baseline holds, for each day and part, the median time and the sha256 of the
+input it was measured on, and is meant to be committed next to the solvers. A
+part regressed when its median is more than --threshold slower, relative to the
+baseline, and by more than --min-difference seconds, so the noise of fast parts
+does not fail the check. Parts measured on another input are not compared.
+
+    python -m aoc_utils.regression 17 22 --update   # measure and store
+    python -m aoc_utils.regression                  # days in the baseline
+
+The exit code is 1 when a part regressed.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+from . import progress
+from .benchmark import (
+    BenchmarkResult,
+    benchmark,
+    build_parser as build_benchmark_parser,
+    check_pinned_inputs,
+    save_results,
+)
+from .runner import PARTS, REPO_ROOT, configure, select_days
+
+DEFAULT_BASELINE = REPO_ROOT / "benchmark_baseline.json"
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DIFFERENCE = 0.01
+
+# Baselines are {day: {part: {"median": seconds, "input_sha256": digest}}}
+Baseline = dict[str, dict[str, dict[str, object]]]
+
+
+@dataclass
+class Comparison:
+    day: str
+    part: int
+    median: float
+    baseline: Optional[float] = None
+    # Why the part could not be compared, if it was not
+    skipped: Optional[str] = None
+    regressed: bool = False
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if self.baseline is None or self.baseline == 0:
+            return None
+        return self.median / self.baseline
+
+    def __str__(self) -> str:
+        line = f"{self.day} part {self.part}: median {self.median:.4f} seconds"
+        if self.skipped is not None:
+            return f"{line}, {self.skipped}"
+        line += f", baseline {self.baseline:.4f} seconds"
+        if self.ratio is not None:
+            line += f" ({self.ratio:.2f}x)"
+        return f"{line}  REGRESSION" if self.regressed else line
+
+
+def load_baseline(path: Path) -> Baseline:
+    if not path.exists():
+        return {}
+    with open(path, "r") as fin:
+        return json.load(fin)
+
+
+def save_baseline(path: Path, baseline: Baseline) -> None:
+    with open(path, "w") as fout:
+        json.dump(baseline, fout, indent=2, sort_keys=True)
+        fout.write("\n")
+
+
+def update_baseline(baseline: Baseline, results: Sequence[BenchmarkResult]) -> None:
+    """
+    Replace the entries of the measured parts, keep the others.
+    """
+    for result in results:
+        baseline.setdefault(result.day, {})[str(result.part)] = {
+            "median": result.median,
+            "input_sha256": result.input_sha256,
+        }
+
+
+def compare(
+    result: BenchmarkResult,
+    baseline: Baseline,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_difference: float = DEFAULT_MIN_DIFFERENCE,
+) -> Comparison:
+    comparison = Comparison(result.day, result.part, result.median)
+    entry = baseline.get(result.day, {}).get(str(result.part))
+    if entry is None:
+        comparison.skipped = "not in the baseline"
+    elif entry["input_sha256"] != result.input_sha256:
+        comparison.skipped = "baseline measured on another input"
+    else:
+        comparison.baseline = float(entry["median"])
+        slower = result.median - comparison.baseline
+        comparison.regressed = (
+            slower > threshold * comparison.baseline and slower > min_difference
+        )
+    return comparison
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = build_benchmark_parser()
+    parser.description = __doc__.strip().splitlines()[0]
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline file, default: benchmark_baseline.json in the repository",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown that counts as a regression, 0.25 is 25%% slower",
+    )
+    parser.add_argument(
+        "--min-difference",
+        type=float,
+        default=DEFAULT_MIN_DIFFERENCE,
+        help="Slowdowns of fewer seconds are never regressions",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Store the measured medians in the baseline instead of comparing",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.repeats < 1:
+        raise ValueError("At least one repeat is needed")
+    if args.threshold < 0 or args.min_difference < 0:
+        raise ValueError("Thresholds cannot be negative")
+    configure(args)
+    progress.set_enabled(False)
+    baseline = load_baseline(args.baseline)
+    specs = args.days
+    if not specs and not args.update:
+        if not baseline:
+            raise ValueError(f"No baseline in {args.baseline}, create it with --update")
+        specs = sorted(baseline)
+    days = select_days(specs, args.root)
+    if args.pin:
+        check_pinned_inputs(args.pin, days, args.input)
+    results = list(
+        benchmark(
+            days, args.parts or tuple(PARTS), args.warmup, args.repeats, args.input
+        )
+    )
+    if args.save:
+        save_results(args.save, results)
+    if args.update:
+        update_baseline(baseline, results)
+        save_baseline(args.baseline, baseline)
+        for result in results:
+            print(
+                f"{result.day} part {result.part}: median {result.median:.4f} seconds"
+            )
+        print(f"Baseline of {len(results)} parts stored in {args.baseline}")
+        return 0
+    comparisons = [
+        compare(result, baseline, args.threshold, args.min_difference)
+        for result in results
+    ]
+    for comparison in comparisons:
+        print(comparison)
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(
+            f"{len(regressions)} of {len(comparisons)} parts are more than "
+            f"{args.threshold:.0%} slower than the baseline",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
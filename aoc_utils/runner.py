@@ -0,0 +1,529 @@
+"""
+Run the solvers of one or more days through a uniform interface.
+
+Every day folder (``day5``, ``day19_2021``, ...) holds a module exposing
+``part_one(path)`` and, usually, ``part_two(path)``. Modules are discovered by
+folder name and only imported when one of their parts is requested.
+Answers are stored on disk and reused until the module or its input change.
+
+    python -m aoc_utils 5 17 19_2021 --part 1
+    python -m aoc_utils --workers 8
+    python -m aoc_utils 8 20 23 --time-limit 60 --memory-limit 2048
+"""
+
+from __future__ import annotations
+import argparse
+import functools
+import importlib.util
+import re
+import sys
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable, ContextManager, Iterator, Optional, Sequence
+
+from . import answers, cache, memo, memory, profiling, progress, sampling
+from .budget import Budget, BudgetedRun, Outcome, wait
+from .lazy import lazy_import
+from .timers import Span, registry
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_YEAR = 2023
+PARTS = {1: "part_one", 2: "part_two"}
+PARSERS = ("parse_file", "parse_input")
+PARSE_SPAN = "parse"
+
+# Only needed with --workers, not worth its import time otherwise
+futures = lazy_import("concurrent.futures")
+
+_day_folder_pattern = re.compile(r"day(\d+)(?:_(\d{4}))?")
+
+
+@dataclass(frozen=True)
+class Day:
+    name: str
+    number: int
+    year: int
+    module_path: Path
+
+    @property
+    def input_path(self) -> Path:
+        return self.module_path.parent / "input.txt"
+
+
+@dataclass(frozen=True)
+class PartResult:
+    day: str
+    part: int
+    answer: Any
+    elapsed: float
+    parse_elapsed: float = 0.0
+    peak_memory: Optional[int] = None
+    # Set when the answer comes from the answer store
+    computed_at: Optional[str] = None
+    # Set when the part was stopped for exceeding its "time" or "memory" budget
+    exceeded: Optional[str] = None
+    stopped_in: Optional[str] = None
+    partial_progress: Optional[dict[str, str]] = None
+
+    def __str__(self) -> str:
+        if self.exceeded is not None:
+            return self._describe_exceeded()
+        description = f"{self.elapsed:2.4f} seconds"
+        if self.computed_at is not None:
+            description = f"cached, computed {self.computed_at} in {description}"
+        if self.peak_memory is not None:
+            description += f", peak {memory.format_size(self.peak_memory)}"
+        return f"{self.day} part {self.part}: {self.answer} ({description})"
+
+    def _describe_exceeded(self) -> str:
+        line = (
+            f"{self.day} part {self.part}: {self.exceeded} budget exceeded "
+            f"after {self.elapsed:2.4f} seconds"
+        )
+        if self.stopped_in:
+            line += f", in {self.stopped_in}"
+        lines = [line]
+        for description, status in (self.partial_progress or {}).items():
+            lines.append(f"  {description}: {status}")
+        return "\n".join(lines)
+
+
+def _find_module(folder: Path) -> Optional[Path]:
+    preferred = folder / f"{folder.name}.py"
+    if preferred.exists():
+        return preferred
+    modules = sorted(folder.glob("*.py"))
+    return modules[0] if modules else None
+
+
+def discover_days(root: Path = REPO_ROOT) -> dict[str, Day]:
+    """
+    Find the day folders below root, sorted by year and day, without importing them.
+    """
+    days = []
+    for folder in root.iterdir():
+        match = _day_folder_pattern.fullmatch(folder.name)
+        if not match or not folder.is_dir():
+            continue
+        if (module_path := _find_module(folder)) is None:
+            continue
+        year = int(match.group(2)) if match.group(2) else DEFAULT_YEAR
+        days.append(Day(folder.name, int(match.group(1)), year, module_path))
+    return {day.name: day for day in sorted(days, key=lambda d: (d.year, d.number))}
+
+
+def resolve_day(spec: str, days: dict[str, Day]) -> Day:
+    """
+    Accepts "5", "day5", "19_2021" or "day19_2021".
+    """
+    name = spec if spec.startswith("day") else f"day{spec}"
+    try:
+        return days[name]
+    except KeyError:
+        raise ValueError(f"Unknown day {spec}, available: {', '.join(days)}")
+
+
+def load_module(day: Day) -> ModuleType:
+    if (module := sys.modules.get(day.name)) is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(day.name, day.module_path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered before execution, dataclasses resolve their module through sys.modules
+    sys.modules[day.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.name]
+        raise
+    instrument_parsers(module)
+    return module
+
+
+def _timed_parser(parser: Callable) -> Callable:
+    @functools.wraps(parser)
+    def timed_parser(*args, **kwargs):
+        with registry.span(PARSE_SPAN):
+            return parser(*args, **kwargs)
+
+    timed_parser.is_timed = True
+    return timed_parser
+
+
+def instrument_parsers(module: ModuleType) -> None:
+    """
+    Wrap the input parser of a day in a "parse" span, to split parse from solve time.
+    Parts look the parser up in the module globals, so replacing the attribute is enough.
+    """
+    for name in PARSERS:
+        parser = getattr(module, name, None)
+        if callable(parser) and not getattr(parser, "is_timed", False):
+            setattr(module, name, _timed_parser(parser))
+
+
+def _parse_elapsed(span: Span) -> float:
+    return span.children[PARSE_SPAN].elapsed if PARSE_SPAN in span.children else 0.0
+
+
+def get_solver(day: Day, part: int) -> Optional[Callable[[Path], Any]]:
+    return getattr(load_module(day), PARTS[part], None)
+
+
+def _maybe_profiled(label: str) -> ContextManager:
+    return profiling.profiled(label) if profiling.is_enabled() else nullcontext()
+
+
+def _maybe_sampled(label: str) -> ContextManager:
+    return sampling.sampled(label) if sampling.is_enabled() else nullcontext()
+
+
+def _maybe_traced(label: str) -> ContextManager:
+    return memory.traced(label) if memory.is_enabled() else nullcontext()
+
+
+def run_part(day: Day, part: int, input_path: Optional[Path] = None) -> PartResult:
+    solver = get_solver(day, part)
+    if solver is None:
+        raise ValueError(f"{day.name} does not implement {PARTS[part]}")
+    input_path = input_path or day.input_path
+    with registry.span(day.name), registry.span(PARTS[part]) as span:
+        parse_before = _parse_elapsed(span)
+        label = f"{day.name}.{PARTS[part]}"
+        with memo.run_scope(), _maybe_profiled(label), _maybe_sampled(
+            label
+        ), _maybe_traced(label) as usage:
+            start = perf_counter()
+            answer = solver(input_path)
+            elapsed = perf_counter() - start
+        peak_memory = None
+        if usage is not None:
+            peak_memory = span.peak_memory = max(span.peak_memory, usage.peak)
+    return PartResult(
+        day.name,
+        part,
+        answer,
+        elapsed,
+        _parse_elapsed(span) - parse_before,
+        peak_memory,
+    )
+
+
+def stored_result(
+    day: Day, part: int, input_path: Optional[Path] = None
+) -> Optional[PartResult]:
+    """
+    The stored answer of a part, without importing its module.
+    Profiled or memory tracked runs always compute the answer again.
+    """
+    if (
+        not answers.is_enabled()
+        or profiling.is_enabled()
+        or sampling.is_enabled()
+        or memory.is_enabled()
+    ):
+        return None
+    input_path = input_path or day.input_path
+    if not input_path.exists():
+        return None
+    stored = answers.load(answers.answer_key(day.module_path, input_path, part))
+    if stored is None:
+        return None
+    return PartResult(
+        day.name, part, stored.answer, stored.elapsed, computed_at=stored.computed_at
+    )
+
+
+def solve_part(
+    day: Day, part: int, input_path: Optional[Path] = None
+) -> Optional[PartResult]:
+    """
+    The stored answer of a part if there is one, else run_part, storing its answer.
+    None if the day does not implement the part.
+    """
+    if (result := stored_result(day, part, input_path)) is not None:
+        return result
+    if get_solver(day, part) is None:
+        return None
+    input_path = input_path or day.input_path
+    result = run_part(day, part, input_path)
+    key = answers.answer_key(day.module_path, input_path, part)
+    answers.store(key, day.name, part, result.answer, result.elapsed)
+    return result
+
+
+def run(
+    days: Sequence[Day],
+    parts: Sequence[int] = tuple(PARTS),
+    input_path: Optional[Path] = None,
+) -> Iterator[PartResult]:
+    """
+    Run the requested parts of each day in order, skipping parts a day does not implement.
+    """
+    for day in days:
+        for part in parts:
+            if (result := solve_part(day, part, input_path)) is not None:
+                yield result
+
+
+def _run_job(
+    day: Day, part: int, input_path: Optional[Path]
+) -> Optional[tuple[PartResult, dict[str, Any]]]:
+    registry.reset()
+    if (result := solve_part(day, part, input_path)) is None:
+        return None
+    return result, registry.root.to_dict()
+
+
+def _budgeted_result(
+    day: Day, part: int, outcome: Outcome
+) -> tuple[PartResult, Optional[dict[str, Any]]]:
+    if outcome.exceeded is None:
+        return outcome.value
+    result = PartResult(
+        day.name,
+        part,
+        None,
+        outcome.elapsed,
+        exceeded=outcome.exceeded,
+        stopped_in=outcome.span,
+        partial_progress=outcome.progress,
+    )
+    return result, None
+
+
+def run_with_budgets(
+    days: Sequence[Day],
+    parts: Sequence[int] = tuple(PARTS),
+    input_path: Optional[Path] = None,
+    budget: Budget = Budget(),
+    workers: int = 1,
+) -> Iterator[PartResult]:
+    """
+    Same as run, with every part computed in its own process, stopped once it
+    exceeds the budget. Up to workers processes run at the same time, all
+    started and watched from the calling thread.
+    """
+    jobs: list[Any] = []
+    for day in days:
+        for part in parts:
+            if (result := stored_result(day, part, input_path)) is not None:
+                jobs.append(result)
+            elif get_solver(day, part) is not None:
+                jobs.append((day, part))
+    waiting = deque(i for i, job in enumerate(jobs) if isinstance(job, tuple))
+    running: dict[int, BudgetedRun] = {}
+    finished: dict[int, tuple[PartResult, Optional[dict[str, Any]]]] = {}
+    try:
+        for i, job in enumerate(jobs):
+            if isinstance(job, PartResult):
+                yield job
+                continue
+            while i not in finished:
+                while waiting and len(running) < max(workers, 1):
+                    j = waiting.popleft()
+                    day, part = jobs[j]
+                    running[j] = BudgetedRun(_run_job, (day, part, input_path), budget)
+                    running[j].start()
+                wait(list(running.values()))
+                for j, run in list(running.items()):
+                    if (outcome := run.check()) is not None:
+                        del running[j]
+                        run.close()
+                        finished[j] = _budgeted_result(*jobs[j], outcome)
+            result, spans = finished.pop(i)
+            if spans is not None:
+                registry.root.merge(Span.from_dict(spans))
+            yield result
+    finally:
+        for run in running.values():
+            run.close()
+
+
+def run_parallel(
+    days: Sequence[Day],
+    parts: Sequence[int] = tuple(PARTS),
+    input_path: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> Iterator[PartResult]:
+    """
+    Same as run, with every day/part dispatched to a pool of at most workers processes.
+    Results come back in the order of run and their spans are merged into the registry.
+    """
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        jobs = [
+            executor.submit(_run_job, day, part, input_path)
+            for day in days
+            for part in parts
+        ]
+        for job in jobs:
+            if (finished := job.result()) is None:
+                continue
+            result, spans = finished
+            registry.root.merge(Span.from_dict(spans))
+            yield result
+
+
+def add_selection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "days", nargs="*", help="Days to run, e.g. 5 or 19_2021. Default: all."
+    )
+    parser.add_argument(
+        "--part",
+        type=int,
+        choices=sorted(PARTS),
+        action="append",
+        dest="parts",
+        help="Part to run, can be repeated. Default: all parts.",
+    )
+    parser.add_argument(
+        "--input", type=Path, default=None, help="Input file overriding input.txt"
+    )
+    parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Parse inputs again instead of loading them from the parse cache",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        type=Path,
+        const=profiling.DEFAULT_DIRECTORY,
+        default=None,
+        metavar="DIR",
+        help="Profile each part with cProfile and save the .pstats files in DIR",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=profiling.DEFAULT_TOP,
+        help="Number of functions printed for each profiled part",
+    )
+    parser.add_argument(
+        "--sample",
+        nargs="?",
+        type=Path,
+        const=sampling.DEFAULT_DIRECTORY,
+        default=None,
+        metavar="DIR",
+        help="Sample the stack of each part and save collapsed stacks in DIR",
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=sampling.DEFAULT_INTERVAL,
+        metavar="SECONDS",
+        help="Time between two stack samples",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Track peak memory and top allocation sites of each part with tracemalloc",
+    )
+    parser.add_argument(
+        "--memory-top",
+        type=int,
+        default=memory.DEFAULT_TOP,
+        help="Number of allocation sites printed for each tracked part",
+    )
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="Do not print the progress of the solvers",
+    )
+    parser.add_argument("--root", type=Path, default=REPO_ROOT, help=argparse.SUPPRESS)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_selection_arguments(parser)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes running days/parts concurrently. Default: 1",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Stop each part after this wall-clock time, running it in its own process",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        default=None,
+        metavar="MIB",
+        help="Stop each part once its resident memory exceeds this, in MiB",
+    )
+    parser.add_argument(
+        "--no-answer-cache",
+        action="store_true",
+        help="Compute answers again instead of reading them from the answer store",
+    )
+    parser.add_argument(
+        "--report", action="store_true", help="Print the tree of timed spans"
+    )
+    parser.add_argument(
+        "--timings-json", type=Path, default=None, help="Export timed spans as JSON"
+    )
+    parser.add_argument(
+        "--timings-csv", type=Path, default=None, help="Export timed spans as CSV"
+    )
+    return parser
+
+
+def configure(args: argparse.Namespace) -> None:
+    if args.no_parse_cache:
+        cache.set_enabled(False)
+    if args.profile is not None:
+        profiling.set_enabled(True, args.profile, args.profile_top)
+    if args.sample is not None:
+        sampling.set_enabled(True, args.sample, args.sample_interval)
+    if args.memory:
+        memory.set_enabled(True, args.memory_top)
+    if args.no_progress:
+        progress.set_enabled(False)
+
+
+def select_days(specs: Sequence[str], root: Path = REPO_ROOT) -> list[Day]:
+    days = discover_days(root)
+    if not specs:
+        return list(days.values())
+    return [resolve_day(spec, days) for spec in specs]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    configure(args)
+    if args.no_answer_cache:
+        answers.set_enabled(False)
+    days = select_days(args.days, args.root)
+    parts = args.parts or tuple(PARTS)
+    if args.time_limit is not None or args.memory_limit is not None:
+        memory_limit = args.memory_limit and args.memory_limit * 2**20
+        budget = Budget(args.time_limit, memory_limit)
+        results = run_with_budgets(days, parts, args.input, budget, args.workers)
+    elif args.workers > 1:
+        results = run_parallel(days, parts, args.input, args.workers)
+    else:
+        results = run(days, parts, args.input)
+    for result in results:
+        print(result)
+    export_timings(args)
+
+
+def export_timings(args: argparse.Namespace) -> None:
+    if args.report:
+        print(registry.report())
+    if args.timings_json:
+        registry.to_json(args.timings_json)
+    if args.timings_csv:
+        registry.to_csv(args.timings_csv)
+
+
+if __name__ == "__main__":
+    main()
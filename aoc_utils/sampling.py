@@ -0,0 +1,219 @@
+"""
+Opt-in sampling profiler of timed blocks, writing collapsed stacks.
+
+A background thread wakes up every interval and records the Python stack of the
+thread that entered the block, from the block down to the running frame. Unlike
+cProfile, nothing runs on function calls, so recursive calls are not slowed down.
+A sample walks the stack, its cost grows with the depth: about 0.4 ms for 2000
+frames, 4% at the default interval, and far less for usual depths. Recursive
+calls of a function are stored as one frame and a count, and expanded when the
+stacks are written. A sampled thread busy in C code without releasing the GIL
+delays the sampler, those samples land on the next Python frame. The sampler
+needs the GIL, so it samples at most once per sys.getswitchinterval().
+
+Each sampled block writes <label>.folded, one "frame;frame;frame count" line per
+distinct stack, which flamegraph.pl, inferno or speedscope render directly, and
+prints the frames most often on top of the stack.
+
+Set AOC_SAMPLE=1 to sample every part run by the runner, AOC_SAMPLE_DIR to
+choose where the stacks are written and AOC_SAMPLE_INTERVAL for the seconds
+between samples.
+"""
+
+from __future__ import annotations
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Iterator, Optional
+
+ENABLED_VARIABLE = "AOC_SAMPLE"
+DIRECTORY_VARIABLE = "AOC_SAMPLE_DIR"
+INTERVAL_VARIABLE = "AOC_SAMPLE_INTERVAL"
+DEFAULT_DIRECTORY = Path(__file__).resolve().parent.parent / ".aoc_profiles"
+DEFAULT_INTERVAL = 0.01
+DEFAULT_TOP = 10
+
+_active = False
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENABLED_VARIABLE, "0") == "1"
+
+
+def set_enabled(
+    enabled: bool, directory: Optional[Path] = None, interval: Optional[float] = None
+) -> None:
+    # Through the environment, so that worker processes inherit it
+    os.environ[ENABLED_VARIABLE] = "1" if enabled else "0"
+    if directory is not None:
+        os.environ[DIRECTORY_VARIABLE] = str(directory)
+    if interval is not None:
+        if interval <= 0:
+            raise ValueError("The sampling interval must be positive")
+        os.environ[INTERVAL_VARIABLE] = str(interval)
+
+
+def sample_directory() -> Path:
+    return Path(os.environ.get(DIRECTORY_VARIABLE, DEFAULT_DIRECTORY))
+
+
+def sample_interval() -> float:
+    return float(os.environ.get(INTERVAL_VARIABLE, DEFAULT_INTERVAL))
+
+
+def frame_name(code: CodeType) -> str:
+    # Semicolons separate frames in collapsed stacks
+    name = f"{Path(code.co_filename).stem}:{code.co_qualname}:{code.co_firstlineno}"
+    return name.replace(";", ":")
+
+
+class Sampler:
+    """
+    Samples the thread entering the block, as a context manager:
+
+        with Sampler("day12.part_two") as sampler:
+            part_two(path)
+        sampler.save(directory)
+    """
+
+    def __init__(self, label: str, interval: float = DEFAULT_INTERVAL):
+        self.label = label
+        self.interval = interval
+        # Stacks as runs of (id(code), calls), outermost first
+        self._runs: Counter[tuple[tuple[int, int], ...]] = Counter()
+        # Keeps the sampled code objects, and so their ids, alive
+        self._codes: dict[int, CodeType] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id = 0
+        self._base: Optional[FrameType] = None
+
+    def start(self, base: FrameType) -> None:
+        """
+        Sample the current thread, from the frames called by base on.
+        """
+        self._thread_id = threading.get_ident()
+        self._base = base
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"sampler {self.label}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._base = None
+
+    def __enter__(self) -> Sampler:
+        self.start(sys._getframe(1))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        codes = self._codes
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            runs = []
+            previous, calls = None, 0
+            while frame is not None and frame is not self._base:
+                code = frame.f_code
+                if code is previous:
+                    calls += 1
+                else:
+                    if previous is not None:
+                        runs.append((id(previous), calls))
+                        codes[id(previous)] = previous
+                    previous, calls = code, 1
+                frame = frame.f_back
+            # Reached the bottom without the base, or the thread is waiting for
+            # this one to stop: the block just ended
+            ended = frame is None or self._stop.is_set()
+            del frame
+            if ended or previous is None:
+                continue
+            runs.append((id(previous), calls))
+            codes[id(previous)] = previous
+            runs.reverse()
+            self._runs[tuple(runs)] += 1
+
+    @property
+    def samples(self) -> int:
+        return sum(self._runs.values())
+
+    def stacks(self, merge_recursive_calls: bool = False) -> Counter[tuple[str, ...]]:
+        """
+        Number of samples of each stack of frame names, outermost first. With
+        merge_recursive_calls, a function calling itself is a single frame, which
+        keeps the flame graphs of deep recursions readable.
+        """
+        names = {key: frame_name(code) for key, code in self._codes.items()}
+        stacks = Counter()
+        for runs, count in self._runs.items():
+            stack = []
+            for key, calls in runs:
+                stack.extend([names[key]] * (1 if merge_recursive_calls else calls))
+            stacks[tuple(stack)] += count
+        return stacks
+
+    def collapsed(self, merge_recursive_calls: bool = False) -> list[str]:
+        return [
+            f"{';'.join((self.label, *stack))} {count}"
+            for stack, count in sorted(self.stacks(merge_recursive_calls).items())
+        ]
+
+    def top_frames(self, top: int = DEFAULT_TOP) -> list[tuple[str, int]]:
+        """
+        Frames by the number of samples they were running in, callees excluded.
+        """
+        leaves = Counter()
+        for runs, count in self._runs.items():
+            leaves[runs[-1][0]] += count
+        return [
+            (frame_name(self._codes[key]), count)
+            for key, count in leaves.most_common(top)
+        ]
+
+    def save(self, directory: Path, merge_recursive_calls: bool = False) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{self.label}.folded"
+        with open(path, "w") as fout:
+            for line in self.collapsed(merge_recursive_calls):
+                fout.write(line + "\n")
+        return path
+
+
+def save_and_print(sampler: Sampler) -> Path:
+    path = sampler.save(sample_directory())
+    print(f"{sampler.samples} stack samples of {sampler.label} saved to {path}")
+    for name, count in sampler.top_frames():
+        print(f"  {count / max(sampler.samples, 1):>6.1%}  {name}")
+    return path
+
+
+@contextmanager
+def sampled(label: str) -> Iterator[Optional[Sampler]]:
+    """
+    Like cProfile, sampled blocks do not nest, an inner block is covered by the
+    outer one only.
+    """
+    global _active
+    if _active:
+        yield None
+        return
+    sampler = Sampler(label, sample_interval())
+    _active = True
+    # Called through contextlib: the frame entering the with block is two up
+    sampler.start(sys._getframe(2))
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        _active = False
+        save_and_print(sampler)
@@ -0,0 +1,176 @@
+"""
+Shortest paths over integer states.
+
+States are ids in range(n_states), so distances and parents live in flat lists
+instead of dicts keyed by hashed objects, and the queue only holds ints. Solvers
+describe the graph with a neighbours function yielding (state, weight) pairs;
+StateSpace packs tuples such as (row, col, direction, steps) into such ids.
+
+dijkstra runs on a binary heap, and becomes A* with a consistent heuristic. dial
+runs on a circular bucket queue, which is cheaper when weights are small ints.
+Both count the states they expand, the states they queue and the largest queue.
+"""
+
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Callable, Iterable, Optional
+
+from .counters import count, gauge
+
+NO_PARENT = -1
+
+Neighbours = Callable[[int], Iterable[tuple[int, int]]]
+
+
+class StateSpace:
+    """
+    Mixed radix encoding of tuples of ints, value i in range(sizes[i]).
+    """
+
+    def __init__(self, *sizes: int):
+        self.sizes = sizes
+        self.size = math.prod(sizes)
+
+    def encode(self, *values: int) -> int:
+        state = 0
+        for value, size in zip(values, self.sizes):
+            state = state * size + value
+        return state
+
+    def decode(self, state: int) -> tuple[int, ...]:
+        values = []
+        for size in reversed(self.sizes):
+            state, value = divmod(state, size)
+            values.append(value)
+        return tuple(reversed(values))
+
+
+@dataclass
+class ShortestPaths:
+    distances: list[float]
+    parents: list[int]
+    # The first settled state accepted by is_target, if any
+    target: Optional[int] = None
+
+    def distance(self, state: Optional[int] = None) -> float:
+        state = self.target if state is None else state
+        if state is None:
+            raise ValueError("No path to the requested state")
+        return self.distances[state]
+
+    def path(self, state: Optional[int] = None) -> list[int]:
+        state = self.target if state is None else state
+        if state is None or self.distances[state] == math.inf:
+            raise ValueError("No path to the requested state")
+        path = [state]
+        while self.parents[path[-1]] != NO_PARENT:
+            path.append(self.parents[path[-1]])
+        return path[::-1]
+
+
+def _record_search(name: str, expanded: int, pushes: int, max_frontier: int) -> None:
+    # Counted in local variables by the searches, recorded once at the end
+    count(f"{name}.expanded", expanded)
+    count(f"{name}.pushes", pushes)
+    gauge(f"{name}.max_frontier", max_frontier)
+
+
+def dijkstra(
+    n_states: int,
+    sources: Iterable[int],
+    neighbours: Neighbours,
+    is_target: Optional[Callable[[int], bool]] = None,
+    heuristic: Optional[Callable[[int], int]] = None,
+) -> ShortestPaths:
+    """
+    Stops at the first settled state accepted by is_target, or explores everything.
+    The heuristic must be consistent, never decreasing by more than the weight
+    of an edge, for the result to be exact.
+    """
+    distances = [math.inf] * n_states
+    parents = [NO_PARENT] * n_states
+    settled = bytearray(n_states)
+    queue = []
+    for source in sources:
+        distances[source] = 0
+        heappush(queue, (heuristic(source) if heuristic else 0, source))
+    expanded = 0
+    pushes = max_frontier = len(queue)
+    target = None
+    while queue:
+        _, state = heappop(queue)
+        if settled[state]:
+            continue
+        settled[state] = 1
+        if is_target is not None and is_target(state):
+            target = state
+            break
+        expanded += 1
+        distance = distances[state]
+        for neighbour, weight in neighbours(state):
+            next_distance = distance + weight
+            if next_distance < distances[neighbour]:
+                distances[neighbour] = next_distance
+                parents[neighbour] = state
+                priority = (
+                    next_distance + heuristic(neighbour) if heuristic else next_distance
+                )
+                heappush(queue, (priority, neighbour))
+                pushes += 1
+        if len(queue) > max_frontier:
+            max_frontier = len(queue)
+    _record_search("dijkstra", expanded, pushes, max_frontier)
+    return ShortestPaths(distances, parents, target)
+
+
+def dial(
+    n_states: int,
+    sources: Iterable[int],
+    neighbours: Neighbours,
+    max_weight: int,
+    is_target: Optional[Callable[[int], bool]] = None,
+) -> ShortestPaths:
+    """
+    Dijkstra with a bucket per distance, weights must be ints in [0, max_weight].
+    Only max_weight + 1 buckets are alive at once, so they are reused circularly.
+    """
+    distances = [math.inf] * n_states
+    parents = [NO_PARENT] * n_states
+    n_buckets = max_weight + 1
+    buckets = [[] for _ in range(n_buckets)]
+    pending = 0
+    for source in sources:
+        distances[source] = 0
+        buckets[0].append(source)
+        pending += 1
+    expanded = 0
+    pushes = max_frontier = pending
+    target = None
+    distance = 0
+    while pending and target is None:
+        bucket = buckets[distance % n_buckets]
+        while bucket:
+            state = bucket.pop()
+            pending -= 1
+            if distances[state] != distance:
+                # Reached again with a shorter distance after being queued
+                continue
+            if is_target is not None and is_target(state):
+                target = state
+                break
+            expanded += 1
+            for neighbour, weight in neighbours(state):
+                next_distance = distance + weight
+                if next_distance < distances[neighbour]:
+                    distances[neighbour] = next_distance
+                    parents[neighbour] = state
+                    buckets[next_distance % n_buckets].append(neighbour)
+                    pending += 1
+                    pushes += 1
+            if pending > max_frontier:
+                max_frontier = pending
+        distance += 1
+    _record_search("dial", expanded, pushes, max_frontier)
+    return ShortestPaths(distances, parents, target)
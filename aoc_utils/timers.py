@@ -0,0 +1,171 @@
+"""
+Hierarchical timers.
+
+Spans are named and nest: a span opened while another one is active becomes its
+child. Repeated spans with the same name under the same parent are aggregated,
+so a parser called by both parts of a day shows up once per part with its number
+of calls and total time. Spans also hold named counters, summed when spans are
+merged, and gauges, of which the maximum is kept.
+"""
+
+from __future__ import annotations
+import csv
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterator
+
+
+@dataclass
+class Span:
+    name: str
+    calls: int = 0
+    elapsed: float = 0.0
+    peak_memory: int = 0
+    counters: dict[str, int] = field(default_factory=dict)
+    gauges: dict[str, int] = field(default_factory=dict)
+    children: dict[str, Span] = field(default_factory=dict)
+
+    def child(self, name: str) -> Span:
+        if name not in self.children:
+            self.children[name] = Span(name)
+        return self.children[name]
+
+    def walk(
+        self, prefix: tuple[str, ...] = ()
+    ) -> Iterator[tuple[tuple[str, ...], Span]]:
+        for child in self.children.values():
+            path = prefix + (child.name,)
+            yield path, child
+            yield from child.walk(path)
+
+    def merge(self, other: Span) -> None:
+        self.calls += other.calls
+        self.elapsed += other.elapsed
+        self.peak_memory = max(self.peak_memory, other.peak_memory)
+        for name, value in other.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+        for name, value in other.gauges.items():
+            self.gauges[name] = max(self.gauges.get(name, value), value)
+        for child in other.children.values():
+            self.child(child.name).merge(child)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "elapsed": self.elapsed,
+            "peak_memory": self.peak_memory,
+            "counters": self.counters,
+            "gauges": self.gauges,
+            "children": [child.to_dict() for child in self.children.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Span:
+        span = cls(
+            data["name"],
+            data["calls"],
+            data["elapsed"],
+            data.get("peak_memory", 0),
+            dict(data.get("counters", {})),
+            dict(data.get("gauges", {})),
+        )
+        for child in data["children"]:
+            span.children[child["name"]] = cls.from_dict(child)
+        return span
+
+
+class TimerRegistry:
+    def __init__(self):
+        self.root = Span("root")
+        self._stack = [self.root]
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        node = self._stack[-1].child(name)
+        self._stack.append(node)
+        start = perf_counter()
+        try:
+            yield node
+        finally:
+            node.elapsed += perf_counter() - start
+            node.calls += 1
+            self._stack.pop()
+
+    def current(self) -> Span:
+        return self._stack[-1]
+
+    def current_path(self) -> tuple[str, ...]:
+        return tuple(span.name for span in self._stack[1:])
+
+    def reset(self) -> None:
+        self.root = Span("root")
+        self._stack = [self.root]
+
+    def records(self) -> list[dict[str, Any]]:
+        """
+        One flat record per span, identified by its slash separated path.
+        """
+        return [
+            {
+                "path": "/".join(path),
+                "depth": len(path) - 1,
+                "calls": span.calls,
+                "elapsed": span.elapsed,
+                "peak_memory": span.peak_memory,
+                "counters": span.counters,
+                "gauges": span.gauges,
+            }
+            for path, span in self.root.walk()
+        ]
+
+    def to_json(self, path: Path) -> None:
+        with open(path, "w") as fout:
+            json.dump(
+                [child.to_dict() for child in self.root.children.values()],
+                fout,
+                indent=2,
+            )
+
+    def to_csv(self, path: Path) -> None:
+        with open(path, "w", newline="") as fout:
+            writer = csv.DictWriter(
+                fout,
+                fieldnames=[
+                    "path",
+                    "depth",
+                    "calls",
+                    "elapsed",
+                    "peak_memory",
+                    "counters",
+                    "gauges",
+                ],
+            )
+            writer.writeheader()
+            for record in self.records():
+                # One column each, as JSON objects
+                record["counters"] = json.dumps(record["counters"], sort_keys=True)
+                record["gauges"] = json.dumps(record["gauges"], sort_keys=True)
+                writer.writerow(record)
+
+    def report(self) -> str:
+        lines = []
+        for path, span in self.root.walk():
+            indent = "  " * (len(path) - 1)
+            line = (
+                f"{indent}{span.name}: {span.elapsed:2.4f} seconds ({span.calls} calls)"
+            )
+            if span.peak_memory:
+                line += f", peak {span.peak_memory / 2**20:.2f} MiB"
+            lines.append(line)
+            for name, value in sorted(span.counters.items()):
+                lines.append(f"{indent}  | {name}: {value}")
+            for name, value in sorted(span.gauges.items()):
+                lines.append(f"{indent}  | {name}: {value} (max)")
+        return "\n".join(lines)
+
+
+registry = TimerRegistry()
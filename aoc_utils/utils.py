@@ -1,9 +1,42 @@
-from contextlib import contextmanager
+import hashlib
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
 from time import perf_counter
 
+from .memory import traced
+from .profiling import profiled
+from .timers import registry
+
 
 @contextmanager
-def timing():
-    start = perf_counter()
-    yield None
-    print(f"Elapsed {perf_counter() - start:2.4f} seconds.")
+def timing(
+    name: str = "timing",
+    verbose: bool = True,
+    profile: bool = False,
+    memory: bool = False,
+):
+    """
+    Time the wrapped block as a span of the global timer registry.
+    With profile, also capture cProfile stats of the block, named after the span path.
+    With memory, also track the peak traced memory and the top allocation sites.
+    """
+    with registry.span(name) as span:
+        label = ".".join(registry.current_path())
+        with profiled(label) if profile else nullcontext(), (
+            traced(label) if memory else nullcontext()
+        ) as usage:
+            start = perf_counter()
+            yield None
+            elapsed = perf_counter() - start
+        if usage is not None:
+            span.peak_memory = max(span.peak_memory, usage.peak)
+    if verbose:
+        print(f"Elapsed {elapsed:2.4f} seconds.")
+
+
+def file_digest(path: Path, chunk_size: int = 2**20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fin:
+        while chunk := fin.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
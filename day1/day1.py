@@ -1,33 +1,43 @@
 
-import regex
 import re
+from functools import cache
 from pathlib import Path
 
-import inflect
+from aoc_utils import lazy_import, timing
 
-from aoc_utils import timing
+# Only part two needs them, and inflect alone takes seconds to import
+regex = lazy_import("regex")
+inflect = lazy_import("inflect")
 
-numbers = []
-with  open(Path(__file__).parent / 'input.txt', 'r') as fin: 
-    for line in fin.readlines():
-        vals = re.findall(r'\d', line)
-        numbers.append(int(vals[0] + vals[-1]))
-        
-print(sum(numbers))
+
+def part_one(path: Path) -> int:
+    numbers = []
+    with  open(path, 'r') as fin: 
+        for line in fin.readlines():
+            vals = re.findall(r'\d', line)
+            numbers.append(int(vals[0] + vals[-1]))
+    return sum(numbers)
 
 
 # Part 2 
-numbers = []
-mapping = {str(val): str(val) for val in range(0,10)}
-words_mapping = {inflect.engine().number_to_words(val): str(val) for val in range(0, 10)}
-mapping = mapping | words_mapping
-pattern = regex.compile(r'\d|{}'.format("|".join(words_mapping)))
-with timing():
-    with  open(Path(__file__).parent / 'input.txt', 'r') as fin: 
+digits_mapping = {str(val): str(val) for val in range(0,10)}
+
+
+@cache
+def get_words_mapping() -> dict[str, str]:
+    return {inflect.engine().number_to_words(val): str(val) for val in range(0, 10)}
+
+
+def part_two(path: Path) -> int:
+    numbers = []
+    words_mapping = get_words_mapping()
+    mapping = digits_mapping | words_mapping
+    pattern = regex.compile(r'\d|{}'.format("|".join(words_mapping)))
+    with  open(path, 'r') as fin: 
         for line in fin.readlines():
             vals = pattern.findall(line, overlapped=True)
             numbers.append(int(mapping[vals[0]] + mapping[vals[-1]]))
-    print(sum(numbers))
+    return sum(numbers)
 
 # part 2 without third party lib
 
@@ -40,11 +50,30 @@ def find_first_and_last(pattern: re.Pattern, string: str) -> tuple[str, str]:
         string = string[match.start() + 1:]
     return first, last
 
-numbers = []
-pattern = re.compile(r'\d|{}'.format("|".join(words_mapping)))
-with timing():
-    with  open(Path(__file__).parent / 'input.txt', 'r') as fin: 
+
+def part_two_without_regex(path: Path) -> int:
+    numbers = []
+    words_mapping = get_words_mapping()
+    mapping = digits_mapping | words_mapping
+    pattern = re.compile(r'\d|{}'.format("|".join(words_mapping)))
+    with  open(path, 'r') as fin: 
         for line in fin.readlines():
             vals = find_first_and_last(pattern, line)
             numbers.append(int(mapping[vals[0]] + mapping[vals[-1]]))
-print(sum(numbers))
+    return sum(numbers)
+
+
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
+
+    with timing():
+        result = part_two_without_regex(input_path)
+    print(result)
@@ -1,10 +1,9 @@
 from __future__ import annotations
-from dataclasses import dataclass
 from pathlib import Path
 import math
 from collections import deque
-from tqdm import tqdm
-from aoc_utils import timing
+from aoc_utils import progress_bar, timing, track
+from aoc_utils.points import Point2
 
 right = (0, 1)
 left = (0, -1)
@@ -18,23 +17,8 @@ moves: dict[tuple[int, int], dict[str, tuple[int, int]]] = {
     down: {"J": left, "L": right, "|": down},
 }
 
-
-@dataclass(frozen=True)
-class Coordinate:
-    y: int
-    x: int
-
-    def __add__(self, move: tuple[int, int]) -> Coordinate:
-        return Coordinate(self.y + move[0], self.x + move[1])
-
-    def __sub__(self, move: tuple[int, int]) -> Coordinate:
-        return Coordinate(self.y - move[0], self.x - move[1])
-
-    def __getitem__(self, char_map: list[str]) -> str:
-        """
-        I still have to decide if this is a good idea.
-        """
-        return char_map[self.y][self.x]
+# A tuple: created, hashed and compared in C on every step of the loop
+Coordinate = Point2
 
 
 def parse_file(path: Path) -> list[str]:
@@ -62,7 +46,7 @@ def navigate(lines: list[str]) -> tuple[list[list[Coordinate]], tuple[str, Coord
             if current_position == start:
                 paths.append(possible_path)
                 break
-            current_char = current_position[lines]
+            current_char = lines[current_position.y][current_position.x]
             current_direction = moves[current_direction].get(current_char, None)
             if not current_direction:
                 break
@@ -105,11 +89,6 @@ def part_one(path: Path):
     return max(math.ceil(len(path) / 2) for path in paths)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
-
 # Part 2
 
 
@@ -123,11 +102,12 @@ def expand_map(lines: list[str], path: list[Coordinate]) -> list[str]:
         "L": [".x.", ".xx", "..."],
         ".": ["..."] * 3,
     }
+    on_path = set(path)
     all_lines_expansion = []
-    for i, line in tqdm(enumerate(lines)):
+    for i, line in track(enumerate(lines), "expand_map", total=len(lines)):
         line_expansion = ["", "", ""]
         for j, char in enumerate(line.strip()):
-            if Coordinate(y=i, x=j) in path:
+            if (i, j) in on_path:
                 extended_tile = mappings[char]
                 for k in range(len(line_expansion)):
                     line_expansion[k] += extended_tile[k]
@@ -146,29 +126,27 @@ def explore(extended_map: list[str]) -> set[tuple[int, int]]:
     assert extended_map[0][0] != "x"
     seen = set()
     reachable_from_outside = set()
-    pbar = tqdm()
-    while to_explore:
-        pbar.set_postfix(
-            {
-                "seen": len(seen),
-                "reachable_from_outside": len(reachable_from_outside),
-                "to_explore": len(to_explore),
-            }
-        )
-        node = to_explore.popleft()
-        if node in seen:
-            continue
-        seen.add(node)
-        is_center = ((node[0] - 1) % 3 == 0) & ((node[1] - 1) % 3 == 0)
-        if is_center:
-            reachable_from_outside.add(node)
-        for move in moves:
-            next_node = (node[0] + move[0], node[1] + move[1])
-            if 0 <= next_node[0] < n_lines and 0 <= next_node[1] < line_length:
-                char = extended_map[next_node[0]][next_node[1]]
-                if char != "x" and next_node not in seen:
-                    to_explore.append(next_node)
-
+    with progress_bar(
+        "explore",
+        seen=lambda: len(seen),
+        reachable_from_outside=lambda: len(reachable_from_outside),
+        to_explore=lambda: len(to_explore),
+    ) as pbar:
+        while to_explore:
+            pbar.update()
+            node = to_explore.popleft()
+            if node in seen:
+                continue
+            seen.add(node)
+            is_center = ((node[0] - 1) % 3 == 0) & ((node[1] - 1) % 3 == 0)
+            if is_center:
+                reachable_from_outside.add(node)
+            for move in moves:
+                next_node = (node[0] + move[0], node[1] + move[1])
+                if 0 <= next_node[0] < n_lines and 0 <= next_node[1] < line_length:
+                    char = extended_map[next_node[0]][next_node[1]]
+                    if char != "x" and next_node not in seen:
+                        to_explore.append(next_node)
     return reachable_from_outside
 
 
@@ -182,6 +160,13 @@ def part_two(path: Path) -> int:
     return total_tiles - len(reachable_from_outside) - len(paths[0])
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
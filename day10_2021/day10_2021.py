@@ -43,10 +43,6 @@ def part_one(path: Path) -> int:
     return sum(values.get(entry, 0) for entry in faulty)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 completion_values = {">": 4, "}": 3, "]": 2, ")": 1}
@@ -76,6 +72,13 @@ def part_two(path: Path) -> int:
     return all_values[len(all_values) // 2]
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -57,11 +57,6 @@ def part_one(path: Path) -> int:
     return sum([gal1 - gal2 for gal1, gal2 in combinations(galaxies, 2)])
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
-
 # part 2
 
 
@@ -71,6 +66,13 @@ def part_two(path: Path) -> int:
     return sum([gal1 - gal2 for gal1, gal2 in combinations(galaxies, 2)])
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
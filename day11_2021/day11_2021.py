@@ -1,10 +1,10 @@
 from itertools import product
 from pathlib import Path
-from tqdm import tqdm
 
-from aoc_utils import timing
+from aoc_utils import cached_parser, timing, track
 
 
+@cached_parser(version=1)
 def parse_file(path: Path) -> dict[tuple[int, int], int]:
     energy_levels = dict()
     with open(path, "r") as fin:
@@ -61,16 +61,12 @@ def part_one(path: Path) -> int:
     energy_levels = parse_file(path)
     octopus_map = DumboOctopusMap(zip(energy_levels.keys(), energy_levels.values()))
     total = 0
-    for _ in tqdm(range(100)):
+    for _ in track(range(100), "steps"):
         flashes = octopus_map.do_one_step()
         total += len(flashes)
     return total
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -83,6 +79,13 @@ def part_two(path: Path) -> int:
             return octopus_map.steps
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -1,8 +1,6 @@
 from pathlib import Path
 import re
-from functools import lru_cache
-from tqdm import tqdm
-from aoc_utils import timing
+from aoc_utils import memoize, timing, track
 
 PATTERN = re.compile(r"(\#+)")
 
@@ -17,7 +15,7 @@ def parse_file(path: Path) -> list[tuple[str, list[int]]]:
     return records
 
 
-@lru_cache(maxsize=2**12)
+@memoize()
 def find_combinations_for_line(
     symbols: str,
     numbers: tuple[int, ...],
@@ -77,16 +75,13 @@ def is_valid(line: str, numbers: list[int], currently_open: int):
 def part_one(path: Path) -> int:
     records = parse_file(path)
     total = 0
-    for symbols, numbers in tqdm(records):
-        total += len(find_combinations_for_line(symbols, numbers))
+    for symbols, numbers in track(records, "records"):
+        # Entries are specific to a record, do not let them pile up
+        with find_combinations_for_line.scope():
+            total += len(find_combinations_for_line(symbols, numbers))
     return total
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
-
 # part 2
 
 
@@ -111,7 +106,7 @@ def deal_with_hash(
     return find_combinations_efficient(symbols, numbers, cursor + 1, currently_open + 1)
 
 
-@lru_cache(maxsize=2**14)
+@memoize()
 def find_combinations_efficient(
     symbols: str, numbers: tuple[int, ...], cursor: int, currently_open: int
 ):
@@ -137,13 +132,21 @@ def find_combinations_efficient(
 def part_two(path: Path) -> int:
     records = parse_file(path)
     total = 0
-    for symbols, numbers in tqdm(records):
+    for symbols, numbers in track(records, "records"):
         symbols = "?".join([symbols] * 5)
         numbers = numbers * 5
-        total += find_combinations_efficient(symbols, numbers, 0, 0)
+        with find_combinations_efficient.scope():
+            total += find_combinations_efficient(symbols, numbers, 0, 0)
     return total
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
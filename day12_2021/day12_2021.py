@@ -52,10 +52,6 @@ def part_one(path: Path) -> int:
     return graph.find_paths()
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "example.txt")
-print(result)
-
 # Part two
 
 
@@ -64,6 +60,11 @@ def part_two(path: Path) -> int:
     return graph.find_paths(day2=True)
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    with timing():
+        result = part_one(Path(__file__).parent / "example.txt")
+    print(result)
+
+    with timing():
+        result = part_two(Path(__file__).parent / "input.txt")
+    print(result)
@@ -50,11 +50,6 @@ def part_one(path: Path) -> int:
     return sum(values)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
-
 def find_reflection_with_correction(lines: list[str]) -> Optional[int]:
     for lines_above in range(1, len(lines)):
         lines_below = len(lines) - lines_above
@@ -98,6 +93,13 @@ def part_two(path: Path) -> int:
     return sum(values)
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -95,10 +95,6 @@ def part_one(path: Path) -> int:
     return len(dots)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -110,6 +106,13 @@ def part_two(path: Path) -> int:
     return
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -2,7 +2,7 @@ from pathlib import Path
 from collections import defaultdict
 from bisect import bisect_left
 from aoc_utils import timing
-from tqdm import tqdm
+from aoc_utils.cycles import find_cycle
 
 
 def parse_file(path: Path) -> tuple[dict[int, list[int]], dict[int, list[int]]]:
@@ -67,11 +67,6 @@ def part_one(path: Path) -> int:
     return total
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
-
 # part 2
 
 
@@ -145,22 +140,12 @@ def part_two(path: Path) -> int:
     rock_positions = from_rows_to_columns(rocks_by_row)
     blocks_by_column = from_rows_to_columns(blocks_by_row)
     number_of_rows = max(max(rocks_by_row), max(blocks_by_row)) + 1
-    n_cycles = 0
-    visited_positions = {}
-    pbar = tqdm(total=total_cycles)
-    while n_cycles < total_cycles:
-        rock_positions = cycle_once(rock_positions, blocks_by_column, number_of_rows)
-        configuration_hash = make_configuration_hash(rock_positions)
-        n_cycles += 1
-        pbar.update(1)
-        pbar.set_postfix({"visited_positions": len(visited_positions)})
-        if configuration_hash not in visited_positions:
-            visited_positions[configuration_hash] = n_cycles
-        else:
-            cycle_period = n_cycles - visited_positions[configuration_hash]
-            completable_periods = (total_cycles - n_cycles) // cycle_period
-            pbar.update(completable_periods * cycle_period)
-            n_cycles += completable_periods * cycle_period
+    cycle = find_cycle(
+        rock_positions,
+        lambda rocks: cycle_once(rocks, blocks_by_column, number_of_rows),
+        fingerprint=make_configuration_key,
+    )
+    rock_positions = cycle.state_at(total_cycles)
     total = 0
     for _, rocks_on_column in rock_positions.items():
         total += sum(
@@ -169,14 +154,21 @@ def part_two(path: Path) -> int:
     return total
 
 
-def make_configuration_hash(rocks_by_column: dict[int, list[int]]) -> int:
-    rocks_by_column = tuple(
-        [(key, tuple(values)) for key, values in rocks_by_column.items()]
+def make_configuration_key(
+    rocks_by_column: dict[int, list[int]],
+) -> tuple[tuple[int, tuple[int, ...]], ...]:
+    return tuple(
+        (key, tuple(values)) for key, values in sorted(rocks_by_column.items())
     )
-    rocks_by_column = tuple(sorted(rocks_by_column))
-    return rocks_by_column.__hash__()
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -1,9 +1,8 @@
 from pathlib import Path
 import re
 from collections import Counter, defaultdict
-from tqdm import tqdm
 
-from aoc_utils import timing
+from aoc_utils import timing, track
 
 
 def evolve(
@@ -46,16 +45,12 @@ def parse_file(path: Path) -> tuple[str, dict[str, str]]:
 
 def part_one(path: Path, iterations: int = 10) -> int:
     original_string, substitutions = parse_file(path)
-    for _ in tqdm(range(iterations)):
+    for _ in track(range(iterations), "steps"):
         original_string = polymerize(original_string, substitutions)
     counts = Counter(original_string)
     return max(counts.values()) - min(counts.values())
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -79,6 +74,13 @@ def part_two(path: Path) -> int:
     return counts[0][1] - counts[-1][1]
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -17,10 +17,6 @@ def part_one(path: Path) -> int:
     return sum(map(convert_string, strings))
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # part 2
 
 
@@ -53,6 +49,13 @@ def part_two(path: Path) -> int:
     return total
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
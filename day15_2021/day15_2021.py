@@ -1,11 +1,11 @@
 from pathlib import Path
 from typing import Optional
 from typing_extensions import Self
-from heapq import heappop, heappush
 from itertools import product
 
 
-from aoc_utils import timing
+from aoc_utils import cached_parser, timing
+from aoc_utils.shortest_path import dial
 
 
 class CaveMap:
@@ -44,24 +44,38 @@ class CaveMap:
     def find_best_path_bfs(
         self, start: tuple[int, int], target: tuple[int, int], visualize: bool = False
     ) -> int:
-        queue = [(0, [start])]
-        visited = set()
-        visited.add(start)
-        while queue:
-            cost, path = heappop(queue)
-            last_visited = path[-1]
-            neighbors = self.get_neighbors(last_visited)
-            for neighbor in neighbors:
-                if neighbor == target:
-                    if visualize:
-                        self.visualize(path + [neighbor])
-                    return cost + self.values[neighbor]
-                if neighbor not in visited:
-                    next_cost = self.values[neighbor] + cost
-                    next_path = path + [neighbor]
-                    visited.add(neighbor)
-                    heappush(queue, (next_cost, next_path))
-        raise RuntimeError("Should not reach")
+        if self.min_x != 0 or self.min_y != 0:
+            raise ValueError
+        # Positions as flat indices x * n_cols + y, risks are the edge weights
+        n_rows, n_cols = self.max_x + 1, self.max_y + 1
+        risks = [self.values[(x, y)] for x, y in product(range(n_rows), range(n_cols))]
+        target_index = target[0] * n_cols + target[1]
+
+        def neighbors(index: int) -> list[tuple[int, int]]:
+            x, y = divmod(index, n_cols)
+            next_indices = []
+            if x > 0:
+                next_indices.append(index - n_cols)
+            if x < n_rows - 1:
+                next_indices.append(index + n_cols)
+            if y > 0:
+                next_indices.append(index - 1)
+            if y < n_cols - 1:
+                next_indices.append(index + 1)
+            return [(next_index, risks[next_index]) for next_index in next_indices]
+
+        paths = dial(
+            len(risks),
+            [start[0] * n_cols + start[1]],
+            neighbors,
+            max_weight=9,
+            is_target=lambda index: index == target_index,
+        )
+        if paths.target is None:
+            raise RuntimeError("Should not reach")
+        if visualize:
+            self.visualize([divmod(index, n_cols) for index in paths.path()])
+        return paths.distance()
 
     def visualize(self, path: Optional[list[tuple[int, int]]] = None):
         lines = list()
@@ -77,6 +91,7 @@ class CaveMap:
         print("\n".join(lines))
 
 
+@cached_parser(version=1)
 def parse_file(path: Path) -> CaveMap:
     values = dict()
     with path.open("r") as fin:
@@ -95,10 +110,6 @@ def part_one(path: Path) -> int:
     return cost
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -113,6 +124,13 @@ def part_two(path: Path) -> int:
     return cost
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
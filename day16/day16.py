@@ -1,12 +1,10 @@
 from __future__ import annotations
 from pathlib import Path
 from collections import deque
-from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
-from tqdm import tqdm
+from typing import NamedTuple, Optional
 
-from aoc_utils import timing
+from aoc_utils import progress_bar, timing
 
 
 class Direction(Enum):
@@ -39,10 +37,9 @@ direction_changes[Direction.DOWN] = {
 }
 
 
-@dataclass(frozen=True)
-class Ray:
+class Ray(NamedTuple):
     """
-    Object representing a ray.
+    Object representing a ray. A named tuple, hashed in C for the explored set.
     """
 
     y: int
@@ -133,10 +130,6 @@ def part_one(path: Path) -> int:
     return explore(layout, Ray(0, 0, Direction.RIGHT))
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -148,16 +141,25 @@ def part_two(path: Path) -> int:
         + [Ray(0, x, Direction.DOWN) for x in range(0, layout.n_cols)]
         + [Ray(layout.n_rows - 1, x, Direction.UP) for x in range(0, layout.n_cols)]
     )
-    progress_bar = tqdm(total=len(possible_starts))
     max_energy = 0
+    pbar = progress_bar(
+        "starts", total=len(possible_starts), current_max=lambda: max_energy
+    )
     for start_ray in possible_starts:
         energy = explore(layout, start_ray)
         max_energy = max([max_energy, energy])
-        progress_bar.update(1)
-        progress_bar.set_postfix({"Current max": max_energy})
+        pbar.update(1)
+    pbar.close()
     return max_energy
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
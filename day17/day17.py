@@ -1,109 +1,65 @@
 from __future__ import annotations
 from pathlib import Path
-from dataclasses import dataclass
-from tqdm import tqdm
-from heapq import heappop, heappush
-
-from aoc_utils import timing
-
-directions = {"right": (0, 1), "left": (0, -1), "up": (-1, 0), "down": (1, 0)}
-possible_directions_by_dir = {
-    "right": ["up", "down"],
-    "left": ["up", "down"],
-    "up": ["right", "left"],
-    "down": ["right", "left"],
-}
-
-
-@dataclass(frozen=True)
-class Crucible:
-    y: int
-    x: int
-    direction: str
-    steps_in_direction: int
-
-    def possible_moves(self) -> list[Crucible]:
-        possible_directions = list(possible_directions_by_dir[self.direction])
-        if self.steps_in_direction < 3:
-            possible_directions.append(self.direction)
-        return [self + possible_direction for possible_direction in possible_directions]
-
-    def coordinate(self) -> tuple[int, int]:
-        return (self.y, self.x)
-
-    def __add__(self, direction: str) -> Crucible:
-        if direction == self.direction:
-            steps = self.steps_in_direction + 1
-        else:
-            steps = 1
-        return self.__class__(
-            self.y + directions[direction][0],
-            self.x + directions[direction][1],
-            direction=direction,
-            steps_in_direction=steps,
-        )
-
-    def __lt__(self, other: Crucible) -> bool:
-        return self.coordinate() > other.coordinate()
 
+from aoc_utils import cached_parser, timing
+from aoc_utils.shortest_path import StateSpace, dial
 
-class UltraCrucible(Crucible):
-    def possible_moves(self) -> list[UltraCrucible]:
-        if self.steps_in_direction < 4:
-            possible_directions = [self.direction]
-        elif self.steps_in_direction < 10:
-            possible_directions = [self.direction] + possible_directions_by_dir[
-                self.direction
-            ]
-        else:
-            possible_directions = possible_directions_by_dir[self.direction]
-        return [self + possible_direction for possible_direction in possible_directions]
+# right, down, left, up: turning is a step of one, either way, in this list
+directions = ((0, 1), (1, 0), (0, -1), (-1, 0))
+max_heat_loss = 9
 
 
-def find_distance_bfs(
-    start_Crucible: Crucible,
+def find_distance(
     grid: tuple[tuple[int]],
     target: tuple[int, int],
-    update_every: int = 1_000,
-    steps_to_stop: int = 1,
+    min_steps: int = 0,
+    max_steps: int = 3,
 ) -> int:
-    count = 0
-    queue: list[int, Crucible] = []
+    """
+    A state is a crucible at (row, col), moving in a direction for steps steps.
+    It may turn once it has moved min_steps steps in a direction, and must
+    turn after max_steps steps. Moving costs the heat loss of the block entered.
+    """
     n_rows = len(grid)
     n_cols = set(len(row) for row in grid).pop()
-    progress_bar = tqdm(n_rows * n_cols)
-    distances = {}
-
-    def is_valid(Crucible: Crucible) -> bool:
-        return (0 <= Crucible.y < n_rows) & (0 <= Crucible.x < n_cols)
-
-    def Crucible_cost(Crucible: Crucible) -> int:
-        return grid[Crucible.y][Crucible.x]
-
-    for Crucible in start_Crucible.possible_moves():
-        if is_valid(Crucible):
-            heappush(queue, (Crucible_cost(Crucible), Crucible))
-
-    while queue:
-        count += 1
-        if count % update_every == 0:
-            progress_bar.update(update_every)
-            progress_bar.set_postfix({"queue": len(queue), "visited": len(distances)})
-        cost, Crucible = heappop(queue)
-        Crucible: Crucible
-        for next_Crucible in Crucible.possible_moves():
-            if is_valid(next_Crucible) and next_Crucible not in distances:
-                next_cost = Crucible_cost(next_Crucible)
-                distance = next_cost + cost
-                distances[next_Crucible] = distance
-                if (
-                    next_Crucible.coordinate() == target
-                    and next_Crucible.steps_in_direction >= steps_to_stop
-                ):
-                    return distance
-                heappush(queue, (distance, next_Crucible))
+    heat_loss = [cost for row in grid for cost in row]
+    states = StateSpace(n_rows, n_cols, len(directions), max_steps + 1)
+
+    def possible_moves(state: int) -> list[tuple[int, int]]:
+        row, col, direction, steps = states.decode(state)
+        moves = []
+        if steps >= min_steps:
+            moves += [((direction + 1) % 4, 1), ((direction - 1) % 4, 1)]
+        if steps < max_steps:
+            moves.append((direction, steps + 1))
+        next_states = []
+        for next_direction, next_steps in moves:
+            next_row = row + directions[next_direction][0]
+            next_col = col + directions[next_direction][1]
+            if 0 <= next_row < n_rows and 0 <= next_col < n_cols:
+                next_states.append(
+                    (
+                        states.encode(next_row, next_col, next_direction, next_steps),
+                        heat_loss[next_row * n_cols + next_col],
+                    )
+                )
+        return next_states
+
+    def is_target(state: int) -> bool:
+        row, col, _, steps = states.decode(state)
+        return (row, col) == target and steps >= min_steps
+
+    paths = dial(
+        states.size,
+        [states.encode(0, 0, 0, 0)],
+        possible_moves,
+        max_weight=max_heat_loss,
+        is_target=is_target,
+    )
+    return paths.distance()
 
 
+@cached_parser(version=1)
 def parse_file(path: Path) -> tuple[tuple[int]]:
     with open(path, "r") as fin:
         grid = tuple(
@@ -120,18 +76,8 @@ def part_one(path: Path) -> int:
     n_rows = len(grid)
     n_cols = set(len(row) for row in grid).pop()
     target = (n_rows - 1, n_cols - 1)
-    start_Crucible = Crucible(0, 0, "right", 0)
-    distance = find_distance_bfs(
-        start_Crucible,
-        grid,
-        target=target,
-    )
-    return distance
-
+    return find_distance(grid, target=target, min_steps=0, max_steps=3)
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
 
 # Part two
 
@@ -141,11 +87,16 @@ def part_two(path: Path) -> int:
     n_rows = len(grid)
     n_cols = set(len(row) for row in grid).pop()
     target = (n_rows - 1, n_cols - 1)
-    start_Crucible = UltraCrucible(0, 0, "right", 0)
-    distance = find_distance_bfs(start_Crucible, grid, target=target, steps_to_stop=4)
-    return distance
+    return find_distance(grid, target=target, min_steps=4, max_steps=10)
+
+
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
 
+    with timing():
+        result = part_one(input_path)
+    print(result)
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+    with timing():
+        result = part_two(input_path)
+    print(result)
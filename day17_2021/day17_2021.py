@@ -45,11 +45,6 @@ def part_one(path: Path) -> int:
     return find_max_distance_coverable(max_velocity)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-
-print(result)
-
 # Part two
 
 
@@ -129,6 +124,13 @@ def find_when_on_target(
     return times_to_reach_by_speed
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -122,10 +122,6 @@ def part_one(path: Path) -> int:
     return count_inside(instructions, visualize=False)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 hexa_directions = {"0": "R", "1": "D", "2": "L", "3": "U"}
@@ -162,6 +158,13 @@ def part_two(path: Path) -> int:
     return int(shoelace_formula(graph) + perimeter // 2 + 1)
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -4,12 +4,13 @@ import math
 from dataclasses import dataclass
 from typing import Optional, Literal
 import json
-from colorama import Fore, Style
-from tqdm import tqdm
 from itertools import product
 from copy import deepcopy
 
-from aoc_utils import timing
+from aoc_utils import lazy_import, timing, track
+
+# Only needed to print numbers
+colorama = lazy_import("colorama")
 
 
 class Settings:
@@ -87,13 +88,13 @@ class Node:
         if isinstance(self.left, Node) or self.left < 10:
             l = str(self.left)
         else:
-            l = f"{Fore.RED}{self.left}{Style.RESET_ALL}"
+            l = f"{colorama.Fore.RED}{self.left}{colorama.Style.RESET_ALL}"
         if isinstance(self.right, Node) or self.right < 10:
             r = str(self.right)
         else:
-            r = f"{Fore.RED}{self.right}{Style.RESET_ALL}"
+            r = f"{colorama.Fore.RED}{self.right}{colorama.Style.RESET_ALL}"
         if self.level() >= 4 and self.is_leaf():
-            return f"{Fore.GREEN}[{l}, {r}]{Style.RESET_ALL}"
+            return f"{colorama.Fore.GREEN}[{l}, {r}]{colorama.Style.RESET_ALL}"
         return f"[{l}, {r}]"
 
     @staticmethod
@@ -236,10 +237,6 @@ def part_one(path: Path) -> int:
     print(result.get_value())
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -247,7 +244,7 @@ def part_two(path: Path) -> int:
     entries = parse_file(path)
     entries = [Node.entries_to_graph(entry) for entry in entries]
     max_result = 0
-    for a, b in tqdm(product(entries, entries)):
+    for a, b in track(product(entries, entries), "pairs", total=len(entries) ** 2):
         if a is b:
             continue
         result = (deepcopy(a) + deepcopy(b)).get_value()
@@ -255,6 +252,13 @@ def part_two(path: Path) -> int:
     return max_result
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -3,10 +3,9 @@ from typing import Callable, Union
 import re
 from dataclasses import dataclass
 from collections import deque
-from tqdm import tqdm
 from functools import reduce
 
-from aoc_utils import timing
+from aoc_utils import count, gauge, progress_bar, timing
 
 pattern = re.compile(r"([a-zA-Z]+)([<>])(\d+):([a-zA-Z]+)")
 values_pattern = re.compile(r"([xmas])=(\d+)")
@@ -125,10 +124,6 @@ def part_one(path: Path) -> int:
     return total
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -154,8 +149,11 @@ def explore_combinations(workflows: dict[str, Workflow]) -> int:
             for path in workflow.split_outcomes(0)
         ]
     )
-    progress_bar = tqdm(total=4000**4)
+    pbar = progress_bar("volume", total=4000**4, queue_len=lambda: len(possible_states))
+    expanded = max_queue = 0
     while possible_states:
+        max_queue = max(max_queue, len(possible_states))
+        expanded += 1
         state = possible_states.popleft()
         if state.possible_outcome.workflow_id in "AR":
             child_states = state.possible_outcome.workflow_id
@@ -164,8 +162,7 @@ def explore_combinations(workflows: dict[str, Workflow]) -> int:
             child_states = workflow.split_outcomes(state.possible_outcome.condition_id)
         if isinstance(child_states, str) or state.possible_outcome.workflow_id in "AR":
             volume = compute_state_volume(state.ranges)
-            progress_bar.update(volume)
-            progress_bar.set_postfix({"queue len": len(possible_states)})
+            pbar.update(volume)
             if child_states == "A":
                 accepted_states.append(state)
         else:
@@ -179,9 +176,19 @@ def explore_combinations(workflows: dict[str, Workflow]) -> int:
                 for path in child_states
             ]
             possible_states.extend(next_states)
+    pbar.close()
+    count("states_expanded", expanded)
+    gauge("max_queue", max_queue)
     return sum(compute_state_volume(state.ranges) for state in accepted_states)
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -13,10 +13,6 @@ def part_one(path: Path) -> int:
     return sum([int(a > b) for a, b in zip(numbers[1:], numbers[:-1])])
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -25,6 +21,13 @@ def part_two(path: Path) -> int:
     return sum([int(a > b) for a, b in zip(numbers[3:], numbers[:-3])])
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -29,15 +29,15 @@ def is_extraction_valid(extraction_results: dict[str, int], value_limits) -> boo
     return all(value <= value_limits[key] for key, value in extraction_results.items())
 
 
-with timing():
+def part_one(path: Path) -> int:
     total = 0
     value_limits = {"red": 12, "green": 13, "blue": 14}
-    with open(Path(__file__).parent / "input.txt") as fin:
+    with open(path) as fin:
         for line in fin.readlines():
             game_id, game_result = parse_line(line)
             if is_game_valid(game_result, value_limits):
                 total += game_id
-print(total)
+    return total
 
 
 # Part two
@@ -51,10 +51,20 @@ def find_game_power(game_results: list[dict[str, int]]) -> int:
     return reduce(lambda a, b: a * b, mins.values())
 
 
-with timing():
-    with open(Path(__file__).parent / "input.txt") as fin:
-        total = sum(
+def part_two(path: Path) -> int:
+    with open(path) as fin:
+        return sum(
             map(lambda x: find_game_power(x[-1]), map(parse_line, fin.readlines()))
         )
 
-print(total)
+
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -3,11 +3,10 @@ from pathlib import Path
 from enum import Enum
 from typing import Optional
 from collections import defaultdict, deque
-from tqdm import tqdm
 from math import lcm
 
 
-from aoc_utils import timing
+from aoc_utils import timing, track
 
 
 class Pulse(Enum):
@@ -84,7 +83,7 @@ class Conjunction(Module):
 def part_one(path: Path) -> int:
     configuration = parse_file(path)
     pulses = {Pulse.low: 0, Pulse.high: 0}
-    for _ in tqdm(range(1000)):
+    for _ in track(range(1000), "button pushes"):
         pulses[Pulse.low] += 1  # This is the button
         message_queue = deque(
             [
@@ -106,10 +105,6 @@ def part_one(path: Path) -> int:
     return pulses[pulse.low] * pulses[pulse.high]
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -169,7 +164,7 @@ def part_two_trivial(path: Path) -> int:
     """
     configuration = parse_file(path)
     can_stop = False
-    for button_pushes in tqdm(range(0, 1000000)):
+    for button_pushes in track(range(0, 1000000), "button pushes"):
         if can_stop:
             break
         message_queue = deque(
@@ -195,6 +190,13 @@ def part_two_trivial(path: Path) -> int:
     return button_pushes
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
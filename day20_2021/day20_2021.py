@@ -2,9 +2,8 @@ from __future__ import annotations
 from pathlib import Path
 from collections import defaultdict
 from functools import cached_property, lru_cache
-from tqdm import tqdm
 
-from aoc_utils import timing
+from aoc_utils import timing, track
 
 
 @lru_cache(512)
@@ -131,13 +130,16 @@ def parse_file(path: Path) -> tuple[set[int], Image]:
 
 def part_one(path: Path) -> int:
     mapping, image = parse_file(path)
-    for _ in tqdm(
-        range(50)
+    for _ in track(
+        range(50), "enhance"
     ):  # For the part 1 replace with 2/home/ciro/Projects/AoC_2023/day20_2021/day20_2021.py
         image = image.enhance(mapping)
     return image.count_lights()
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
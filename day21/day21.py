@@ -24,11 +24,9 @@ https://github.com/jonathanpaulson/AdventOfCode/blob/master/2023/21.py
 
 from pathlib import Path
 from collections import deque
-from tqdm import tqdm
 from itertools import product
-from functools import lru_cache
 
-from aoc_utils import timing
+from aoc_utils import cached_parser, memoize, progress_bar, timing, track
 
 
 class MapOfTheWorld:
@@ -68,6 +66,7 @@ class MapOfTheWorld:
         ) not in self.rock_positions
 
 
+@cached_parser(version=1)
 def parse_file(path: Path, repeated: bool = False) -> MapOfTheWorld:
     with open(path, "r") as fin:
         input_text = fin.read()
@@ -86,39 +85,32 @@ def part_one(path: Path) -> int:
     return len(frontier[max_steps])
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
 def find_distances(map_of_the_world: MapOfTheWorld) -> dict[tuple[int, int], int]:
     # find distances up to a multiplier of the border
     queue = deque([(0, map_of_the_world.start_position)])
-    progress_bar = tqdm()
     distances = dict()
     grid_size = map_of_the_world.n_rows
-    while queue:
-        progress_bar.set_postfix(
-            {
-                "distances": len(distances),
-                "queue": len(queue),
-            }
-        )
-        distance, position = queue.popleft()
-        if position in distances:
-            continue
-        distances[position] = distance
-        for next_position in map_of_the_world.get_moves(position):
-            if (-grid_size <= next_position[0] < 2 * grid_size) and (
-                -grid_size <= next_position[1] < 2 * grid_size
-            ):
-                queue.append((distance + 1, next_position))
+    with progress_bar(
+        "find_distances", distances=lambda: len(distances), queue=lambda: len(queue)
+    ) as pbar:
+        while queue:
+            pbar.update()
+            distance, position = queue.popleft()
+            if position in distances:
+                continue
+            distances[position] = distance
+            for next_position in map_of_the_world.get_moves(position):
+                if (-grid_size <= next_position[0] < 2 * grid_size) and (
+                    -grid_size <= next_position[1] < 2 * grid_size
+                ):
+                    queue.append((distance + 1, next_position))
     return distances
 
 
-@lru_cache(maxsize=2**16)
+@memoize()
 def get_number_of_reachable(
     distance: int, steps: int, n_rows: int, is_corner: bool
 ) -> int:
@@ -143,10 +135,10 @@ def part_two(path: Path) -> int:
     assert map_of_the_world.n_rows == map_of_the_world.n_cols
     steps = 26501365
     parity = steps % 2
-    with timing():
+    with timing("find_distances"):
         distances = find_distances(map_of_the_world)
     total = 0
-    for elem, distance in tqdm(distances.items()):
+    for elem, distance in track(distances.items(), "reachable"):
         y_grid_id = elem[0] // n_rows
         x_grid_id = elem[1] // n_rows
         total += int(distance % 2 == parity)
@@ -156,6 +148,13 @@ def part_two(path: Path) -> int:
     return total
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -104,7 +104,7 @@ class QuantumGame:
         return winning
 
 
-def part_one() -> int:
+def part_one(path: Path) -> int:
     dice = TrivialDice()
     game = Game(4, 5)
     while (value := game.play_a_round(dice)) is None:
@@ -112,10 +112,6 @@ def part_one() -> int:
     return value
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -136,6 +132,13 @@ def part_two(path: Path) -> int:
     return max([game.winning_1, game.winning_2])
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
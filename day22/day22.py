@@ -2,7 +2,7 @@ from __future__ import annotations
 from pathlib import Path
 from dataclasses import dataclass, replace
 
-from aoc_utils import timing
+from aoc_utils import cached_parser, timing
 
 
 @dataclass(frozen=True)
@@ -30,6 +30,7 @@ class Block:
         )
 
 
+@cached_parser(version=1)
 def parse_file(path: Path) -> list[Block]:
     blocks = []
 
@@ -59,6 +60,7 @@ def move_all_blocks_to_the_ground(blocks: list[Block]) -> list[Block]:
     for block in blocks:
         lower_possible_z = 1
         # This scales like N**2, any way to make NlogN? -> yes, index blocks by start and end.
+        # Measured with aoc_utils.complexity: size**1.85 for 100 to 1600 bricks.
         for low_block in settled_blocks:
             if blocks_overlap(block, low_block):
                 lower_possible_z = max(lower_possible_z, low_block.end.z + 1)
@@ -102,10 +104,6 @@ def part_one(path: Path) -> int:
     return len(removable_blocks)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -146,6 +144,13 @@ def part_two(path: Path) -> int:
     return total
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
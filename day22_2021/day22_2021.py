@@ -5,10 +5,9 @@ import dataclasses
 import typing
 from itertools import product
 from functools import cached_property
-from tqdm import tqdm
 import bisect
 
-from aoc_utils import timing
+from aoc_utils import count, gauge, progress_bar, timing
 
 Coordinate = tuple[int, int, int]
 
@@ -136,10 +135,6 @@ def part_one(path: Path) -> int:
     return len(on_coordinates)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -225,13 +220,22 @@ def part_two(path: Path) -> int:
     cuboids = parse_file(path)
     cuboid = cuboids[0]
     on_set = set()
-    pbar = tqdm(cuboids)
-    for _, cuboid in enumerate(pbar):
+    cuboid_split = set()
+    pbar = progress_bar(
+        "cuboids",
+        total=len(cuboids),
+        cuboid_split=lambda: len(cuboid_split),
+        on_set=lambda: len(on_set),
+    )
+    splits = max_on_set = 0
+    for cuboid in cuboids:
+        pbar.update()
         new_set = set()
         cuboid_split = {cuboid}
         while on_set:
             on_set_cuboid = on_set.pop()
             if on_set_cuboid.partially_overlaps(cuboid):
+                splits += 1
                 cuboid_split, on_cuboid_set = split_in_overlapping_and_non_overlapping(
                     cuboid_split, {on_set_cuboid}
                 )
@@ -239,13 +243,6 @@ def part_two(path: Path) -> int:
             else:
                 new_set.add(on_set_cuboid)
         on_set = new_set
-        pbar.set_postfix(
-            {
-                "cuboid split": len(cuboid_split),
-                "on_set": len(on_set),
-                "cuboid_fraction": len(cuboid_split) / (len(on_set) + 1),
-            }
-        )
 
         if cuboid.status == "on":
             for sub_cuboid in cuboid_split:
@@ -257,9 +254,20 @@ def part_two(path: Path) -> int:
                     on_set.remove(cuboid_to_remove)
         else:
             raise ValueError("Status of cuboid either on or off.")
+        max_on_set = max(max_on_set, len(on_set))
+    pbar.close()
+    count("cuboid_splits", splits)
+    gauge("max_on_set", max_on_set)
     return sum([c.volume() for c in on_set])
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -1,14 +1,14 @@
 from pathlib import Path
 from collections import deque
-from tqdm import tqdm
 from itertools import product
 import math
 
-from aoc_utils import timing
+from aoc_utils import cached_parser, progress_bar, timing, track
 
 slide_moves = {">": (0, 1), "<": (0, -1), "v": (1, 0), "^": (-1, 0)}
 
 
+@cached_parser(version=1)
 def parse_file(path: Path) -> list[list[str]]:
     with open(path, "r") as fin:
         input_txt = fin.read()
@@ -51,9 +51,11 @@ def explore_all_paths(
     n_cols = len(lines[0])
     queue = deque([(start_position, set())])
     valid_paths = list()
-    progress_bar = tqdm()
-    counter = 0
+    pbar = progress_bar(
+        "paths", queue=lambda: len(queue), possible_paths=lambda: len(valid_paths)
+    )
     while queue:
+        pbar.update()
         position, path = queue.popleft()
         path = path.union({position})
         for next_position in get_possible_moves(
@@ -65,12 +67,7 @@ def explore_all_paths(
                 )
             elif next_position not in path:
                 queue.append((next_position, set(path)))
-        counter += 1
-        if counter % 1_000 == 0:
-            progress_bar.update(1_000)
-            progress_bar.set_postfix(
-                {"queue": len(queue), "possible_paths": len(valid_paths)}
-            )
+    pbar.close()
     return valid_paths
 
 
@@ -102,10 +99,6 @@ def part_one(path: Path, visualize: bool = False) -> int:
     return len(valid_paths[-1])
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -128,7 +121,7 @@ def find_point_distances(
     n_rows = len(lines)
     n_cols = len(lines[0])
     graph = {point: {} for point in points}
-    for point in tqdm(points):
+    for point in track(points, "points"):
         queue = deque([(0, point)])
         visited = {point}
         while queue:
@@ -147,16 +140,21 @@ def find_point_distances(
 
 class WithLogging:
     def __init__(self):
-        self.counter = 1
-        self.progress_bar = tqdm()
-        self.update_every = 1_000
+        # Open only during a top-level call, recursive calls share its bar
+        self.progress_bar = None
 
     def __call__(self, func):
         def wrapped_func(*args, **kwargs):
-            self.counter += 1
-            if self.counter % self.update_every == 0:
-                self.progress_bar.update(self.update_every)
-            return func(*args, **kwargs)
+            if self.progress_bar is not None:
+                self.progress_bar.update()
+                return func(*args, **kwargs)
+            self.progress_bar = progress_bar(func.__name__)
+            try:
+                self.progress_bar.update()
+                return func(*args, **kwargs)
+            finally:
+                self.progress_bar.close()
+                self.progress_bar = None
 
         return wrapped_func
 
@@ -201,6 +199,13 @@ def part_two(path: Path, visualize: bool = False) -> int:
     return distance
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
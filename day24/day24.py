@@ -2,9 +2,11 @@ from __future__ import annotations
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
-import sympy
 
-from aoc_utils import timing
+from aoc_utils import lazy_import, timing
+
+# Only part two solves the system of equations
+sympy = lazy_import("sympy")
 
 
 @dataclass
@@ -68,10 +70,6 @@ def part_one(path: Path) -> int:
     return intercepting
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -110,6 +108,13 @@ def part_two(path: Path) -> int:
     return sol[x] + sol[y] + sol[z]
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
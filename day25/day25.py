@@ -1,7 +1,11 @@
+from __future__ import annotations
 from pathlib import Path
-import networkx as nx
+import math
 
-from aoc_utils import timing
+from aoc_utils import lazy_import, timing
+from aoc_utils.disjoint_set import DisjointSet
+
+nx = lazy_import("networkx")
 
 
 def parse_file(path: Path) -> nx.Graph:
@@ -21,13 +25,14 @@ def part_one(path: Path) -> int:
     graph = parse_file(path)
     cutset = nx.minimum_edge_cut(graph)
     graph.remove_edges_from(cutset)
-    components = nx.connected_components(graph)
-    return len(components[0]) * len(components[1])
-
+    ids = {node: i for i, node in enumerate(graph)}
+    components = DisjointSet(len(ids))
+    for source, target in graph.edges():
+        components.union(ids[source], ids[target])
+    if components.n_components != 2:
+        raise ValueError(f"The cut left {components.n_components} components")
+    return math.prod(components.sizes().values())
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
 
 # Part two
 
@@ -36,6 +41,13 @@ def part_two(path: Path) -> int:
     parse_file(path)
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
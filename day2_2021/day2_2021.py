@@ -21,14 +21,8 @@ def part_one(path: Path) -> int:
     return position[0] * position[1]
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
-import numba
-
 
 def part_two(path: Path) -> int:
     commands = parse_file(path)
@@ -42,6 +36,13 @@ def part_two(path: Path) -> int:
     return position[1] * position[0]
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -41,8 +41,8 @@ def is_valid(
     return False
 
 
-with timing():
-    with open(Path(__file__).parent / "input.txt", "r") as fin:
+def part_one(path: Path) -> int:
+    with open(path, "r") as fin:
         lines = fin.readlines()
     symbols = {-1: [], len(lines): []}
     numbers: dict[int, tuple[int, int, int]] = {}
@@ -60,21 +60,18 @@ with timing():
                 symbols[line_id],
             ):
                 valid_numbers.append(number)
-print(sum(valid_numbers))
+    return sum(valid_numbers)
 
 
 # Part 2
 
-with open(Path(__file__).parent / "input.txt", "r") as fin:
-    lines = fin.readlines()
-
 
 def find_gears_on_line(line: str) -> list[int]:
     return list(map(lambda x: x[0], filter(lambda x: x[1] == "*", enumerate(line))))
 
 
-with timing():
-    with open(Path(__file__).parent / "input.txt", "r") as fin:
+def part_two(path: Path) -> int:
+    with open(path, "r") as fin:
         lines = fin.readlines()
     gears: dict[int, list[int]] = {}
     numbers: dict[int, tuple[int, int, int]] = {-1: [], len(lines): []}
@@ -94,4 +91,16 @@ with timing():
             ]
             if len(neighbors) == 2:
                 ratios.append(neighbors[0] * neighbors[1])
-print(sum(ratios))
+    return sum(ratios)
+
+
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
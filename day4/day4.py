@@ -22,10 +22,9 @@ def count_points(line: str) -> int:
     return 0
 
 
-with timing():
-    with open(Path(__file__).parent / "input.txt", "r") as fin:
-        total_points = sum(map(count_points, fin.readlines()))
-print(total_points)
+def part_one(path: Path) -> int:
+    with open(path, "r") as fin:
+        return sum(map(count_points, fin.readlines()))
 
 
 # Part 2
@@ -39,7 +38,19 @@ def count_scratchards(lines: list[str]) -> int:
     return sum(copies_owned.values())
 
 
-with timing():
-    with open(Path(__file__).parent / "input.txt", "r") as fin:
+def part_two(path: Path) -> int:
+    with open(path, "r") as fin:
         lines = fin.readlines()
-    print(count_scratchards(lines))
+    return count_scratchards(lines)
+
+
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
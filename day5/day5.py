@@ -5,6 +5,7 @@ from functools import cached_property
 import math
 from bisect import bisect_right
 from aoc_utils import timing
+from aoc_utils.intervals import IntervalSet
 
 
 @dataclass
@@ -35,6 +36,12 @@ class Mapping:
             )
         return value
 
+    def shifts(self) -> list[tuple[int, int, int]]:
+        return [
+            (entry.source, entry.source_end, entry.destination - entry.source)
+            for entry in self.entries
+        ]
+
 
 def parse_file(file_path: Path) -> tuple[list[int], dict[tuple[str, str], Mapping]]:
     mappings = dict()
@@ -103,22 +110,6 @@ class ExtendedMapping:
     def __init__(self, entries: list[MappingEntry]):
         self.sources, self.destinations = complete_entries(entries)
 
-    def get_range(self, start_and_extension: tuple[int, int]) -> list[tuple[int, int]]:
-        result = list()
-        start, extension = start_and_extension
-        first_index = current_index = bisect_right(self.sources, start) - 1
-        last_index = bisect_right(self.sources, start + extension)
-        for index in range(first_index, last_index):
-            source, destination = self.get_source_and_destination(index)
-            next_source, _ = self.get_source_and_destination(index + 1)
-            destination_start = destination + start - source
-            current_extension = min(extension, next_source - start)
-            result.append((destination_start, current_extension))
-            extension -= current_extension
-            start = next_source
-            current_index += 1
-        return result
-
     def get_source_and_destination(self, index: int):
         return self.sources[index], self.destinations[index]
 
@@ -129,10 +120,10 @@ class ExtendedMapping:
 
 
 def chain_mappings_for_range(
-    ranges: list[tuple[int, int]], mappings: dict[tuple[int, int], ExtendedMapping]
-) -> list[tuple[int, int]]:
+    ranges: IntervalSet, mappings: dict[tuple[str, str], Mapping]
+) -> IntervalSet:
     for _, mapping in mappings.items():
-        ranges = sum(map(mapping.get_range, ranges), [])
+        ranges = ranges.shift_pieces(mapping.shifts())
     return ranges
 
 
@@ -143,19 +134,22 @@ def part_one(input_path: Path) -> int:
     return min(values)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
-
 def part_two(input_path: Path) -> int:
     seeds, mappings = parse_file(input_path)
-    mappings = {key: ExtendedMapping(val.entries) for key, val in mappings.items()}
-    ranges = [(seeds[i], seeds[i + 1]) for i in range(0, len(seeds), 2)]
+    ranges = IntervalSet(
+        (seeds[i], seeds[i] + seeds[i + 1]) for i in range(0, len(seeds), 2)
+    )
     target_ranges = chain_mappings_for_range(ranges, mappings)
-    return min([target_range[0] for target_range in target_ranges])
+    return target_ranges.min
+
+
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
 
+    with timing():
+        result = part_one(input_path)
+    print(result)
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+    with timing():
+        result = part_two(input_path)
+    print(result)
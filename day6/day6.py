@@ -39,11 +39,6 @@ def part_one(path: Path):
     )
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
-
 # Part 2
 def part_two(path: Path):
     times, records = parse_input(path)
@@ -52,6 +47,13 @@ def part_two(path: Path):
     return find_number_of_states(time, record)
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
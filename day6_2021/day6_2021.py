@@ -1,7 +1,6 @@
 from pathlib import Path
-from tqdm import tqdm
 
-from aoc_utils import timing
+from aoc_utils import timing, track
 
 
 class State(list):
@@ -34,25 +33,28 @@ def parse_file(path: Path) -> list[int]:
 
 def part_one(path: Path) -> int:
     state = State(parse_file(path))
-    for _ in tqdm(range(80)):
+    for _ in track(range(80), "days"):
         state = state.next_generation()
-    print(len(state))
+    return len(state)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
 def part_two(path: Path) -> int:
     state = NonNaiveState(parse_file(path))
-    for _ in tqdm(range(256)):
+    for _ in track(range(256), "days"):
         state = state.next_generation()
     return sum(state._state.values())
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -41,10 +41,6 @@ def part_one(path: Path) -> int:
     return sum((i + 1) * card.bid for i, card in enumerate(cards))
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part 2
 
 value_mapping_with_joker = {key: val for key, val in value_mapping.items()}
@@ -83,6 +79,13 @@ def part_two(path: Path) -> int:
     return sum((i + 1) * card.bid for i, card in enumerate(cards))
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
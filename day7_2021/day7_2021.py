@@ -10,7 +10,8 @@ def parse_file(path: Path) -> list[int]:
 
 
 def part_one(path: Path) -> int:
-    # This naive algo with scale quadratically
+    # This naive algo with scale quadratically, measured with aoc_utils.complexity:
+    # size**1.86 for part one and size**2.00 for part two, from 100 to 800 crabs.
     numbers = parse_file(path)
     locations = defaultdict(int)
     for number in numbers:
@@ -22,10 +23,6 @@ def part_one(path: Path) -> int:
     return min(fuels)
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part two
 
 
@@ -44,6 +41,13 @@ def part_two(path: Path) -> int:
     return min(fuels)
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)
@@ -2,9 +2,8 @@ from __future__ import annotations
 from pathlib import Path
 from itertools import cycle
 import re
-from tqdm import tqdm
 import math
-from aoc_utils import timing
+from aoc_utils import timing, track
 
 
 def parse_file(path: Path) -> tuple[list[int], dict[str, dict[str, str]]]:
@@ -22,18 +21,13 @@ def parse_file(path: Path) -> tuple[list[int], dict[str, dict[str, str]]]:
 def part_one(path: Path) -> int:
     moves, nodes = parse_file(path)
     current_node = "AAA"
-    for i, move in tqdm(enumerate(cycle(moves))):
+    for i, move in track(enumerate(cycle(moves)), "moves"):
         if current_node == "ZZZ":
             break
         current_node = nodes[current_node][move]
     return i
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-
-print(result)
-
 # Part 2
 
 
@@ -42,7 +36,7 @@ def part_two_naive(path: Path) -> int:
     # in my case (best scenario) ~4000h, so I would have the solution in about 6 months.
     moves, nodes = parse_file(path)
     current_nodes = [node for node in nodes if node.endswith("A")]
-    for i, move in tqdm(enumerate(cycle(moves))):
+    for i, move in track(enumerate(cycle(moves)), "moves"):
         if all(node_id.endswith("Z") for node_id in current_nodes):
             break
         current_nodes = [nodes[node_id][move] for node_id in current_nodes]
@@ -68,7 +62,16 @@ def part_two_magic(path: Path) -> int:
     return math.lcm(*breaks)
 
 
-with timing():
-    result = part_two_magic(Path(__file__).parent / "input.txt")
+part_two = part_two_magic
+
+
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
 
-print(result)
+    with timing():
+        result = part_two(input_path)
+    print(result)
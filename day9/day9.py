@@ -1,11 +1,12 @@
 from pathlib import Path
 from aoc_utils import timing
+from aoc_utils.mapped import MappedFile, integers
 from functools import partial
 
 
 def parse_file(path: Path) -> list[list[int]]:
-    with open(path, "r") as fin:
-        return [[int(val) for val in line.split(" ")] for line in fin.readlines()]
+    with MappedFile(path) as mapped:
+        return [integers(line) for line in mapped.lines()]
 
 
 def diff(sequence: list[int]) -> list[int]:
@@ -36,10 +37,6 @@ def part_one(path: Path) -> int:
     return sum(map(find_next_value, sequences))
 
 
-with timing():
-    result = part_one(Path(__file__).parent / "input.txt")
-print(result)
-
 # Part 2
 
 
@@ -49,6 +46,13 @@ def part_two(path: Path) -> int:
     return sum(map(find_previous_value, sequences))
 
 
-with timing():
-    result = part_two(Path(__file__).parent / "input.txt")
-print(result)
+if __name__ == "__main__":
+    input_path = Path(__file__).parent / "input.txt"
+
+    with timing():
+        result = part_one(input_path)
+    print(result)
+
+    with timing():
+        result = part_two(input_path)
+    print(result)